@@ -0,0 +1,286 @@
+"""
+비동기 MySQL 데이터베이스 클래스 (MySQLDB와 동일한 메서드 구성)
+
+SQLAlchemy asyncio 엔진(aiomysql / aiosqlite) 위에서 동작하며,
+쿼리 로직은 MySQLDB의 것을 AsyncSession.run_sync로 그대로 재사용합니다.
+따라서 async 라우터에서 DB I/O를 기다리는 동안 이벤트 루프가 막히지 않습니다.
+"""
+import time
+from typing import List, Dict, Optional, Tuple, AsyncIterator
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import AsyncSessionLocal
+from app.db import MySQLDB
+from app.pool_stats import acquire_wait_histogram
+
+
+class AsyncMySQLDB:
+    """비동기 MySQL 데이터베이스 클래스 (MySQLDB와 호환되는 인터페이스)"""
+
+    def __init__(self, session: Optional[AsyncSession] = None):
+        self.session: AsyncSession = session if session is not None else AsyncSessionLocal()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """세션 종료 (연결을 풀에 반환)"""
+        await self.session.close()
+
+    async def _call(self, method_name: str, *args, **kwargs):
+        """MySQLDB 메서드를 비동기 세션의 동기 뷰에서 실행"""
+        def _run(sync_session):
+            return getattr(MySQLDB(sync_session), method_name)(*args, **kwargs)
+        return await self.session.run_sync(_run)
+
+    # Customers 관련 메서드
+    async def get_customers(self) -> List[Dict]:
+        """모든 고객 조회"""
+        return await self._call('get_customers')
+
+    async def list_customers(self, limit: int = None, after: str = None, sort: str = 'id', order: str = 'asc',
+                             name: str = None, nationality: str = None,
+                             fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict], Optional[str]]:
+        """고객 목록 (키셋 페이지네이션)"""
+        return await self._call('list_customers', limit, after, sort, order, name, nationality, fields)
+
+    async def get_customers_by_ids(self, customer_ids: List[str]) -> List[Dict]:
+        """여러 고객을 한 번에 조회"""
+        return await self._call('get_customers_by_ids', customer_ids)
+
+    async def get_customer(self, customer_id: str) -> Optional[Dict]:
+        """고객 조회"""
+        return await self._call('get_customer', customer_id)
+
+    async def create_customer(self, customer: Dict) -> Dict:
+        """고객 생성"""
+        return await self._call('create_customer', customer)
+
+    # Rooms 관련 메서드
+    async def get_rooms(self) -> List[Dict]:
+        """모든 객실 조회"""
+        return await self._call('get_rooms')
+
+    async def get_room(self, room_id: str) -> Optional[Dict]:
+        """객실 조회 (room_id는 room_number 또는 id)"""
+        return await self._call('get_room', room_id)
+
+    async def update_room_status(self, room_id: str, status: str):
+        """객실 상태 업데이트"""
+        return await self._call('update_room_status', room_id, status)
+
+    async def create_room(self, room: Dict) -> Dict:
+        """객실 생성"""
+        return await self._call('create_room', room)
+
+    # Booking Platforms 관련 메서드
+    async def get_platforms(self) -> List[Dict]:
+        """모든 예약 플랫폼 조회"""
+        return await self._call('get_platforms')
+
+    async def get_platform_map(self) -> Dict[str, str]:
+        """플랫폼 id -> 이름 매핑"""
+        return await self._call('get_platform_map')
+
+    async def create_platform(self, platform: Dict) -> Dict:
+        """예약 플랫폼 생성"""
+        return await self._call('create_platform', platform)
+
+    # Reservations 관련 메서드
+    async def get_reservations(self) -> List[Dict]:
+        """모든 예약 조회"""
+        return await self._call('get_reservations')
+
+    async def list_reservations(self, limit: int = None, after: str = None, sort: str = 'id', order: str = 'asc',
+                                status: str = None, start_date=None, end_date=None, room_id: str = None,
+                                platform_id: str = None, customer_id: str = None) -> Tuple[List[Dict], Optional[str]]:
+        """예약 목록 (키셋 페이지네이션, 서버 측 필터)"""
+        return await self._call('list_reservations', limit, after, sort, order, status, start_date, end_date,
+                                room_id, platform_id, customer_id)
+
+    async def list_reservation_records(self, limit: int = None, after: str = None, sort: str = 'id', order: str = 'asc',
+                                       status: str = None, start_date=None, end_date=None, room_id: str = None,
+                                       platform_id: str = None, customer_id: str = None,
+                                       fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict], Optional[str]]:
+        """예약 목록을 응답 형태(ReservationRecord)로 바로 조회"""
+        return await self._call('list_reservation_records', limit, after, sort, order, status, start_date, end_date,
+                                room_id, platform_id, customer_id, fields)
+
+    async def get_reservations_overlapping(self, start, end, statuses: Optional[List[str]] = None) -> List[Dict]:
+        """기간과 겹치는 예약 조회"""
+        return await self._call('get_reservations_overlapping', start, end, statuses)
+
+    async def get_reservations_checking_in(self, start, end, statuses: Optional[List[str]] = None) -> List[Dict]:
+        """체크인 날짜가 기간 안에 있는 예약 조회"""
+        return await self._call('get_reservations_checking_in', start, end, statuses)
+
+    async def get_reservations_checking_out(self, start, end, statuses: Optional[List[str]] = None) -> List[Dict]:
+        """체크아웃 날짜가 기간 안에 있는 예약 조회"""
+        return await self._call('get_reservations_checking_out', start, end, statuses)
+
+    async def count_reservations(self, statuses: Optional[List[str]] = None) -> int:
+        """예약 수 조회"""
+        return await self._call('count_reservations', statuses)
+
+    async def get_table_versions_etag(self, *tables: str) -> str:
+        """테이블 버전 ETag"""
+        return await self._call('get_table_versions_etag', *tables)
+
+    async def get_dashboard_snapshot(self, day, active_statuses: List[str]) -> Dict:
+        """대시보드 개요 스냅샷 (잠시 캐시)"""
+        return await self._call('get_dashboard_snapshot', day, active_statuses)
+
+    async def get_reservation(self, reservation_id: str) -> Optional[Dict]:
+        """예약 조회"""
+        return await self._call('get_reservation', reservation_id)
+
+    async def create_reservation(self, reservation: Dict) -> Dict:
+        """예약 생성"""
+        return await self._call('create_reservation', reservation)
+
+    async def update_reservation_status(self, reservation_id: str, status: str):
+        """예약 상태 업데이트"""
+        return await self._call('update_reservation_status', reservation_id, status)
+
+    async def transition_reservation(self, reservation_id: str, status: str, room_status: str = None,
+                                     allow_same_status: bool = True) -> Optional[Dict]:
+        """예약 상태 전환 (예약/객실 상태를 한 트랜잭션으로 변경)"""
+        return await self._call('transition_reservation', reservation_id, status, room_status, allow_same_status)
+
+    async def check_duplicate_reservation(self, room_id: str, check_in: str, check_out: str, exclude_id: str = None) -> bool:
+        """중복 예약 체크"""
+        return await self._call('check_duplicate_reservation', room_id, check_in, check_out, exclude_id)
+
+    async def search_available_rooms(self, check_in, check_out, guests: int = None, room_type: str = None) -> List[Dict]:
+        """기간 동안 비어 있는 객실 조회"""
+        return await self._call('search_available_rooms', check_in, check_out, guests, room_type)
+
+    async def _stream(self, stmt, batch_size: int) -> AsyncIterator[List[Tuple]]:
+        """SELECT 결과를 서버 측 커서로 batch_size개씩 조회 (전체를 메모리에 올리지 않음)"""
+        result = await self.session.stream(stmt.execution_options(yield_per=batch_size))
+        try:
+            async for rows in result.partitions():
+                yield rows
+        finally:
+            await result.close()
+
+    async def count_reservation_export(self, start=None, end=None) -> int:
+        """내보내기 대상 예약 수"""
+        return await self._call('count_reservation_export', start, end)
+
+    def stream_reservation_rows(self, start=None, end=None, batch_size: int = 1000) -> AsyncIterator[List[Tuple]]:
+        """내보내기용 예약 행 스트리밍"""
+        return self._stream(MySQLDB.reservation_export_select(start, end), batch_size)
+
+    def stream_reservation_analytics_rows(self, start=None, end=None, batch_size: int = 50000) -> AsyncIterator[List[Tuple]]:
+        """분석용 예약 행 스트리밍 (객실/플랫폼 이름 포함)"""
+        return self._stream(MySQLDB.reservation_analytics_select(start, end), batch_size)
+
+    # Revenue 집계 관련 메서드
+    async def get_daily_revenue_stats(self, start, end, active_statuses: List[str]) -> Dict[str, Dict]:
+        """일별 수익 집계"""
+        return await self._call('get_daily_revenue_stats', start, end, active_statuses)
+
+    async def get_monthly_revenue_stats(self, year: int, active_statuses: List[str]) -> Dict[int, Dict]:
+        """월별 수익 집계"""
+        return await self._call('get_monthly_revenue_stats', year, active_statuses)
+
+    async def get_platform_revenue_stats(self, start, end) -> List[Dict]:
+        """플랫폼별 수익 집계"""
+        return await self._call('get_platform_revenue_stats', start, end)
+
+    # Daily stats (일별 집계) 관련 메서드
+    async def rebuild_daily_stats(self, start=None, end=None) -> int:
+        """daily_stats 재계산"""
+        return await self._call('rebuild_daily_stats', start, end)
+
+    async def get_daily_stats(self, start, end, room_type: str = None, platform_id: str = None) -> Dict[str, Dict]:
+        """daily_stats에서 날짜별 합계 조회"""
+        return await self._call('get_daily_stats', start, end, room_type, platform_id)
+
+    async def get_stay_revenue_rows(self, start, end) -> List[Tuple]:
+        """기간과 숙박일이 겹치는 판매 예약 (KPI 계산용)"""
+        return await self._call('get_stay_revenue_rows', start, end)
+
+    # Admins 관련 메서드
+    async def get_admins(self) -> List[Dict]:
+        """모든 관리자 조회"""
+        return await self._call('get_admins')
+
+    async def list_admins(self, limit: int = None, after: str = None, order: str = 'asc',
+                          role: str = None, is_active: bool = None) -> Tuple[List[Dict], Optional[str]]:
+        """관리자 목록 (키셋 페이지네이션)"""
+        return await self._call('list_admins', limit, after, order, role, is_active)
+
+    async def get_admin(self, admin_id: str) -> Optional[Dict]:
+        """관리자 조회"""
+        return await self._call('get_admin', admin_id)
+
+    async def create_admin(self, admin: Dict) -> Dict:
+        """관리자 생성"""
+        return await self._call('create_admin', admin)
+
+    async def delete_admin(self, admin_id: str):
+        """관리자 삭제"""
+        return await self._call('delete_admin', admin_id)
+
+    # Notes 관련 메서드
+    async def get_notes(self) -> List[Dict]:
+        """모든 노트 조회"""
+        return await self._call('get_notes')
+
+    async def list_notes(self, limit: int = None, after: str = None, sort: str = 'id', order: str = 'asc',
+                         room_id: str = None, progress: str = None, note_type: str = None,
+                         status: str = None, fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict], Optional[str]]:
+        """노트 목록 (키셋 페이지네이션, 서버 측 필터)"""
+        return await self._call('list_notes', limit, after, sort, order, room_id, progress, note_type, status, fields)
+
+    async def get_note(self, note_id: str) -> Optional[Dict]:
+        """노트 조회"""
+        return await self._call('get_note', note_id)
+
+    async def get_notes_by_room(self, room_id: str) -> List[Dict]:
+        """객실별 노트 조회"""
+        return await self._call('get_notes_by_room', room_id)
+
+    async def create_note(self, note: Dict) -> Dict:
+        """노트 생성"""
+        return await self._call('create_note', note)
+
+    async def update_note_progress(self, note_id: str, progress: str):
+        """노트 진행 상태 업데이트"""
+        return await self._call('update_note_progress', note_id, progress)
+
+    async def get_notes_by_progress(self, progress: str = None) -> List[Dict]:
+        """진행 상태별 노트 조회"""
+        return await self._call('get_notes_by_progress', progress)
+
+    async def get_urgent_notes(self) -> List[Dict]:
+        """긴급 노트 조회"""
+        return await self._call('get_urgent_notes')
+
+    async def get_after_checkout_notes(self) -> List[Dict]:
+        """체크아웃 후 노트 조회"""
+        return await self._call('get_after_checkout_notes')
+
+
+async def get_db() -> AsyncIterator[AsyncMySQLDB]:
+    """요청 단위 DB dependency
+
+    요청 시작 시 풀에서 커넥션을 받아(대기 시간 기록) 응답 후 반드시 반환합니다.
+    """
+    db = AsyncMySQLDB()
+    try:
+        started = time.perf_counter()
+        try:
+            await db.session.connection()
+        except PoolTimeoutError:
+            acquire_wait_histogram.observe_timeout()
+            raise
+        acquire_wait_histogram.observe((time.perf_counter() - started) * 1000)
+        yield db
+    finally:
+        await db.close()
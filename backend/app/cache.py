@@ -0,0 +1,98 @@
+"""
+참조 테이블(객실, 예약 플랫폼, 관리자) 인프로세스 캐시
+
+자주 바뀌지 않는 목록을 TTL 동안 메모리에 보관하고, 해당 테이블을 변경하는
+MySQLDB 쓰기 메서드가 커밋 후 즉시 무효화합니다. 프로세스(워커)마다 따로 존재하므로
+다른 워커에서 일어난 변경은 최대 TTL만큼 늦게 반영됩니다.
+"""
+import copy
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class TTLCache:
+    """TTL과 최대 항목 수를 가진 LRU 캐시 (스레드 안전, 적중/실패 카운터 포함)"""
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        # 무효화될 때마다 증가 (조회 도중 무효화된 값은 저장하지 않기 위함)
+        self._generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """카운터 초기화"""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+            self._invalidations = 0
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """캐시 값 반환, 없거나 만료되었으면 loader()로 채움 (호출자에게는 복사본 반환)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(entry[1])
+            self._misses += 1
+            generation = self._generation
+
+        # DB 조회는 잠금 밖에서 실행 (동시에 실패한 요청은 각자 조회)
+        value = loader()
+        if self.ttl > 0:
+            with self._lock:
+                if generation != self._generation:
+                    return value
+                self._data[key] = (time.monotonic() + self.ttl, copy.deepcopy(value))
+                self._data.move_to_end(key)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self._evictions += 1
+        return value
+
+    def invalidate(self, *keys: Hashable):
+        """지정한 키 삭제 (키를 주지 않으면 전체 삭제)"""
+        with self._lock:
+            self._generation += 1
+            if not keys:
+                self._invalidations += len(self._data)
+                self._data.clear()
+                return
+            for key in keys:
+                if self._data.pop(key, None) is not None:
+                    self._invalidations += 1
+
+    def stats(self) -> Dict:
+        """현재 캐시 상태와 카운터"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+# MySQLDB 참조 데이터 조회에서 사용하는 전역 캐시 (REFERENCE_CACHE_TTL=0 이면 비활성화)
+reference_cache = TTLCache(
+    ttl=float(os.getenv("REFERENCE_CACHE_TTL", "60")),
+    maxsize=int(os.getenv("REFERENCE_CACHE_MAXSIZE", "128")),
+)
+
+# 대시보드 개요 스냅샷 캐시 (키에 테이블 버전이 포함되므로 TTL은 다른 워커의 변경이 늦게 보이는 시간)
+dashboard_cache = TTLCache(
+    ttl=float(os.getenv("DASHBOARD_CACHE_TTL", "10")),
+    maxsize=8,
+)
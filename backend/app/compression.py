@@ -0,0 +1,188 @@
+"""
+응답 압축 미들웨어 (Brotli / gzip)
+
+클라이언트의 Accept-Encoding에 따라 br(Brotli 패키지가 있을 때) 또는 gzip으로 압축합니다.
+- 최소 크기보다 작은 응답, JSON/텍스트가 아닌 응답, 이미 압축된 응답은 그대로 보냅니다.
+- 제외 경로(SSE 이벤트 스트림, 파일 내보내기)와 스트리밍 응답(본문이 여러 조각)은 압축하지 않습니다.
+- ETag가 있는(캐시 가능한) 응답은 압축 결과를 본문 해시로 캐시해, 같은 내용을 클라이언트마다
+  다시 압축하지 않습니다.
+"""
+import gzip
+import hashlib
+import os
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# 압축 대상 Content-Type (text/event-stream은 제외)
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml")
+
+# 이 크기 이상이면 압축을 스레드풀에서 실행 (이벤트 루프를 막지 않음)
+THREAD_COMPRESS_SIZE = 256 * 1024
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding에서 사용할 인코딩 선택 (br 우선, q=0은 제외)"""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # mtime=0: 같은 본문은 항상 같은 결과
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+class CompressedBodyCache:
+    """압축 결과 LRU 캐시 ((인코딩, 본문 해시) -> 압축 본문, 전체 크기 제한)"""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._data: "OrderedDict[Tuple[str, bytes], bytes]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(encoding: str, body: bytes) -> Tuple[str, bytes]:
+        return encoding, hashlib.blake2b(body, digest_size=16).digest()
+
+    def get(self, key: Tuple[str, bytes]) -> Optional[bytes]:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Tuple[str, bytes], value: bytes):
+        if len(value) > self.max_bytes or key in self._data:
+            return
+        self._data[key] = value
+        self._bytes += len(value)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._data.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def stats(self) -> Dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+
+class CompressionMiddleware:
+    """JSON/텍스트 응답 압축 (최소 크기, 제외 경로, 압축 결과 캐시)"""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024, excluded_paths: Iterable[str] = (),
+                 cache: Optional[CompressedBodyCache] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.excluded_paths = tuple(excluded_paths)
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"].startswith(self.excluded_paths):
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        responder = _CompressionResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 시작 메시지를 첫 본문까지 보류했다가 압축 여부를 결정"""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: Optional[str]):
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+
+    async def send(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        self.passthrough = True
+        start = self.start_message
+        headers = MutableHeaders(scope=start)
+        compressible = (
+            "content-encoding" not in headers
+            and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+            and not headers.get("content-type", "").startswith("text/event-stream")
+        )
+        if compressible:
+            headers.add_vary_header("Accept-Encoding")
+
+        body = message.get("body", b"")
+        if (not compressible or self.encoding is None or message.get("more_body", False)
+                or start["status"] in (204, 304) or len(body) < self.middleware.minimum_size):
+            await self._send(start)
+            await self._send(message)
+            return
+
+        compressed = await self._compress(body, cacheable="etag" in headers)
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    async def _compress(self, body: bytes, cacheable: bool) -> bytes:
+        cache = self.middleware.cache if cacheable else None
+        key = None
+        if cache is not None:
+            key = cache.key(self.encoding, body)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        if len(body) >= THREAD_COMPRESS_SIZE:
+            compressed = await anyio.to_thread.run_sync(compress, body, self.encoding)
+        else:
+            compressed = compress(body, self.encoding)
+        if cache is not None:
+            cache.put(key, compressed)
+        return compressed
+
+
+compressed_body_cache = CompressedBodyCache(
+    max_bytes=int(os.getenv("COMPRESSION_CACHE_BYTES", str(32 * 1024 * 1024)))
+)
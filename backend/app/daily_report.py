@@ -0,0 +1,162 @@
+"""
+일일 운영 리포트 PDF (도착/출발/하우스키핑)
+
+/api/dashboard/checkin-out, /api/cleaning/rooms, /api/room-notes/alerts 의 데이터를 한 장으로 묶습니다.
+PDF 레이아웃은 CPU를 많이 쓰므로 별도 프로세스 풀에서 렌더링해 API 프로세스의 GIL을 잡지 않습니다.
+
+렌더링 결과는 날짜별로 캐시합니다. 관련 테이블 버전이 그대로면 바로 반환하고,
+버전이 바뀌었으면 해당 날짜 데이터만 다시 조회해 내용이 실제로 달라졌을 때만 다시 렌더링합니다.
+
+도착/출발 명부에서는 NON_SELLING_STATUSES(cancelled) 예약만 제외합니다.
+(별도의 노쇼 상태는 없으므로 노쇼는 제외되지 않습니다.)
+"""
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from typing import Dict, Optional, Tuple
+
+from app.async_db import AsyncMySQLDB
+from app.db import NON_SELLING_STATUSES
+from app.report_export import render_daily_ops_pdf
+
+
+# 리포트 내용에 영향을 주는 테이블
+SOURCE_TABLES = ("reservations", "rooms", "room_notes", "customers")
+
+# 날짜별 캐시 최대 개수
+CACHE_MAX_DATES = 31
+
+
+async def collect_daily_ops_data(db: AsyncMySQLDB, report_date: date) -> Dict:
+    """리포트 날짜의 도착/출발 예약, 청소 필요 객실, 처리 대기 메모 (프로세스 간 전달 가능한 dict)"""
+    arrivals = [r for r in await db.get_reservations_checking_in(report_date, report_date)
+                if r.get('status') not in NON_SELLING_STATUSES]
+    departures = [r for r in await db.get_reservations_checking_out(report_date, report_date)
+                  if r.get('status') not in NON_SELLING_STATUSES]
+    rooms = await db.get_rooms()
+    urgent_notes = await db.get_urgent_notes()
+    after_checkout_notes = await db.get_after_checkout_notes()
+
+    customer_ids = {r.get('customer_id') for r in arrivals + departures}
+    customers = {c['id']: c.get('name', '') for c in await db.get_customers_by_ids(list(customer_ids))}
+    room_numbers = {r['id']: r.get('room_number', '') for r in rooms}
+
+    def _stay(r: Dict) -> Dict:
+        return {
+            "id": r.get('id'),
+            "room": room_numbers.get(r.get('room_id'), r.get('room_id')),
+            "guest": customers.get(r.get('customer_id'), f"Customer {r.get('customer_id')}"),
+            "guests": r.get('guests'),
+            "check_in": r.get('check_in'),
+            "check_out": r.get('check_out'),
+            "status": r.get('status'),
+            "booking_reference": r.get('booking_reference'),
+            "notes": r.get('notes') or '',
+        }
+
+    def _note(n: Dict) -> Dict:
+        return {
+            "id": n.get('id'),
+            "room": n.get('room_id'),
+            "title": n.get('title') or '',
+            "description": n.get('description') or '',
+            "progress": n.get('progress') or '',
+            "created_at": n.get('created_at') or '',
+        }
+
+    return {
+        "date": report_date.isoformat(),
+        "arrivals": sorted((_stay(r) for r in arrivals), key=lambda r: str(r["room"])),
+        "departures": sorted((_stay(r) for r in departures), key=lambda r: str(r["room"])),
+        "cleaning_rooms": sorted(
+            ({"room": r.get('room_number'), "room_type": r.get('room_type')}
+             for r in rooms if r.get('status') == 'cleaning'),
+            key=lambda r: str(r["room"])
+        ),
+        "urgent_notes": [_note(n) for n in urgent_notes],
+        "after_checkout_notes": [_note(n) for n in after_checkout_notes],
+    }
+
+
+class DailyReportCache:
+    """날짜별 렌더링 결과 캐시 (같은 날짜 동시 요청은 한 번만 렌더링)"""
+
+    def __init__(self, max_dates: int = CACHE_MAX_DATES, processes: int = 1):
+        self.max_dates = max_dates
+        self.processes = processes
+        self._lock = threading.Lock()
+        # 날짜 -> (테이블 버전, 데이터 해시, PDF)
+        self._entries: "OrderedDict[str, Tuple[str, str, bytes]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.hits = 0
+        self.renders = 0
+
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # spawn: 이벤트 루프/DB 커넥션 스레드를 가진 프로세스를 fork하지 않음
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def _store(self, key: str, versions: str, digest: str, pdf: bytes):
+        with self._lock:
+            self._entries[key] = (versions, digest, pdf)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_dates:
+                self._entries.popitem(last=False)
+
+    async def get_pdf(self, db: AsyncMySQLDB, report_date: date) -> Tuple[bytes, str, bool]:
+        """(PDF, 데이터 해시, 캐시 적중 여부)"""
+        key = report_date.isoformat()
+        versions = await db.get_table_versions_etag(*SOURCE_TABLES)
+
+        with self._lock:
+            entry = self._entries.get(key)
+        # 관련 테이블이 바뀌지 않았으면 조회 없이 반환
+        if entry and entry[0] == versions:
+            self.hits += 1
+            return entry[2], entry[1], True
+
+        data = await collect_daily_ops_data(db, report_date)
+        digest = hashlib.sha256(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:32]
+        # 다른 날짜의 변경이면 내용이 같으므로 버전만 갱신
+        if entry and entry[1] == digest:
+            self._store(key, versions, digest, entry[2])
+            self.hits += 1
+            return entry[2], digest, True
+
+        inflight_key = (key, digest)
+        future = self._inflight.get(inflight_key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor(), render_daily_ops_pdf, data, digest)
+            self._inflight[inflight_key] = future
+            # 요청과 무관하게 렌더링이 끝나면 캐시에 저장 (첫 요청이 취소되어도 결과 유지)
+            future.add_done_callback(
+                lambda done: self._finish_render(inflight_key, key, versions, digest, done)
+            )
+        # 한 요청이 취소(클라이언트 연결 종료)되어도 공유 렌더링과 다른 대기 요청은 계속 진행
+        return await asyncio.shield(future), digest, False
+
+    def _finish_render(self, inflight_key, key: str, versions: str, digest: str, future: asyncio.Future):
+        self._inflight.pop(inflight_key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        self.renders += 1
+        self._store(key, versions, digest, future.result())
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {"dates": len(self._entries), "hits": self.hits, "renders": self.renders}
+
+
+daily_report_cache = DailyReportCache(processes=int(os.getenv("DAILY_REPORT_PROCESSES", "1")))
@@ -2,6 +2,7 @@
 MySQL 데이터베이스 연결 설정
 """
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from pydantic_settings import BaseSettings
@@ -18,6 +19,12 @@ class DatabaseSettings(BaseSettings):
     mysql_user: str = os.getenv("MYSQL_USER", "root")
     mysql_password: str = os.getenv("MYSQL_PASSWORD", "")
     mysql_database: str = os.getenv("MYSQL_DATABASE", "hotel_management")
+    # 로컬 실행용 URL (예: sqlite:///./hotel.db). 비어있으면 MySQL 설정 사용
+    database_url: str = os.getenv("DATABASE_URL", "")
+    # 커넥션 풀 설정
+    db_pool_size: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    db_max_overflow: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    db_pool_timeout: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
     
     class Config:
         env_file = ".env"
@@ -26,19 +33,58 @@ class DatabaseSettings(BaseSettings):
 db_settings = DatabaseSettings()
 
 # MySQL 연결 URL 생성
-DATABASE_URL = f"mysql+pymysql://{db_settings.mysql_user}:{db_settings.mysql_password}@{db_settings.mysql_host}:{db_settings.mysql_port}/{db_settings.mysql_database}?charset=utf8mb4"
+DATABASE_URL = db_settings.database_url or f"mysql+pymysql://{db_settings.mysql_user}:{db_settings.mysql_password}@{db_settings.mysql_host}:{db_settings.mysql_port}/{db_settings.mysql_database}?charset=utf8mb4"
+
+
+def to_async_url(url: str) -> str:
+    """동기 드라이버 URL을 asyncio 드라이버 URL로 변환"""
+    if url.startswith("mysql+pymysql://"):
+        return "mysql+aiomysql://" + url[len("mysql+pymysql://"):]
+    if url.startswith("mysql://"):
+        return "mysql+aiomysql://" + url[len("mysql://"):]
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    return url
+
+
+ASYNC_DATABASE_URL = to_async_url(DATABASE_URL)
+
+
+def pool_options(url: str) -> dict:
+    """엔진에 전달할 커넥션 풀 옵션 (SQLite는 드라이버 기본 풀 사용)"""
+    if url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": db_settings.db_pool_size,
+        "max_overflow": db_settings.db_max_overflow,
+        "pool_timeout": db_settings.db_pool_timeout,
+    }
+
 
 # SQLAlchemy 엔진 생성
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,  # 연결 유효성 검사
     pool_recycle=3600,   # 1시간마다 연결 재사용
-    echo=False  # SQL 쿼리 로깅 (디버깅 시 True로 변경)
+    echo=False,  # SQL 쿼리 로깅 (디버깅 시 True로 변경)
+    **pool_options(DATABASE_URL)
 )
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (라우터에서 이벤트 루프를 막지 않도록 사용)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    echo=False,
+    **pool_options(ASYNC_DATABASE_URL)
+)
+
+# 비동기 세션 팩토리
+AsyncSessionLocal = async_sessionmaker(autocommit=False, autoflush=False, bind=async_engine)
+
 # Base 클래스 (모델 상속용)
 Base = declarative_base()
 
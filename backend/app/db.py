@@ -1,13 +1,21 @@
 """
 MySQL 데이터베이스 클래스 (GoogleSheetsDB와 동일한 인터페이스)
 """
-from typing import List, Dict, Optional
-from datetime import date, datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from typing import List, Dict, Optional, Tuple
+from datetime import date, datetime, timedelta
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy import and_, or_, func, case, extract, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.database import SessionLocal
+from app.utils import parse_date, reservation_rows_to_records, reservation_rows_to_partial_records
+from app.pagination import keyset_page, InvalidCursorError
+from app.cache import reference_cache, dashboard_cache
+from app.versions import writes, table_versions
+from app.events import event_bus, ROOM_STATUS_CHANGED, NOTE_CREATED, NOTE_UPDATED
 from app.db_models import (
-    Customer, Room, Reservation, Admin, RoomNote, BookingPlatform
+    Customer, Room, Reservation, Admin, RoomNote, BookingPlatform, DailyStat, RoomNight
 )
 from app.models import (
     Customer as CustomerModel,
@@ -18,11 +26,74 @@ from app.models import (
 )
 
 
+# 판매(객실-박, 매출) 집계와 객실-박 원장에서 제외되는 예약 상태
+NON_SELLING_STATUSES = ['cancelled']
+
+# 참조 데이터 캐시 키
+ROOMS_CACHE_KEY = 'rooms'
+PLATFORMS_CACHE_KEY = 'platforms'
+PLATFORM_MAP_CACHE_KEY = 'platform_map'
+ADMINS_CACHE_KEY = 'admins'
+
+# 응답 직렬화용 예약 컬럼 (utils.reservation_rows_to_records 순서)
+RESERVATION_COLUMNS = (
+    Reservation.id, Reservation.customer_id, Reservation.room_id, Reservation.platform_id,
+    Reservation.check_in, Reservation.check_out, Reservation.guests, Reservation.total_price,
+    Reservation.status, Reservation.booking_reference, Reservation.notes, Reservation.created_at
+)
+
+# 빈 객실 검색에서 제외되는 객실 상태
+UNSELLABLE_ROOM_STATUSES = ['maintenance']
+
+
+class RoomAlreadyBookedError(ValueError):
+    """객실-박 원장 제약 조건 위반 (같은 객실/날짜에 다른 예약이 있음)"""
+    pass
+
+
+class InvalidStatusTransitionError(ValueError):
+    """예약이 이미 요청한 상태인 경우"""
+    pass
+
+
+def stay_nights(check_in: date, check_out: date) -> List[date]:
+    """숙박일 목록 [check_in, check_out) (당일 이용은 체크인 날짜 1박으로 계산)"""
+    nights = (check_out - check_in).days
+    return [check_in + timedelta(days=i) for i in range(nights)] or [check_in]
+
+
+def daily_stats_contribution(check_in: date, check_out: date, total_price: float, status: str,
+                             room_type: str, platform_id: int) -> Dict[Tuple, Dict]:
+    """예약 1건이 daily_stats에 더하는 값 ((날짜, 객실 타입, 플랫폼) -> 증감값)"""
+    if status in NON_SELLING_STATUSES:
+        return {}
+    
+    stay_dates = stay_nights(check_in, check_out)
+    nightly_revenue = float(total_price or 0) / len(stay_dates)
+    
+    contribution: Dict[Tuple, Dict] = {}
+    
+    def _entry(day: date) -> Dict:
+        return contribution.setdefault(
+            (day, room_type, platform_id),
+            {"room_nights": 0, "revenue": 0.0, "arrivals": 0, "departures": 0}
+        )
+    
+    for day in stay_dates:
+        entry = _entry(day)
+        entry["room_nights"] += 1
+        entry["revenue"] += nightly_revenue
+    _entry(check_in)["arrivals"] += 1
+    _entry(check_out)["departures"] += 1
+    return contribution
+
+
 class MySQLDB:
     """MySQL 데이터베이스 클래스 (GoogleSheetsDB와 호환되는 인터페이스)"""
     
-    def __init__(self):
-        self.db: Session = SessionLocal()
+    def __init__(self, session: Optional[Session] = None):
+        # 외부 세션이 주어지면 재사용 (AsyncMySQLDB의 run_sync 경로)
+        self.db: Session = session if session is not None else SessionLocal()
     
     def __enter__(self):
         return self
@@ -51,17 +122,68 @@ class MySQLDB:
         
         return result
     
+    def _row_to_dict(self, row) -> Dict:
+        """컬럼 조회 행을 딕셔너리로 변환 (_to_dict와 같은 규칙)"""
+        result = {}
+        for name, value in row._mapping.items():
+            if isinstance(value, (date, datetime)):
+                value = value.isoformat()
+            result[name] = value
+        if 'id' in result:
+            result['id'] = str(result['id'])
+        return result
+    
+    @staticmethod
+    def _projection(entity, fields, *required) -> List:
+        """?fields= 조회 컬럼 (커서/변환에 필요한 컬럼 포함, 테이블에 있는 필드만)"""
+        names = dict.fromkeys([*required, *fields])
+        table_columns = entity.__table__.columns
+        return [getattr(entity, name) for name in names if name in table_columns]
+    
     # Customers 관련 메서드
     def get_customers(self) -> List[Dict]:
         """모든 고객 조회"""
         customers = self.db.query(Customer).all()
         return [self._to_dict(c) for c in customers]
     
+    def list_customers(self, limit: int = None, after: str = None, sort: str = 'id', order: str = 'asc',
+                       name: str = None, nationality: str = None,
+                       fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict], Optional[str]]:
+        """고객 목록 (키셋 페이지네이션, 이름 접두어/국적 필터), (목록, 다음 커서) 반환
+        
+        fields가 있으면 해당 컬럼(과 id, 정렬 컬럼)만 조회합니다.
+        """
+        sort_columns = {'id': Customer.id, 'name': Customer.name}
+        if sort not in sort_columns:
+            raise InvalidCursorError(f"Invalid sort key: {sort}. Must be one of: {', '.join(sort_columns)}")
+        
+        if fields:
+            query = self.db.query(*self._projection(Customer, fields, 'id', sort))
+        else:
+            query = self.db.query(Customer)
+        if name:
+            query = query.filter(Customer.name.like(f"{name}%"))
+        if nationality:
+            query = query.filter(Customer.nationality == nationality)
+        
+        customers, next_cursor = keyset_page(query, sort_columns[sort], Customer.id, order, limit, after)
+        to_dict = self._row_to_dict if fields else self._to_dict
+        return [to_dict(c) for c in customers], next_cursor
+    
+    def get_customers_by_ids(self, customer_ids: List[str]) -> List[Dict]:
+        """여러 고객을 한 번에 조회"""
+        ids = {int(c) for c in customer_ids if str(c).isdigit()}
+        if not ids:
+            return []
+        customers = self.db.query(Customer).filter(Customer.id.in_(ids)).all()
+        return [self._to_dict(c) for c in customers]
+    
     def get_customer(self, customer_id: str) -> Optional[Dict]:
         """고객 조회"""
         customer = self.db.query(Customer).filter(Customer.id == int(customer_id)).first()
         return self._to_dict(customer) if customer else None
     
+    @writes('customers')
     def create_customer(self, customer: Dict) -> Dict:
         """고객 생성"""
         new_customer = Customer(
@@ -77,9 +199,10 @@ class MySQLDB:
     
     # Rooms 관련 메서드
     def get_rooms(self) -> List[Dict]:
-        """모든 객실 조회"""
-        rooms = self.db.query(Room).all()
-        return [self._to_dict(r) for r in rooms]
+        """모든 객실 조회 (참조 데이터 캐시 사용)"""
+        return reference_cache.get_or_load(
+            ROOMS_CACHE_KEY, lambda: [self._to_dict(r) for r in self.db.query(Room).all()]
+        )
     
     def get_room(self, room_id: str) -> Optional[Dict]:
         """객실 조회 (room_id는 room_number 또는 id)"""
@@ -93,6 +216,7 @@ class MySQLDB:
                 pass
         return self._to_dict(room) if room else None
     
+    @writes('rooms')
     def update_room_status(self, room_id: str, status: str):
         """객실 상태 업데이트"""
         room = self.db.query(Room).filter(Room.room_number == room_id).first()
@@ -105,9 +229,16 @@ class MySQLDB:
         if not room:
             raise ValueError(f"Room with id {room_id} not found")
         
+        previous_status = room.status
         room.status = status
+        room_event = {"room_id": str(room.id), "room_number": room.room_number, "status": status}
         self.db.commit()
+        # 실제로 상태가 바뀐 경우에만 캐시 무효화/이벤트 발행
+        if previous_status != status:
+            reference_cache.invalidate(ROOMS_CACHE_KEY)
+            event_bus.publish(ROOM_STATUS_CHANGED, room_event)
     
+    @writes('rooms')
     def create_room(self, room: Dict) -> Dict:
         """객실 생성"""
         new_room = Room(
@@ -119,15 +250,25 @@ class MySQLDB:
         )
         self.db.add(new_room)
         self.db.commit()
+        reference_cache.invalidate(ROOMS_CACHE_KEY)
         self.db.refresh(new_room)
         return self._to_dict(new_room)
     
     # Booking Platforms 관련 메서드
     def get_platforms(self) -> List[Dict]:
-        """모든 예약 플랫폼 조회"""
-        platforms = self.db.query(BookingPlatform).all()
-        return [self._to_dict(p) for p in platforms]
+        """모든 예약 플랫폼 조회 (참조 데이터 캐시 사용)"""
+        return reference_cache.get_or_load(
+            PLATFORMS_CACHE_KEY, lambda: [self._to_dict(p) for p in self.db.query(BookingPlatform).all()]
+        )
+    
+    def get_platform_map(self) -> Dict[str, str]:
+        """플랫폼 id -> 이름 매핑 (참조 데이터 캐시 사용)"""
+        return reference_cache.get_or_load(
+            PLATFORM_MAP_CACHE_KEY,
+            lambda: {p.get('id', ''): p.get('name', 'Unknown') for p in self.get_platforms()}
+        )
     
+    @writes('booking_platforms')
     def create_platform(self, platform: Dict) -> Dict:
         """예약 플랫폼 생성"""
         new_platform = BookingPlatform(
@@ -137,45 +278,189 @@ class MySQLDB:
         )
         self.db.add(new_platform)
         self.db.commit()
+        reference_cache.invalidate(PLATFORMS_CACHE_KEY, PLATFORM_MAP_CACHE_KEY)
         self.db.refresh(new_platform)
         return self._to_dict(new_platform)
     
     # Reservations 관련 메서드
+    def _reservation_to_dict(self, reservation) -> Dict:
+        """예약 객체를 딕셔너리로 변환 (customer_id, room_id, platform_id는 문자열)"""
+        res_dict = self._to_dict(reservation)
+        if res_dict:
+            res_dict['customer_id'] = str(res_dict.get('customer_id', ''))
+            res_dict['room_id'] = str(res_dict.get('room_id', ''))
+            res_dict['platform_id'] = str(res_dict.get('platform_id', ''))
+        return res_dict
+    
     def get_reservations(self) -> List[Dict]:
         """모든 예약 조회"""
         reservations = self.db.query(Reservation).all()
-        result = []
-        for r in reservations:
-            res_dict = self._to_dict(r)
-            # customer_id, room_id, platform_id를 문자열로 변환
-            if res_dict:
-                res_dict['customer_id'] = str(res_dict.get('customer_id', ''))
-                res_dict['room_id'] = str(res_dict.get('room_id', ''))
-                res_dict['platform_id'] = str(res_dict.get('platform_id', ''))
-            result.append(res_dict)
-        return result
+        return [self._reservation_to_dict(r) for r in reservations]
+    
+    def list_reservations(self, limit: int = None, after: str = None, sort: str = 'id', order: str = 'asc',
+                          status: str = None, start_date=None, end_date=None, room_id: str = None,
+                          platform_id: str = None, customer_id: str = None) -> Tuple[List[Dict], Optional[str]]:
+        """예약 목록 (키셋 페이지네이션, 상태/기간/객실/플랫폼/고객 필터), (목록, 다음 커서) 반환
+        
+        start_date/end_date는 해당 기간과 숙박 기간이 겹치는 예약을 찾습니다.
+        """
+        reservations, next_cursor = self._reservation_page(
+            self.db.query(Reservation), limit, after, sort, order,
+            status, start_date, end_date, room_id, platform_id, customer_id
+        )
+        return [self._reservation_to_dict(r) for r in reservations], next_cursor
+    
+    def list_reservation_records(self, limit: int = None, after: str = None, sort: str = 'id', order: str = 'asc',
+                                 status: str = None, start_date=None, end_date=None, room_id: str = None,
+                                 platform_id: str = None, customer_id: str = None,
+                                 fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict], Optional[str]]:
+        """list_reservations와 같은 조회를 응답 형태(ReservationRecord)로 바로 반환
+        
+        ORM 객체 대신 컬럼만 조회하고, 문자열 변환 -> 재파싱 -> 모델 검증 단계를 거치지 않습니다.
+        fields가 있으면 해당 컬럼(과 id, 정렬 컬럼)만 조회하고 요청한 필드만 반환합니다.
+        """
+        columns = self._projection(Reservation, fields, 'id', sort) if fields else RESERVATION_COLUMNS
+        rows, next_cursor = self._reservation_page(
+            self.db.query(*columns), limit, after, sort, order,
+            status, start_date, end_date, room_id, platform_id, customer_id
+        )
+        if fields:
+            return reservation_rows_to_partial_records(rows, fields), next_cursor
+        return reservation_rows_to_records(rows), next_cursor
+    
+    def _reservation_page(self, query, limit, after, sort, order, status, start_date, end_date,
+                          room_id, platform_id, customer_id):
+        """예약 목록 필터/정렬/커서 적용 (query는 Reservation 엔티티 또는 컬럼 조회)"""
+        sort_columns = {'id': Reservation.id, 'check_in': Reservation.check_in, 'check_out': Reservation.check_out}
+        if sort not in sort_columns:
+            raise InvalidCursorError(f"Invalid sort key: {sort}. Must be one of: {', '.join(sort_columns)}")
+        
+        if status:
+            query = query.filter(Reservation.status == status)
+        if start_date:
+            query = query.filter(Reservation.check_out >= parse_date(start_date))
+        if end_date:
+            query = query.filter(Reservation.check_in <= parse_date(end_date))
+        if room_id:
+            query = query.filter(Reservation.room_id == int(room_id))
+        if platform_id:
+            query = query.filter(Reservation.platform_id == int(platform_id))
+        if customer_id:
+            query = query.filter(Reservation.customer_id == int(customer_id))
+        
+        return keyset_page(query, sort_columns[sort], Reservation.id, order, limit, after)
+    
+    def get_reservations_overlapping(self, start, end, statuses: Optional[List[str]] = None) -> List[Dict]:
+        """기간과 겹치는 예약 조회 (check_in <= end, check_out >= start)"""
+        query = self.db.query(Reservation).filter(
+            Reservation.check_in <= parse_date(end),
+            Reservation.check_out >= parse_date(start)
+        )
+        if statuses is not None:
+            query = query.filter(Reservation.status.in_(statuses))
+        return [self._reservation_to_dict(r) for r in query.order_by(Reservation.check_in).all()]
+    
+    def get_reservations_checking_in(self, start, end, statuses: Optional[List[str]] = None) -> List[Dict]:
+        """체크인 날짜가 기간 안에 있는 예약 조회 (start <= check_in <= end)"""
+        query = self.db.query(Reservation).filter(
+            Reservation.check_in >= parse_date(start),
+            Reservation.check_in <= parse_date(end)
+        )
+        if statuses is not None:
+            query = query.filter(Reservation.status.in_(statuses))
+        return [self._reservation_to_dict(r) for r in query.order_by(Reservation.check_in).all()]
+    
+    def get_reservations_checking_out(self, start, end, statuses: Optional[List[str]] = None) -> List[Dict]:
+        """체크아웃 날짜가 기간 안에 있는 예약 조회 (start <= check_out <= end)"""
+        query = self.db.query(Reservation).filter(
+            Reservation.check_out >= parse_date(start),
+            Reservation.check_out <= parse_date(end)
+        )
+        if statuses is not None:
+            query = query.filter(Reservation.status.in_(statuses))
+        return [self._reservation_to_dict(r) for r in query.order_by(Reservation.check_out).all()]
+    
+    def count_reservations(self, statuses: Optional[List[str]] = None) -> int:
+        """예약 수 조회 (statuses가 주어지면 해당 상태만)"""
+        query = self.db.query(func.count(Reservation.id))
+        if statuses is not None:
+            query = query.filter(Reservation.status.in_(statuses))
+        return query.scalar() or 0
+    
+    def get_table_versions_etag(self, *tables: str) -> str:
+        """테이블 버전 ETag (버전은 이 세션의 커넥션으로 읽음)"""
+        return table_versions.etag(*tables, session=self.db)
+    
+    def get_dashboard_snapshot(self, day: date, active_statuses: List[str]) -> Dict:
+        """대시보드 개요 (통계, 당일 도착/출발 명부, 긴급 메모 수, 청소 대기 수)
+        
+        예약 수 2회, 당일 도착/출발 1회, 대기 중 노트 집계 1회 조회합니다 (객실은 참조 데이터 캐시).
+        결과는 날짜와 관련 테이블 버전을 키로 잠시 캐시합니다.
+        """
+        key = ('overview', day, tuple(active_statuses),
+               self.get_table_versions_etag('reservations', 'rooms', 'room_notes'))
+        return dashboard_cache.get_or_load(key, lambda: self._load_dashboard_snapshot(day, active_statuses))
+    
+    def _load_dashboard_snapshot(self, day: date, active_statuses: List[str]) -> Dict:
+        rooms = self.get_rooms()
+        
+        # 전체/활성 건수는 각각 인덱스만으로 세는 편이 CASE 집계(테이블 전체 스캔)보다 빠름
+        total_reservations = self.count_reservations()
+        active_reservations = self.count_reservations(statuses=active_statuses)
+        
+        # 당일 도착과 출발을 한 번에 조회 (당일 이용은 양쪽 모두에 포함)
+        rows = self.db.query(*RESERVATION_COLUMNS).filter(
+            Reservation.status.in_(active_statuses),
+            or_(Reservation.check_in == day, Reservation.check_out == day)
+        ).order_by(Reservation.id).all()
+        records = reservation_rows_to_records(rows)
+        check_ins = [r for r in records if r['check_in'] == day]
+        check_outs = [r for r in records if r['check_out'] == day]
+        
+        pending_notes = dict(self.db.query(RoomNote.note_type, func.count(RoomNote.id)).filter(
+            RoomNote.status == 'pending'
+        ).group_by(RoomNote.note_type).all())
+        
+        total_rooms = len(rooms)
+        available_rooms = sum(1 for r in rooms if r.get('status') == 'available')
+        occupied_rooms = sum(1 for r in rooms if r.get('status') == 'occupied')
+        return {
+            "date": day,
+            "stats": {
+                "today_checkins": len(check_ins),
+                "today_checkouts": len(check_outs),
+                "total_reservations": total_reservations,
+                "active_reservations": active_reservations,
+                "total_rooms": total_rooms,
+                "available_rooms": available_rooms,
+                "occupied_rooms": occupied_rooms,
+                "occupancy_rate": round((occupied_rooms / total_rooms * 100) if total_rooms > 0 else 0, 2)
+            },
+            "check_ins": check_ins,
+            "check_outs": check_outs,
+            "urgent_notes": pending_notes.get('urgent', 0),
+            "cleaning_queue": {
+                "rooms": sum(1 for r in rooms if r.get('status') == 'cleaning'),
+                "after_checkout_tasks": pending_notes.get('after_checkout', 0),
+            },
+        }
     
     def get_reservation(self, reservation_id: str) -> Optional[Dict]:
         """예약 조회"""
         reservation = self.db.query(Reservation).filter(
             Reservation.id == int(reservation_id)
         ).first()
-        if reservation:
-            res_dict = self._to_dict(reservation)
-            res_dict['customer_id'] = str(res_dict.get('customer_id', ''))
-            res_dict['room_id'] = str(res_dict.get('room_id', ''))
-            res_dict['platform_id'] = str(res_dict.get('platform_id', ''))
-            return res_dict
-        return None
+        return self._reservation_to_dict(reservation) if reservation else None
     
+    @writes('reservations', 'room_nights', 'daily_stats')
     def create_reservation(self, reservation: Dict) -> Dict:
         """예약 생성"""
         new_reservation = Reservation(
             customer_id=int(reservation.get('customer_id')),
             room_id=int(reservation.get('room_id')),
             platform_id=int(reservation.get('platform_id')),
-            check_in=reservation.get('check_in'),
-            check_out=reservation.get('check_out'),
+            check_in=parse_date(reservation.get('check_in')),
+            check_out=parse_date(reservation.get('check_out')),
             guests=int(reservation.get('guests')),
             total_price=float(reservation.get('total_price')),
             status=reservation.get('status', 'Reserved'),
@@ -183,71 +468,482 @@ class MySQLDB:
             notes=reservation.get('notes')
         )
         self.db.add(new_reservation)
+        self.db.flush()
+        # 객실-박 원장과 일별 집계도 같은 트랜잭션에서 반영
+        self._sync_room_nights(new_reservation)
+        self._apply_daily_stats(self._reservation_contribution(new_reservation))
         self.db.commit()
         self.db.refresh(new_reservation)
-        res_dict = self._to_dict(new_reservation)
-        res_dict['customer_id'] = str(res_dict.get('customer_id', ''))
-        res_dict['room_id'] = str(res_dict.get('room_id', ''))
-        res_dict['platform_id'] = str(res_dict.get('platform_id', ''))
-        return res_dict
+        return self._reservation_to_dict(new_reservation)
     
     def update_reservation_status(self, reservation_id: str, status: str):
         """예약 상태 업데이트"""
+        if self.transition_reservation(reservation_id, status) is None:
+            raise ValueError(f"Reservation with id {reservation_id} not found")
+    
+    @writes('reservations', 'rooms', 'room_nights', 'daily_stats')
+    def transition_reservation(self, reservation_id: str, status: str, room_status: str = None,
+                               allow_same_status: bool = True) -> Optional[Dict]:
+        """예약 상태 전환 (예약/객실 행 잠금 후 한 트랜잭션, 한 번의 커밋으로 처리)
+        
+        room_status를 주지 않으면 체크인은 occupied, 체크아웃은 cleaning으로 객실 상태 변경.
+        예약이 없으면 None, allow_same_status=False인데 이미 같은 상태면 InvalidStatusTransitionError.
+        """
         valid_statuses = ['Reserved', 'Checked in', 'Checked out']
         if status not in valid_statuses:
             raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_statuses)}")
         
-        reservation = self.db.query(Reservation).filter(
+        # 예약과 객실을 한 번의 SELECT ... FOR UPDATE로 조회 및 잠금
+        reservation = self.db.query(Reservation).options(
+            joinedload(Reservation.room)
+        ).filter(
             Reservation.id == int(reservation_id)
-        ).first()
+        ).with_for_update().first()
         
         if not reservation:
-            raise ValueError(f"Reservation with id {reservation_id} not found")
+            self.db.rollback()
+            return None
+        
+        if not allow_same_status and reservation.status == status:
+            self.db.rollback()
+            raise InvalidStatusTransitionError(f"Reservation {reservation_id} is already '{status}'")
         
+        room = reservation.room
+        room_type = room.room_type if room else ''
+        
+        # 상태 변경 전후의 집계 차이를 같은 트랜잭션에서 반영
+        before = self._reservation_contribution(reservation, room_type)
+        was_selling = reservation.status not in NON_SELLING_STATUSES
         reservation.status = status
-        self.db.commit()
+        after = self._reservation_contribution(reservation, room_type)
+        self._apply_daily_stats(after, before)
+        # 판매 여부가 바뀐 경우에만 객실-박 원장 갱신
+        if was_selling != (status not in NON_SELLING_STATUSES):
+            self._sync_room_nights(reservation)
         
         # 객실 상태도 업데이트
-        if status == 'Checked in':
-            reservation.room.status = 'occupied'
-        elif status == 'Checked out':
-            reservation.room.status = 'cleaning'
+        if room_status is None:
+            room_status = {'Checked in': 'occupied', 'Checked out': 'cleaning'}.get(status)
+        room_event = None
+        if room and room_status:
+            # 실제로 상태가 바뀐 경우에만 캐시 무효화/이벤트 발행
+            if room.status != room_status:
+                room_event = {"room_id": str(room.id), "room_number": room.room_number, "status": room_status}
+            room.status = room_status
+        
+        # 커밋 후 다시 조회하지 않도록 세션 안의 값으로 결과 생성
+        result = self._reservation_to_dict(reservation)
         self.db.commit()
+        if room_event:
+            reference_cache.invalidate(ROOMS_CACHE_KEY)
+            event_bus.publish(ROOM_STATUS_CHANGED, room_event)
+        return result
     
     def check_duplicate_reservation(self, room_id: str, check_in: str, check_out: str, exclude_id: str = None) -> bool:
-        """중복 예약 체크"""
-        check_in_date = check_in if isinstance(check_in, date) else datetime.strptime(str(check_in), '%Y-%m-%d').date()
-        check_out_date = check_out if isinstance(check_out, date) else datetime.strptime(str(check_out), '%Y-%m-%d').date()
+        """중복 예약 체크 (객실-박 원장의 기본 키 범위 조회)"""
+        nights = stay_nights(parse_date(check_in), parse_date(check_out))
         
-        query = self.db.query(Reservation).filter(
-            Reservation.room_id == int(room_id),
-            Reservation.status != 'cancelled'
+        query = self.db.query(RoomNight.night).filter(
+            RoomNight.room_id == int(room_id),
+            RoomNight.night >= nights[0],
+            RoomNight.night <= nights[-1]
         )
         
         if exclude_id:
-            query = query.filter(Reservation.id != int(exclude_id))
+            query = query.filter(RoomNight.reservation_id != int(exclude_id))
         
-        # 날짜 겹침 체크
-        overlapping = query.filter(
-            and_(
-                Reservation.check_in <= check_out_date,
-                Reservation.check_out >= check_in_date
+        return query.first() is not None
+    
+    def search_available_rooms(self, check_in, check_out, guests: int = None, room_type: str = None) -> List[Dict]:
+        """기간 동안 비어 있는 객실 조회 (객실-박 원장에 대한 NOT EXISTS 안티 조인, 1박 가격순)"""
+        nights = stay_nights(parse_date(check_in), parse_date(check_out))
+        
+        booked = self.db.query(RoomNight.room_id).filter(
+            RoomNight.room_id == Room.id,
+            RoomNight.night >= nights[0],
+            RoomNight.night <= nights[-1]
+        )
+        query = self.db.query(Room).filter(
+            ~booked.exists(),
+            or_(Room.status.is_(None), Room.status.notin_(UNSELLABLE_ROOM_STATUSES))
+        )
+        if guests:
+            query = query.filter(Room.max_guests >= guests)
+        if room_type:
+            query = query.filter(Room.room_type == room_type)
+        
+        rooms = query.order_by(Room.price_per_night.asc(), Room.id.asc()).all()
+        return [self._to_dict(r) for r in rooms]
+    
+    # Room nights (객실-박 원장) 관련 메서드
+    def _sync_room_nights(self, reservation):
+        """예약의 객실-박 원장 행을 현재 상태에 맞게 다시 기록 (커밋은 호출자가 수행)
+        
+        다른 예약이 이미 차지한 날짜가 있으면 롤백 후 RoomAlreadyBookedError 발생
+        """
+        self.db.query(RoomNight).filter(
+            RoomNight.reservation_id == reservation.id
+        ).delete(synchronize_session=False)
+        
+        if reservation.status in NON_SELLING_STATUSES:
+            return
+        
+        rows = [
+            {"room_id": reservation.room_id, "night": night, "reservation_id": reservation.id}
+            for night in stay_nights(parse_date(reservation.check_in), parse_date(reservation.check_out))
+        ]
+        try:
+            self.db.execute(RoomNight.__table__.insert(), rows)
+        except IntegrityError:
+            self.db.rollback()
+            raise RoomAlreadyBookedError(
+                f"Room {reservation.room_id} is already booked for the selected dates"
             )
-        ).first()
+    
+    @writes('room_nights')
+    def rebuild_room_nights(self) -> List[Dict]:
+        """객실-박 원장 재생성, 겹쳐서 기록하지 못한 (room_id, night, reservation_id) 목록 반환"""
+        self.db.query(RoomNight).delete(synchronize_session=False)
+        
+        query = self.db.query(
+            Reservation.id, Reservation.room_id, Reservation.check_in, Reservation.check_out
+        ).filter(
+            Reservation.status.notin_(NON_SELLING_STATUSES)
+        ).order_by(Reservation.id)
+        
+        taken = set()
+        rows = []
+        conflicts = []
+        for reservation_id, room_id, check_in, check_out in query.yield_per(1000):
+            for night in stay_nights(parse_date(check_in), parse_date(check_out)):
+                if (room_id, night) in taken:
+                    # 먼저 생성된 예약이 해당 날짜를 차지
+                    conflicts.append({"room_id": room_id, "night": str(night), "reservation_id": reservation_id})
+                    continue
+                taken.add((room_id, night))
+                rows.append({"room_id": room_id, "night": night, "reservation_id": reservation_id})
+        
+        if rows:
+            self.db.execute(RoomNight.__table__.insert(), rows)
+        self.db.commit()
+        return conflicts
+    
+    # 내보내기 관련
+    @staticmethod
+    def _check_in_window(stmt, start=None, end=None):
+        """체크인 기준 기간 필터와 정렬 (기간이 없으면 id 순)"""
+        if start:
+            stmt = stmt.where(Reservation.check_in >= parse_date(start))
+        if end:
+            stmt = stmt.where(Reservation.check_in <= parse_date(end))
+        if start or end:
+            return stmt.order_by(Reservation.check_in, Reservation.id)
+        return stmt.order_by(Reservation.id)
+    
+    @staticmethod
+    def reservation_export_select(start=None, end=None):
+        """예약 내보내기용 SELECT (ORM 객체 없이 컬럼만 조회, 체크인 기준 기간 필터)"""
+        stmt = select(
+            Reservation.id, Reservation.customer_id, Reservation.room_id, Reservation.platform_id,
+            Reservation.check_in, Reservation.check_out, Reservation.guests, Reservation.total_price,
+            Reservation.status, Reservation.booking_reference, Reservation.notes
+        )
+        return MySQLDB._check_in_window(stmt, start, end)
+    
+    @staticmethod
+    def reservation_analytics_select(start=None, end=None):
+        """분석용 내보내기 SELECT (객실 번호/타입, 플랫폼 이름 포함)"""
+        stmt = select(
+            Reservation.id, Reservation.customer_id, Reservation.room_id, Room.room_number, Room.room_type,
+            Reservation.platform_id, BookingPlatform.name, Reservation.check_in, Reservation.check_out,
+            Reservation.guests, Reservation.total_price, Reservation.status, Reservation.booking_reference,
+            Reservation.notes, Reservation.created_at
+        ).join(
+            Room, Room.id == Reservation.room_id
+        ).outerjoin(
+            BookingPlatform, BookingPlatform.id == Reservation.platform_id
+        )
+        return MySQLDB._check_in_window(stmt, start, end)
+    
+    def count_reservation_export(self, start=None, end=None) -> int:
+        """내보내기 대상 예약 수 (리포트 작업 진행률 계산용)"""
+        query = self.db.query(func.count(Reservation.id))
+        if start:
+            query = query.filter(Reservation.check_in >= parse_date(start))
+        if end:
+            query = query.filter(Reservation.check_in <= parse_date(end))
+        return query.scalar() or 0
+    
+    # Revenue 집계 관련 메서드
+    def _active_count(self, statuses: List[str]):
+        """상태 조건을 만족하는 행 수 (SUM(CASE ...))"""
+        return func.sum(case((Reservation.status.in_(statuses), 1), else_=0))
+    
+    def get_daily_revenue_stats(self, start, end, active_statuses: List[str]) -> Dict[str, Dict]:
+        """일별 수익 집계 (체크인 날짜 기준 수익/체크인 수, 체크아웃 날짜 기준 체크아웃 수)"""
+        start_date = parse_date(start)
+        end_date = parse_date(end)
+        stats: Dict[str, Dict] = {}
+        
+        check_in_rows = self.db.query(
+            Reservation.check_in,
+            func.coalesce(func.sum(Reservation.total_price), 0),
+            func.count(Reservation.id),
+            self._active_count(active_statuses)
+        ).filter(
+            Reservation.check_in >= start_date,
+            Reservation.check_in <= end_date
+        ).group_by(Reservation.check_in).all()
+        
+        for day, revenue, check_ins, active in check_in_rows:
+            entry = stats.setdefault(str(day), {"revenue": 0.0, "reservations": 0, "check_ins": 0, "check_outs": 0})
+            entry["revenue"] = float(revenue or 0)
+            entry["check_ins"] = int(check_ins or 0)
+            entry["reservations"] = int(active or 0)
+        
+        check_out_rows = self.db.query(
+            Reservation.check_out,
+            func.count(Reservation.id)
+        ).filter(
+            Reservation.check_out >= start_date,
+            Reservation.check_out <= end_date
+        ).group_by(Reservation.check_out).all()
+        
+        for day, check_outs in check_out_rows:
+            entry = stats.setdefault(str(day), {"revenue": 0.0, "reservations": 0, "check_ins": 0, "check_outs": 0})
+            entry["check_outs"] = int(check_outs or 0)
+        
+        return stats
+    
+    def get_monthly_revenue_stats(self, year: int, active_statuses: List[str]) -> Dict[int, Dict]:
+        """월별 수익 집계 (체크인 월 기준 수익/체크인 수, 체크아웃 월 기준 체크아웃 수)"""
+        year_start = date(year, 1, 1)
+        year_end = date(year, 12, 31)
+        stats: Dict[int, Dict] = {}
+        
+        check_in_month = extract('month', Reservation.check_in)
+        check_in_rows = self.db.query(
+            check_in_month,
+            func.coalesce(func.sum(Reservation.total_price), 0),
+            func.count(Reservation.id),
+            self._active_count(active_statuses)
+        ).filter(
+            Reservation.check_in >= year_start,
+            Reservation.check_in <= year_end
+        ).group_by(check_in_month).all()
+        
+        for month, revenue, check_ins, active in check_in_rows:
+            entry = stats.setdefault(int(month), {"revenue": 0.0, "reservations": 0, "check_ins": 0, "check_outs": 0})
+            entry["revenue"] = float(revenue or 0)
+            entry["check_ins"] = int(check_ins or 0)
+            entry["reservations"] = int(active or 0)
+        
+        check_out_month = extract('month', Reservation.check_out)
+        check_out_rows = self.db.query(
+            check_out_month,
+            func.count(Reservation.id)
+        ).filter(
+            Reservation.check_out >= year_start,
+            Reservation.check_out <= year_end
+        ).group_by(check_out_month).all()
+        
+        for month, check_outs in check_out_rows:
+            entry = stats.setdefault(int(month), {"revenue": 0.0, "reservations": 0, "check_ins": 0, "check_outs": 0})
+            entry["check_outs"] = int(check_outs or 0)
         
-        return overlapping is not None
+        return stats
+    
+    def get_platform_revenue_stats(self, start, end) -> List[Dict]:
+        """플랫폼별 수익 집계 (체크인 날짜 기준, booking_platforms 조인)"""
+        rows = self.db.query(
+            Reservation.platform_id,
+            BookingPlatform.name,
+            func.coalesce(func.sum(Reservation.total_price), 0),
+            func.count(Reservation.id)
+        ).outerjoin(
+            BookingPlatform, BookingPlatform.id == Reservation.platform_id
+        ).filter(
+            Reservation.check_in >= parse_date(start),
+            Reservation.check_in <= parse_date(end)
+        ).group_by(Reservation.platform_id, BookingPlatform.name).all()
+        
+        return [
+            {
+                "platform_id": str(platform_id),
+                "platform_name": name,
+                "revenue": float(revenue or 0),
+                "reservations": int(count or 0)
+            }
+            for platform_id, name, revenue, count in rows
+        ]
+    
+    # Daily stats (일별 집계) 관련 메서드
+    def _reservation_contribution(self, reservation, room_type: str = None) -> Dict[Tuple, Dict]:
+        """예약 객체의 daily_stats 기여분 (room_type을 주면 객실 조회 생략)"""
+        if room_type is None:
+            room = self.db.query(Room).filter(Room.id == reservation.room_id).first()
+            room_type = room.room_type if room else ''
+        return daily_stats_contribution(
+            parse_date(reservation.check_in),
+            parse_date(reservation.check_out),
+            reservation.total_price,
+            reservation.status,
+            room_type,
+            reservation.platform_id
+        )
+    
+    def _apply_daily_stats(self, added: Dict[Tuple, Dict], removed: Dict[Tuple, Dict] = None):
+        """daily_stats에 증감값 반영 (added - removed, 커밋은 호출자가 수행)"""
+        deltas: Dict[Tuple, Dict] = {}
+        for contribution, sign in ((added or {}, 1), (removed or {}, -1)):
+            for key, values in contribution.items():
+                entry = deltas.setdefault(key, {"room_nights": 0, "revenue": 0.0, "arrivals": 0, "departures": 0})
+                for field, value in values.items():
+                    entry[field] += sign * value
+        
+        rows = [
+            {"stat_date": key[0], "room_type": key[1], "platform_id": key[2], **values}
+            for key, values in deltas.items()
+            if any(values.values())
+        ]
+        if not rows:
+            return
+        
+        table = DailyStat.__table__
+        fields = ["room_nights", "revenue", "arrivals", "departures"]
+        dialect = self.db.get_bind().dialect.name
+        # 동시 요청에서도 안전하도록 DB의 upsert로 원자적으로 증감
+        if dialect == 'mysql':
+            stmt = mysql_insert(table)
+            stmt = stmt.on_duplicate_key_update(
+                {f: table.c[f] + stmt.inserted[f] for f in fields}
+            )
+            self.db.execute(stmt, rows)
+        elif dialect == 'sqlite':
+            stmt = sqlite_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.stat_date, table.c.room_type, table.c.platform_id],
+                set_={f: table.c[f] + stmt.excluded[f] for f in fields}
+            )
+            self.db.execute(stmt, rows)
+        else:
+            for row in rows:
+                stat = self.db.get(DailyStat, (row["stat_date"], row["room_type"], row["platform_id"]))
+                if stat is None:
+                    self.db.add(DailyStat(**row))
+                else:
+                    for f in fields:
+                        setattr(stat, f, getattr(stat, f) + row[f])
+    
+    @writes('daily_stats')
+    def rebuild_daily_stats(self, start=None, end=None) -> int:
+        """daily_stats 재계산 (기간을 주면 해당 기간만), 처리한 예약 수 반환"""
+        start_date = parse_date(start) if start else None
+        end_date = parse_date(end) if end else None
+        
+        delete_query = self.db.query(DailyStat)
+        if start_date:
+            delete_query = delete_query.filter(DailyStat.stat_date >= start_date)
+        if end_date:
+            delete_query = delete_query.filter(DailyStat.stat_date <= end_date)
+        delete_query.delete(synchronize_session=False)
+        
+        query = self.db.query(
+            Reservation.check_in, Reservation.check_out, Reservation.total_price,
+            Reservation.status, Reservation.platform_id, Room.room_type
+        ).outerjoin(Room, Room.id == Reservation.room_id).filter(
+            Reservation.status.notin_(NON_SELLING_STATUSES)
+        )
+        if start_date:
+            query = query.filter(Reservation.check_out >= start_date)
+        if end_date:
+            query = query.filter(Reservation.check_in <= end_date)
+        
+        totals: Dict[Tuple, Dict] = {}
+        processed = 0
+        for check_in, check_out, total_price, status, platform_id, room_type in query.yield_per(1000):
+            contribution = daily_stats_contribution(
+                parse_date(check_in), parse_date(check_out), total_price, status, room_type or '', platform_id
+            )
+            for key, values in contribution.items():
+                # 재계산 기간 밖의 날짜는 건드리지 않음
+                if (start_date and key[0] < start_date) or (end_date and key[0] > end_date):
+                    continue
+                entry = totals.setdefault(key, {"room_nights": 0, "revenue": 0.0, "arrivals": 0, "departures": 0})
+                for field, value in values.items():
+                    entry[field] += value
+            processed += 1
+        
+        self._apply_daily_stats(totals)
+        self.db.commit()
+        return processed
+    
+    def get_daily_stats(self, start, end, room_type: str = None, platform_id: str = None) -> Dict[str, Dict]:
+        """daily_stats에서 날짜별 합계 조회 (객실 타입/플랫폼 필터 옵션)"""
+        query = self.db.query(
+            DailyStat.stat_date,
+            func.sum(DailyStat.room_nights),
+            func.sum(DailyStat.revenue),
+            func.sum(DailyStat.arrivals),
+            func.sum(DailyStat.departures)
+        ).filter(
+            DailyStat.stat_date >= parse_date(start),
+            DailyStat.stat_date <= parse_date(end)
+        )
+        if room_type:
+            query = query.filter(DailyStat.room_type == room_type)
+        if platform_id:
+            query = query.filter(DailyStat.platform_id == int(platform_id))
+        
+        stats: Dict[str, Dict] = {}
+        for day, room_nights, revenue, arrivals, departures in query.group_by(DailyStat.stat_date).all():
+            stats[str(day)] = {
+                "room_nights": int(room_nights or 0),
+                "revenue": round(float(revenue or 0), 2),
+                "arrivals": int(arrivals or 0),
+                "departures": int(departures or 0)
+            }
+        return stats
+    
+    def get_stay_revenue_rows(self, start, end) -> List[Tuple]:
+        """기간과 숙박일이 겹치는 판매 예약 (check_in, check_out, total_price, room_type, platform_id) - KPI 계산용"""
+        stmt = select(
+            Reservation.check_in, Reservation.check_out, Reservation.total_price,
+            Room.room_type, Reservation.platform_id
+        ).outerjoin(
+            Room, Room.id == Reservation.room_id
+        ).where(
+            Reservation.status.notin_(NON_SELLING_STATUSES),
+            Reservation.check_in <= parse_date(end),
+            Reservation.check_out >= parse_date(start)
+        )
+        return [tuple(row) for row in self.db.execute(stmt)]
     
     # Admins 관련 메서드
     def get_admins(self) -> List[Dict]:
-        """모든 관리자 조회"""
-        admins = self.db.query(Admin).all()
-        return [self._to_dict(a) for a in admins]
+        """모든 관리자 조회 (참조 데이터 캐시 사용)"""
+        return reference_cache.get_or_load(
+            ADMINS_CACHE_KEY, lambda: [self._to_dict(a) for a in self.db.query(Admin).all()]
+        )
+    
+    def list_admins(self, limit: int = None, after: str = None, order: str = 'asc',
+                    role: str = None, is_active: bool = None) -> Tuple[List[Dict], Optional[str]]:
+        """관리자 목록 (키셋 페이지네이션, 역할/활성 필터), (목록, 다음 커서) 반환"""
+        query = self.db.query(Admin)
+        if role:
+            query = query.filter(Admin.role == role)
+        if is_active is not None:
+            query = query.filter(Admin.is_active == is_active)
+        
+        admins, next_cursor = keyset_page(query, Admin.id, Admin.id, order, limit, after)
+        return [self._to_dict(a) for a in admins], next_cursor
     
     def get_admin(self, admin_id: str) -> Optional[Dict]:
         """관리자 조회"""
         admin = self.db.query(Admin).filter(Admin.id == int(admin_id)).first()
         return self._to_dict(admin) if admin else None
     
+    @writes('admins')
     def create_admin(self, admin: Dict) -> Dict:
         """관리자 생성"""
         new_admin = Admin(
@@ -259,9 +955,11 @@ class MySQLDB:
         )
         self.db.add(new_admin)
         self.db.commit()
+        reference_cache.invalidate(ADMINS_CACHE_KEY)
         self.db.refresh(new_admin)
         return self._to_dict(new_admin)
     
+    @writes('admins')
     def delete_admin(self, admin_id: str):
         """관리자 삭제"""
         admin = self.db.query(Admin).filter(Admin.id == int(admin_id)).first()
@@ -270,8 +968,58 @@ class MySQLDB:
         
         self.db.delete(admin)
         self.db.commit()
+        reference_cache.invalidate(ADMINS_CACHE_KEY)
     
     # Notes 관련 메서드
+    def _note_to_dict(self, note) -> Dict:
+        """노트 객체를 딕셔너리로 변환 (admin_id, reservation_id는 문자열)"""
+        return self._normalize_note_dict(self._to_dict(note))
+    
+    def _normalize_note_dict(self, note_dict: Optional[Dict]) -> Optional[Dict]:
+        """노트 딕셔너리의 admin_id, reservation_id를 문자열로 변환"""
+        if note_dict:
+            note_dict['admin_id'] = str(note_dict.get('admin_id', ''))
+            if note_dict.get('reservation_id'):
+                note_dict['reservation_id'] = str(note_dict['reservation_id'])
+            else:
+                note_dict['reservation_id'] = ''
+        return note_dict
+    
+    def list_notes(self, limit: int = None, after: str = None, sort: str = 'id', order: str = 'asc',
+                   room_id: str = None, progress: str = None, note_type: str = None,
+                   status: str = None, fields: Optional[Tuple[str, ...]] = None) -> Tuple[List[Dict], Optional[str]]:
+        """노트 목록 (키셋 페이지네이션, 객실/진행 상태/타입/상태 필터), (목록, 다음 커서) 반환
+        
+        progress가 None이면 필터 없음, 빈 문자열이면 progress가 없는 노트만
+        fields가 있으면 해당 컬럼(과 id, 정렬 컬럼)만 조회합니다. 이때 제목과 설명이 모두 빈 노트는
+        API에서 거르는 대신 쿼리에서 제외합니다 (두 컬럼을 읽지 않기 위해).
+        """
+        sort_columns = {'id': RoomNote.id, 'created_at': RoomNote.created_at}
+        if sort not in sort_columns:
+            raise InvalidCursorError(f"Invalid sort key: {sort}. Must be one of: {', '.join(sort_columns)}")
+        
+        if fields:
+            query = self.db.query(*self._projection(RoomNote, fields, 'id', sort)).filter(
+                or_(func.coalesce(RoomNote.title, '') != '', func.coalesce(RoomNote.description, '') != '')
+            )
+        else:
+            query = self.db.query(RoomNote)
+        if room_id:
+            query = query.filter(RoomNote.room_id == room_id)
+        if progress == '':
+            query = query.filter(RoomNote.progress.is_(None))
+        elif progress is not None:
+            query = query.filter(RoomNote.progress == progress)
+        if note_type:
+            query = query.filter(RoomNote.note_type == note_type)
+        if status:
+            query = query.filter(RoomNote.status == status)
+        
+        notes, next_cursor = keyset_page(query, sort_columns[sort], RoomNote.id, order, limit, after)
+        if fields:
+            return [self._normalize_note_dict(self._row_to_dict(n)) for n in notes], next_cursor
+        return [self._note_to_dict(n) for n in notes], next_cursor
+    
     def get_notes(self) -> List[Dict]:
         """모든 노트 조회"""
         notes = self.db.query(RoomNote).all()
@@ -317,6 +1065,7 @@ class MySQLDB:
             result.append(note_dict)
         return result
     
+    @writes('room_notes')
     def create_note(self, note: Dict) -> Dict:
         """노트 생성"""
         # admin_id를 이름에서 ID로 변환 (필요시)
@@ -355,8 +1104,10 @@ class MySQLDB:
             note_dict['reservation_id'] = str(note_dict['reservation_id'])
         else:
             note_dict['reservation_id'] = ''
+        event_bus.publish(NOTE_CREATED, note_dict)
         return note_dict
     
+    @writes('room_notes')
     def update_note_progress(self, note_id: str, progress: str):
         """노트 진행 상태 업데이트"""
         note = self.db.query(RoomNote).filter(RoomNote.id == int(note_id)).first()
@@ -367,7 +1118,10 @@ class MySQLDB:
         if progress == 'finished':
             note.status = 'completed'
             note.completed_at = datetime.now()
+        # 커밋 후 다시 조회하지 않도록 세션 안의 값으로 이벤트 생성
+        note_event = self._note_to_dict(note)
         self.db.commit()
+        event_bus.publish(NOTE_UPDATED, note_event)
     
     def get_notes_by_progress(self, progress: str = None) -> List[Dict]:
         """진행 상태별 노트 조회"""
@@ -1,7 +1,7 @@
 """
 SQLAlchemy 데이터베이스 모델 정의
 """
-from sqlalchemy import Column, Integer, String, Float, Date, DateTime, Boolean, Text, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Date, DateTime, Boolean, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -19,6 +19,11 @@ class Customer(Base):
     
     # 관계
     reservations = relationship("Reservation", back_populates="customer")
+    
+    # 인덱스 (이름 접두어 검색/정렬)
+    __table_args__ = (
+        Index("ix_customers_name", "name"),
+    )
 
 
 class BookingPlatform(Base):
@@ -71,6 +76,16 @@ class Reservation(Base):
     room = relationship("Room", back_populates="reservations")
     platform = relationship("BookingPlatform", back_populates="reservations")
     room_notes = relationship("RoomNote", back_populates="reservation")
+    
+    # 인덱스 (중복 예약 체크, 기간 조회, 상태/고객/예약번호 조회)
+    __table_args__ = (
+        Index("ix_reservations_room_dates", "room_id", "check_in", "check_out"),
+        Index("ix_reservations_check_in", "check_in"),
+        Index("ix_reservations_check_out", "check_out"),
+        Index("ix_reservations_status", "status"),
+        Index("ix_reservations_customer_id", "customer_id"),
+        Index("ix_reservations_booking_reference", "booking_reference"),
+    )
 
 
 class Admin(Base):
@@ -107,5 +122,60 @@ class RoomNote(Base):
     # 관계
     admin = relationship("Admin", back_populates="room_notes")
     reservation = relationship("Reservation", back_populates="room_notes")
+    
+    # 인덱스 (알람 조회, progress 필터, 객실별 조회)
+    __table_args__ = (
+        Index("ix_room_notes_type_status", "note_type", "status"),
+        Index("ix_room_notes_progress", "progress"),
+        Index("ix_room_notes_room_id", "room_id"),
+        Index("ix_room_notes_created_at", "created_at"),
+    )
+
+
+class RoomNight(Base):
+    """객실-박 원장 테이블 (객실별 숙박일 1행, 중복 예약 방지용)
+    
+    (room_id, night)가 기본 키이므로 같은 객실의 같은 날짜를 두 예약이 동시에
+    차지하려 하면 DB 제약 조건 위반으로 하나만 성공합니다.
+    """
+    __tablename__ = "room_nights"
+    
+    room_id = Column(Integer, ForeignKey("rooms.id"), primary_key=True, autoincrement=False)
+    night = Column(Date, primary_key=True)
+    reservation_id = Column(Integer, ForeignKey("reservations.id"), nullable=False, index=True)
+
+
+class DailyStat(Base):
+    """일별 판매 집계 테이블 (날짜 × 객실 타입 × 플랫폼)
+    
+    예약 생성/상태 변경 시 같은 트랜잭션에서 증감되며,
+    rebuild_daily_stats.py로 전체 또는 기간별 재계산할 수 있습니다.
+    """
+    __tablename__ = "daily_stats"
+    
+    stat_date = Column(Date, primary_key=True)
+    room_type = Column(String(100), primary_key=True)
+    platform_id = Column(Integer, primary_key=True, autoincrement=False)
+    room_nights = Column(Integer, nullable=False, default=0)  # 판매된 객실-박 수
+    revenue = Column(Float, nullable=False, default=0.0)  # 숙박일별로 나눈 매출
+    arrivals = Column(Integer, nullable=False, default=0)  # 체크인 수
+    departures = Column(Integer, nullable=False, default=0)  # 체크아웃 수
+
+
+class TableVersion(Base):
+    """테이블 버전 (쓰기마다 증가, ETag/캐시 무효화에 사용 - app/versions.py)"""
+    __tablename__ = "table_versions"
+    
+    table_name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+
+class SchemaMigration(Base):
+    """스키마 마이그레이션 버전 테이블 (migrate_db.py에서 사용)"""
+    __tablename__ = "schema_migrations"
+    
+    version = Column(Integer, primary_key=True, autoincrement=False)
+    description = Column(String(255), nullable=False)
+    applied_at = Column(DateTime, server_default=func.now())
 
 
@@ -0,0 +1,131 @@
+"""
+인프로세스 이벤트 버스 (/api/events SSE 스트림에서 사용)
+
+MySQLDB 쓰기 경로가 커밋 후 publish()로 이벤트를 보내면, 구독 중인 클라이언트마다
+가진 제한된 크기의 큐로 전달됩니다. 최근 이벤트는 링 버퍼에 남겨 두어
+재접속한 클라이언트가 Last-Event-ID 이후 이벤트를 다시 받을 수 있습니다.
+
+느린 클라이언트의 큐가 가득 차면 그 클라이언트에게는 더 넣지 않고(발행자는 막히지 않음)
+표시만 해 두었다가, 클라이언트가 따라잡을 때 링 버퍼에서 빠진 이벤트를 다시 보냅니다.
+"""
+import asyncio
+import itertools
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
+
+
+# 이벤트 종류
+ROOM_STATUS_CHANGED = "room_status"
+NOTE_CREATED = "note_created"
+NOTE_UPDATED = "note_updated"
+
+EVENT_TYPES = [ROOM_STATUS_CHANGED, NOTE_CREATED, NOTE_UPDATED]
+
+# 재전송할 수 없을 만큼 오래된 Last-Event-ID이면 클라이언트에 목록 재조회를 요청
+RESET_EVENT = "reset"
+
+
+class Subscription:
+    """클라이언트 1개의 구독 (이벤트 루프 안에서만 큐를 읽음)"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int, types: Optional[Set[str]] = None):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.types = types
+        # 큐가 가득 차서 이벤트를 놓친 상태
+        self.overflowed = False
+
+    def wants(self, event: Dict) -> bool:
+        return self.types is None or event["type"] in self.types
+
+    def _deliver(self, event: Dict):
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class EventBus:
+    """발행/구독 버스 (publish는 어느 스레드에서 호출해도 됨)"""
+
+    def __init__(self, buffer_size: int = 1000, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._buffer: Deque[Dict] = deque(maxlen=buffer_size)
+        self._subscribers: Set[Subscription] = set()
+        self._dropped = 0
+
+    def publish(self, event_type: str, data: Dict) -> Dict:
+        """이벤트 발행 (링 버퍼에 저장 후 구독자 큐에 전달)"""
+        with self._lock:
+            event = {"id": next(self._ids), "type": event_type, "data": data, "time": time.time()}
+            self._buffer.append(event)
+            subscribers = [s for s in self._subscribers if s.wants(event)]
+
+        for sub in subscribers:
+            try:
+                sub.loop.call_soon_threadsafe(sub._deliver, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 닫힘
+                self.unsubscribe(sub)
+        return event
+
+    def subscribe(self, types: Optional[Set[str]] = None) -> Subscription:
+        """현재 이벤트 루프에서 구독 시작"""
+        sub = Subscription(asyncio.get_running_loop(), self.queue_size, types)
+        with self._lock:
+            self._subscribers.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def last_id(self) -> int:
+        """마지막으로 발행된 이벤트 id (없으면 0)"""
+        with self._lock:
+            return self._buffer[-1]["id"] if self._buffer else 0
+
+    def replay(self, after_id: int, types: Optional[Set[str]] = None) -> Optional[List[Dict]]:
+        """after_id 이후 이벤트 목록 (버퍼에서 이미 밀려나 이어 줄 수 없으면 None)"""
+        with self._lock:
+            if not self._buffer:
+                return [] if after_id == 0 else None
+            oldest = self._buffer[0]["id"]
+            newest = self._buffer[-1]["id"]
+            # 다른 프로세스(재시작 전)의 id이거나 버퍼보다 오래된 id
+            if after_id > newest or after_id < oldest - 1:
+                return None
+            return [e for e in self._buffer if e["id"] > after_id and (types is None or e["type"] in types)]
+
+    def catch_up(self, sub: Subscription, after_id: int) -> Optional[List[Dict]]:
+        """큐가 넘친 구독자를 링 버퍼로 따라잡게 함 (이후 실시간 전달 재개)"""
+        # 이벤트 루프 스레드에서 호출되므로 그 사이 새 _deliver는 실행되지 않음
+        events = self.replay(after_id, sub.types)
+        while not sub.queue.empty():
+            sub.queue.get_nowait()
+        sub.overflowed = False
+        with self._lock:
+            self._dropped += 1
+        return events
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "buffered": len(self._buffer),
+                "last_id": self._buffer[-1]["id"] if self._buffer else 0,
+                "overflows": self._dropped,
+            }
+
+
+event_bus = EventBus(
+    buffer_size=int(os.getenv("EVENT_BUFFER_SIZE", "1000")),
+    queue_size=int(os.getenv("EVENT_QUEUE_SIZE", "100")),
+)
@@ -0,0 +1,37 @@
+"""
+희소 필드 선택 (`?fields=id,room_id,check_in`)
+
+목록 API에서 필요한 필드만 요청하면 DB에서도 해당 컬럼만 조회하고(notes, description 같은 TEXT 컬럼 제외)
+응답에도 요청한 필드만 담습니다. 필드 이름은 응답 모델(pydantic) 필드로 검증합니다.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+
+class InvalidFieldsError(ValueError):
+    """응답 모델에 없는 필드 이름"""
+    pass
+
+
+def parse_fields(fields: Optional[str], model: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """쉼표로 구분한 필드 목록을 모델 필드 순서의 튜플로 변환 (없으면 None = 전체 필드)"""
+    if fields is None or not fields.strip():
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - model.model_fields.keys())
+    if unknown:
+        raise InvalidFieldsError(
+            f"Invalid fields: {', '.join(unknown)}. Must be one of: {', '.join(model.model_fields)}"
+        )
+    return tuple(name for name in model.model_fields if name in requested)
+
+
+def project(items: Iterable, fields: Tuple[str, ...]) -> List[Dict]:
+    """모델 또는 dict 목록에서 요청한 필드만 남김 (모델은 JSON 형식으로 덤프)"""
+    include = set(fields)
+    return [
+        item.model_dump(mode="json", include=include) if isinstance(item, BaseModel)
+        else {name: item[name] for name in fields}
+        for item in items
+    ]
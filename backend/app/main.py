@@ -1,6 +1,16 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import reservations, rooms, dashboard, calendar, revenue, customers, checkinout, cleaning, reports, admins, room_notes
+from sqlalchemy import text
+from app.routers import reservations, rooms, dashboard, calendar, revenue, customers, checkinout, cleaning, reports, admins, room_notes, availability, events
+from app.database import async_engine
+from app.pool_stats import acquire_wait_histogram, pool_status
+from app.pagination import NEXT_CURSOR_HEADER
+from app.cache import reference_cache, dashboard_cache
+from app.events import event_bus
+from app.report_jobs import report_jobs
+from app.responses import OrjsonResponse
+from app.compression import CompressionMiddleware, compressed_body_cache
+from app.daily_report import daily_report_cache
 import os
 from dotenv import load_dotenv
 
@@ -9,7 +19,9 @@ load_dotenv()
 app = FastAPI(
     title="Hotel Management API",
     description="호텔 관리자 페이지 API - 여러 예약 플랫폼 통합 관리",
-    version="1.0.0"
+    version="1.0.0",
+    # 모든 JSON 응답을 orjson으로 직렬화
+    default_response_class=OrjsonResponse
 )
 
 # CORS 설정
@@ -20,6 +32,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
+)
+
+# 응답 압축 (Brotli/gzip) - SSE 이벤트 스트림과 파일 내보내기는 제외
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+    excluded_paths=["/api/events", "/api/reports"],
+    cache=compressed_body_cache,
 )
 
 # 라우터 등록
@@ -34,6 +55,8 @@ app.include_router(cleaning.router)
 app.include_router(reports.router)
 app.include_router(admins.router)
 app.include_router(room_notes.router)
+app.include_router(availability.router)
+app.include_router(events.router)
 
 
 @app.get("/")
@@ -49,3 +72,46 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+
+@app.get("/health/db")
+async def db_health_check():
+    """DB 연결 및 커넥션 풀 상태"""
+    status = "healthy"
+    error = None
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception as e:
+        status = "unhealthy"
+        error = str(e)
+
+    body = {
+        "status": status,
+        "pool": pool_status(async_engine.pool),
+        "acquire_wait_ms": acquire_wait_histogram.snapshot()
+    }
+    if error:
+        body["error"] = error
+    return OrjsonResponse(status_code=200 if status == "healthy" else 503, content=body)
+
+
+@app.get("/health/cache")
+async def cache_health_check():
+    """참조 데이터 캐시, 대시보드 캐시와 압축 응답 캐시 적중/실패 통계"""
+    return {
+        "reference_cache": reference_cache.stats(),
+        "dashboard_cache": dashboard_cache.stats(),
+        "compressed_responses": compressed_body_cache.stats(),
+    }
+
+
+@app.get("/health/events")
+async def events_health_check():
+    """이벤트 버스 구독자/버퍼 상태"""
+    return event_bus.stats()
+
+
+@app.get("/health/jobs")
+async def jobs_health_check():
+    """리포트 작업 큐 및 일일 운영 리포트 캐시 상태"""
+    return {**report_jobs.stats(), "daily_report": daily_report_cache.stats()}
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
+from typing_extensions import TypedDict
 from datetime import date, datetime
 
 
@@ -42,6 +43,18 @@ class Reservation(BaseModel):
     created_at: Optional[datetime] = None
 
 
+# Reservation과 같은 필드의 dict 타입 (utils.reservation_rows_to_records 결과의 타입, CustomerReservations 응답 스키마)
+# 예약 목록 응답은 이 타입으로 검증하지 않고 direct_json_response로 바로 직렬화합니다.
+ReservationRecord = TypedDict(
+    "ReservationRecord", {name: field.annotation for name, field in Reservation.model_fields.items()}
+)
+
+
+class CustomerReservations(TypedDict):
+    customer_id: str
+    reservations: List[ReservationRecord]
+
+
 class ReservationCreate(BaseModel):
     customer_id: str
     room_id: str
@@ -93,3 +106,8 @@ class RoomNoteCreate(BaseModel):
     reservation_id: Optional[str] = None
     progress: Optional[str] = None  # confirm, In progress, finished
 
+
+class ReportJobCreate(BaseModel):
+    format: str = "xlsx"  # csv, xlsx, pdf, parquet
+    start_date: Optional[str] = None  # 체크인 기준 (start_date, end_date 모두 있을 때만 적용)
+    end_date: Optional[str] = None
@@ -0,0 +1,85 @@
+"""
+키셋(커서) 페이지네이션 유틸리티
+
+커서는 마지막으로 반환한 행의 (정렬 컬럼 값, id)를 base64로 인코딩한 문자열입니다.
+OFFSET 대신 `(정렬 컬럼, id) > (커서 값)` 조건으로 다음 페이지를 조회하므로
+페이지가 뒤로 가도 인덱스 범위 조회 비용이 일정합니다.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import and_, or_
+
+# 응답 헤더 이름 (다음 페이지 커서)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursorError(ValueError):
+    """해석할 수 없는 커서 또는 정렬 키"""
+    pass
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """(정렬 값, id)를 커서 문자열로 변환"""
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, column) -> Tuple[Any, int]:
+    """커서 문자열을 (정렬 값, id)로 변환 (정렬 컬럼 타입에 맞게 값 복원)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        python_type = column.type.python_type
+        if sort_value is not None:
+            if python_type is datetime:
+                sort_value = datetime.fromisoformat(sort_value)
+            elif python_type is date:
+                sort_value = date.fromisoformat(sort_value)
+        return sort_value, int(row_id)
+    except Exception:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}")
+
+
+def keyset_page(query, sort_column, id_column, order: str = "asc", limit: Optional[int] = None,
+                after: Optional[str] = None) -> Tuple[List[Any], Optional[str]]:
+    """정렬/커서 조건을 적용해 한 페이지 조회, (행 목록, 다음 커서) 반환
+
+    limit이 없으면 전체를 반환하고 다음 커서는 None.
+    """
+    if order not in ("asc", "desc"):
+        raise InvalidCursorError(f"Invalid order: {order}. Must be 'asc' or 'desc'")
+    descending = order == "desc"
+    same_column = sort_column is id_column
+
+    if after:
+        sort_value, row_id = decode_cursor(after, sort_column)
+        if same_column:
+            query = query.filter(id_column < row_id if descending else id_column > row_id)
+        elif descending:
+            query = query.filter(or_(sort_column < sort_value, and_(sort_column == sort_value, id_column < row_id)))
+        else:
+            query = query.filter(or_(sort_column > sort_value, and_(sort_column == sort_value, id_column > row_id)))
+
+    if same_column:
+        ordering = [id_column.desc() if descending else id_column.asc()]
+    else:
+        ordering = [sort_column.desc(), id_column.desc()] if descending else [sort_column.asc(), id_column.asc()]
+    query = query.order_by(*ordering)
+
+    if not limit:
+        return query.all(), None
+
+    limit = min(int(limit), MAX_PAGE_SIZE)
+    # 다음 페이지 존재 여부 확인용으로 1행 더 조회
+    rows = query.limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
@@ -0,0 +1,85 @@
+"""
+커넥션 풀 모니터링 (/health/db 에서 사용)
+"""
+import threading
+from typing import Dict, List
+
+
+# 커넥션 획득 대기 시간 히스토그램 버킷 상한 (ms)
+WAIT_BUCKETS_MS = [1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 30000]
+
+
+class WaitHistogram:
+    """커넥션 획득 대기 시간 히스토그램"""
+
+    def __init__(self, buckets: List[float] = None):
+        self.buckets = list(buckets or WAIT_BUCKETS_MS)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """누적 값 초기화"""
+        with self._lock:
+            self._counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+            self._count = 0
+            self._sum_ms = 0.0
+            self._max_ms = 0.0
+            self._timeouts = 0
+
+    def observe(self, wait_ms: float):
+        """대기 시간 1건 기록"""
+        with self._lock:
+            index = len(self.buckets)
+            for i, upper in enumerate(self.buckets):
+                if wait_ms <= upper:
+                    index = i
+                    break
+            self._counts[index] += 1
+            self._count += 1
+            self._sum_ms += wait_ms
+            self._max_ms = max(self._max_ms, wait_ms)
+
+    def observe_timeout(self):
+        """풀 타임아웃으로 커넥션을 얻지 못한 경우 기록"""
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> Dict:
+        """현재 히스토그램 값 (버킷은 누적 카운트)"""
+        with self._lock:
+            cumulative = []
+            running = 0
+            for upper, count in zip(self.buckets + ["+Inf"], self._counts):
+                running += count
+                cumulative.append({"le_ms": upper, "count": running})
+            return {
+                "count": self._count,
+                "sum_ms": round(self._sum_ms, 3),
+                "avg_ms": round(self._sum_ms / self._count, 3) if self._count else 0.0,
+                "max_ms": round(self._max_ms, 3),
+                "timeouts": self._timeouts,
+                "buckets": cumulative,
+            }
+
+
+# async 세션 dependency에서 기록하는 전역 히스토그램
+acquire_wait_histogram = WaitHistogram()
+
+
+def pool_status(pool) -> Dict:
+    """QueuePool 사용 현황 (checked-out / idle / overflow)"""
+    def _value(name):
+        method = getattr(pool, name, None)
+        return method() if callable(method) else None
+
+    # QueuePool.overflow()는 풀이 다 차기 전까지 음수 (-pool_size부터 시작)
+    overflow = _value("overflow")
+    return {
+        "pool_class": type(pool).__name__,
+        "size": _value("size"),
+        "checked_out": _value("checkedout"),
+        "idle": _value("checkedin"),
+        "overflow": max(overflow, 0) if overflow is not None else None,
+        "max_overflow": getattr(pool, "_max_overflow", None),
+        "timeout": _value("timeout"),
+    }
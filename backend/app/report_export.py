@@ -0,0 +1,189 @@
+"""
+예약 리포트 파일 생성 (CSV / Excel / PDF) 및 일일 운영 리포트 PDF 렌더링
+
+스트리밍 조회 배치(MySQLDB.reservation_export_select 컬럼 순서)를 받아 파일에 이어 쓰는
+writer 클래스들입니다. 모두 동기 코드이므로 이벤트 루프 밖(스레드풀)에서 호출합니다.
+/api/reports 다운로드와 리포트 작업(report_jobs)에서 함께 사용합니다.
+"""
+import csv
+from typing import Dict, Iterator, List, Sequence
+
+
+# 예약 리포트 컬럼 (모든 형식 공통)
+REPORT_HEADERS = ["ID", "Customer ID", "Room ID", "Platform", "Check-in", "Check-out",
+                  "Guests", "Total Price", "Status", "Booking Reference", "Notes"]
+
+
+def report_rows(rows: Sequence[Sequence], platform_map: Dict[str, str]) -> Iterator[List]:
+    """스트리밍 조회 행을 리포트 행으로 변환 (id는 문자열, 날짜는 YYYY-MM-DD)"""
+    for (reservation_id, customer_id, room_id, platform_id, check_in, check_out,
+         guests, total_price, status, booking_reference, notes) in rows:
+        platform_id = str(platform_id)
+        yield [
+            str(reservation_id), str(customer_id), str(room_id),
+            platform_map.get(platform_id, f"Platform {platform_id}"),
+            check_in.isoformat() if check_in else '',
+            check_out.isoformat() if check_out else '',
+            guests, total_price, status, booking_reference, notes
+        ]
+
+
+class CsvReportWriter:
+    """CSV 리포트 (UTF-8)"""
+
+    def __init__(self, path: str, platform_map: Dict[str, str]):
+        self.platform_map = platform_map
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(REPORT_HEADERS)
+
+    def write_rows(self, rows: Sequence[Sequence]):
+        self._writer.writerows(report_rows(rows, self.platform_map))
+
+    def close(self):
+        self._file.close()
+
+
+class XlsxReportWriter:
+    """Excel 리포트 (write-only 워크시트: 추가한 행은 바로 임시 파일로 기록)"""
+
+    def __init__(self, sink, platform_map: Dict[str, str]):
+        from openpyxl import Workbook
+
+        self.platform_map = platform_map
+        self._sink = sink
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("Reservations")
+        self._sheet.append(REPORT_HEADERS)
+
+    def write_rows(self, rows: Sequence[Sequence]):
+        for row in report_rows(rows, self.platform_map):
+            self._sheet.append(row)
+
+    def close(self):
+        self._workbook.save(self._sink)
+
+
+class PdfReportWriter:
+    """PDF 리포트 (A4 가로, 페이지마다 헤더 반복)"""
+
+    # 컬럼별 x 위치 (pt)
+    COLUMN_X = [30, 70, 120, 165, 245, 315, 385, 425, 490, 560, 660]
+    ROW_HEIGHT = 14
+    FONT_SIZE = 8
+
+    def __init__(self, path: str, platform_map: Dict[str, str], title: str = "Reservations"):
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.pdfgen import canvas
+
+        self.platform_map = platform_map
+        self.title = title
+        self._width, self._height = landscape(A4)
+        self._canvas = canvas.Canvas(path, pagesize=landscape(A4))
+        self._page = 0
+        self._new_page()
+
+    def _new_page(self):
+        if self._page:
+            self._canvas.showPage()
+        self._page += 1
+        c = self._canvas
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(30, self._height - 30, self.title)
+        c.setFont("Helvetica", self.FONT_SIZE)
+        c.drawRightString(self._width - 30, self._height - 30, f"Page {self._page}")
+        self._y = self._height - 55
+        c.setFont("Helvetica-Bold", self.FONT_SIZE)
+        self._draw_row(REPORT_HEADERS)
+        c.line(30, self._y + self.ROW_HEIGHT - 3, self._width - 30, self._y + self.ROW_HEIGHT - 3)
+        c.setFont("Helvetica", self.FONT_SIZE)
+
+    def _draw_row(self, values):
+        for x, value in zip(self.COLUMN_X, values):
+            text = "" if value is None else str(value)
+            # 마지막 컬럼(메모)은 페이지 끝까지, 나머지는 칸 너비에 맞게 자름
+            self._canvas.drawString(x, self._y, text[:60] if x == self.COLUMN_X[-1] else text[:18])
+        self._y -= self.ROW_HEIGHT
+
+    def write_rows(self, rows: Sequence[Sequence]):
+        for row in report_rows(rows, self.platform_map):
+            if self._y < 30:
+                self._new_page()
+            self._draw_row(row)
+
+    def close(self):
+        self._canvas.save()
+
+
+def render_daily_ops_pdf(data: Dict, data_version: str = "") -> bytes:
+    """일일 운영 리포트 PDF 생성 (app.daily_report 프로세스 풀에서 실행, data는 collect_daily_ops_data 결과)
+    
+    캐시된 PDF를 그대로 다시 보내므로 렌더링 시각 대신 데이터 해시(data_version)를 표시합니다.
+    """
+    import io
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import mm
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+    styles = getSampleStyleSheet()
+    output = io.BytesIO()
+    doc = SimpleDocTemplate(output, pagesize=A4, leftMargin=15 * mm, rightMargin=15 * mm,
+                            topMargin=15 * mm, bottomMargin=15 * mm,
+                            title=f"Daily Operations {data['date']}",
+                            # PDF 메타데이터에 생성 시각을 넣지 않음 (같은 데이터 -> 같은 PDF)
+                            invariant=1)
+
+    def _table(headers, rows, widths):
+        if not rows:
+            return Paragraph("None", styles["Normal"])
+        table = Table([headers] + rows, colWidths=widths, repeatRows=1)
+        table.setStyle(TableStyle([
+            ("FONT", (0, 0), (-1, 0), "Helvetica-Bold", 8),
+            ("FONT", (0, 1), (-1, -1), "Helvetica", 8),
+            ("BACKGROUND", (0, 0), (-1, 0), colors.lightgrey),
+            ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ]))
+        return table
+
+    def _cell(value, limit=40):
+        text = "" if value is None else str(value)
+        return text if len(text) <= limit else text[:limit - 1] + "…"
+
+    stay_headers = ["Room", "Guest", "Pax", "Check-in", "Check-out", "Status", "Booking Ref", "Notes"]
+    stay_widths = [16 * mm, 34 * mm, 10 * mm, 20 * mm, 20 * mm, 20 * mm, 26 * mm, 34 * mm]
+
+    def _stay_rows(stays):
+        return [[_cell(s["room"], 8), _cell(s["guest"], 22), s["guests"], s["check_in"], s["check_out"],
+                 _cell(s["status"], 12), _cell(s["booking_reference"], 16), _cell(s["notes"], 24)]
+                for s in stays]
+
+    def _note_rows(notes):
+        return [[_cell(n["room"], 8), _cell(n["title"], 30), _cell(n["description"], 60),
+                 _cell(n["progress"], 12), _cell(n["created_at"], 16)] for n in notes]
+
+    note_headers = ["Room", "Title", "Description", "Progress", "Created"]
+    note_widths = [16 * mm, 45 * mm, 70 * mm, 20 * mm, 29 * mm]
+
+    story = [
+        Paragraph(f"Daily Operations Report - {data['date']}", styles["Title"]),
+        Paragraph(f"Data version {data_version[:12] or '-'} · "
+                  f"{len(data['arrivals'])} arrivals · {len(data['departures'])} departures · "
+                  f"{len(data['cleaning_rooms'])} rooms to clean", styles["Normal"]),
+        Spacer(1, 6 * mm),
+        Paragraph(f"Arrivals ({len(data['arrivals'])})", styles["Heading2"]),
+        _table(stay_headers, _stay_rows(data["arrivals"]), stay_widths),
+        Paragraph(f"Departures ({len(data['departures'])})", styles["Heading2"]),
+        _table(stay_headers, _stay_rows(data["departures"]), stay_widths),
+        Paragraph(f"Housekeeping - rooms to clean ({len(data['cleaning_rooms'])})", styles["Heading2"]),
+        _table(["Room", "Type"], [[r["room"], r["room_type"]] for r in data["cleaning_rooms"]],
+               [30 * mm, 60 * mm]),
+        Paragraph(f"Urgent notes ({len(data['urgent_notes'])})", styles["Heading2"]),
+        _table(note_headers, _note_rows(data["urgent_notes"]), note_widths),
+        Paragraph(f"After-checkout tasks ({len(data['after_checkout_notes'])})", styles["Heading2"]),
+        _table(note_headers, _note_rows(data["after_checkout_notes"]), note_widths),
+    ]
+    doc.build(story)
+    return output.getvalue()
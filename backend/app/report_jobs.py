@@ -0,0 +1,230 @@
+"""
+백그라운드 리포트 작업 큐
+
+큰 내보내기를 요청 안에서 바로 만들지 않고 작업으로 등록한 뒤, 정해진 수의 워커가
+순서대로 처리합니다. 워커는 자체 DB 세션과 전용 스레드풀을 사용하므로 일반 API 요청용
+스레드풀/커넥션을 오래 붙잡지 않습니다. 완성된 파일은 로컬 디스크에 만료 시간까지 보관됩니다.
+
+작업 목록은 프로세스 메모리에 있으므로 재시작하면 진행 중이던 작업은 사라집니다.
+"""
+import asyncio
+import os
+import tempfile
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from app.async_db import AsyncMySQLDB
+
+
+# 형식 -> (media type, 확장자)
+REPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "xlsx": ("application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", "xlsx"),
+    "pdf": ("application/pdf", "pdf"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+# 작업 상태
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class ReportQueueFullError(Exception):
+    """대기 중인 작업이 너무 많음"""
+    pass
+
+
+class ReportJob:
+    """리포트 작업 1건"""
+
+    def __init__(self, report_format: str, start_date: Optional[str], end_date: Optional[str]):
+        self.id = uuid.uuid4().hex
+        self.format = report_format
+        self.start_date = start_date
+        self.end_date = end_date
+        self.status = QUEUED
+        self.processed = 0
+        self.total: Optional[int] = None
+        self.error: Optional[str] = None
+        self.path: Optional[str] = None
+        self.size: Optional[int] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.expires_at: Optional[float] = None
+
+    @property
+    def media_type(self) -> str:
+        return REPORT_FORMATS[self.format][0]
+
+    @property
+    def filename(self) -> str:
+        stamp = time.strftime("%Y%m%d", time.localtime(self.created_at))
+        return f"reservations_{stamp}.{REPORT_FORMATS[self.format][1]}"
+
+    def to_dict(self) -> Dict:
+        percent = None
+        if self.status == DONE:
+            percent = 100.0
+        elif self.total:
+            percent = round(min(self.processed / self.total, 1.0) * 100, 1)
+        elif self.total == 0 and self.status == RUNNING:
+            percent = 0.0
+        return {
+            "id": self.id,
+            "format": self.format,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "status": self.status,
+            "progress": {"processed": self.processed, "total": self.total, "percent": percent},
+            "error": self.error,
+            "size": self.size,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "expires_at": self.expires_at,
+            "download_url": f"/api/reports/jobs/{self.id}/download" if self.status == DONE else None,
+        }
+
+
+class ReportJobManager:
+    """작업 등록/조회와 워커 관리"""
+
+    def __init__(self, workers: int = 2, queue_size: int = 20, ttl: float = 3600, directory: str = None):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.ttl = ttl
+        self.directory = directory or os.path.join(tempfile.gettempdir(), "hotel_report_jobs")
+        self._jobs: Dict[str, ReportJob] = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="report-job")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks = []
+
+    def _ensure_started(self):
+        """현재 이벤트 루프에서 워커 시작 (처음 등록 시 1회)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [loop.create_task(self._worker()) for _ in range(self.workers)]
+        os.makedirs(self.directory, exist_ok=True)
+        self._remove_stale_files()
+
+    def _remove_stale_files(self):
+        """이전 실행에서 남은 만료 파일 삭제"""
+        cutoff = time.time() - self.ttl
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    def purge_expired(self):
+        """만료된 작업과 파일 삭제"""
+        now = time.time()
+        for job in list(self._jobs.values()):
+            if job.expires_at is not None and job.expires_at <= now:
+                self._jobs.pop(job.id, None)
+                if job.path:
+                    try:
+                        os.remove(job.path)
+                    except OSError:
+                        pass
+
+    async def submit(self, report_format: str, start_date: str = None, end_date: str = None) -> ReportJob:
+        """작업 등록 (알 수 없는 형식이면 ValueError, 대기열이 가득 차면 ReportQueueFullError)"""
+        if report_format not in REPORT_FORMATS:
+            raise ValueError(f"Invalid format: {report_format}. Must be one of: {', '.join(REPORT_FORMATS)}")
+        self._ensure_started()
+        self.purge_expired()
+
+        # 기존 다운로드와 같이 시작/종료 날짜가 모두 있을 때만 필터링
+        if not (start_date and end_date):
+            start_date = end_date = None
+        job = ReportJob(report_format, start_date, end_date)
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise ReportQueueFullError("Too many report jobs queued, try again later")
+        self._jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        self.purge_expired()
+        return self._jobs.get(job_id)
+
+    def stats(self) -> Dict:
+        counts = {QUEUED: 0, RUNNING: 0, DONE: 0, FAILED: 0}
+        for job in self._jobs.values():
+            counts[job.status] += 1
+        return {"workers": self.workers, "queue_size": self.queue_size, "jobs": counts}
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _in_executor(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def _run(self, job: ReportJob):
+        job.status = RUNNING
+        job.started_at = time.time()
+        path = os.path.join(self.directory, f"{job.id}.{REPORT_FORMATS[job.format][1]}")
+        try:
+            async with AsyncMySQLDB() as db:
+                job.total = await db.count_reservation_export(job.start_date, job.end_date)
+                writer, rows_stream = await self._open(job, db, path)
+                try:
+                    async for rows in rows_stream:
+                        await self._in_executor(writer.write_rows, rows)
+                        job.processed += len(rows)
+                finally:
+                    await self._in_executor(writer.close)
+            job.path = path
+            job.size = os.path.getsize(path)
+            job.status = DONE
+        except Exception as e:
+            print(f"[REPORT JOB ERROR] Report job {job.id} failed: {e}", file=sys.stderr, flush=True)
+            job.status = FAILED
+            job.error = str(e)
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        finally:
+            job.finished_at = time.time()
+            job.expires_at = job.finished_at + self.ttl
+
+    async def _open(self, job: ReportJob, db: AsyncMySQLDB, path: str):
+        """형식별 writer와 행 스트림"""
+        if job.format == "parquet":
+            from app.parquet_export import ReservationParquetWriter
+            writer = await self._in_executor(ReservationParquetWriter, path)
+            return writer, db.stream_reservation_analytics_rows(job.start_date, job.end_date)
+
+        from app.report_export import CsvReportWriter, XlsxReportWriter, PdfReportWriter
+        writer_class = {"csv": CsvReportWriter, "xlsx": XlsxReportWriter, "pdf": PdfReportWriter}[job.format]
+        platform_map = await db.get_platform_map()
+        writer = await self._in_executor(writer_class, path, platform_map)
+        return writer, db.stream_reservation_rows(job.start_date, job.end_date)
+
+
+report_jobs = ReportJobManager(
+    workers=int(os.getenv("REPORT_JOB_WORKERS", "2")),
+    queue_size=int(os.getenv("REPORT_JOB_QUEUE_SIZE", "20")),
+    ttl=float(os.getenv("REPORT_JOB_TTL", "3600")),
+    directory=os.getenv("REPORT_JOB_DIR") or None,
+)
@@ -0,0 +1,168 @@
+"""
+숙박일 기준 매출 배분과 KPI (ADR, RevPAR, 점유율)
+
+예약 매출을 체크인 날짜에 한꺼번에 잡지 않고 숙박일마다 나눠 배분합니다
+(daily_stats와 같은 규칙: total_price / 박 수, 당일 이용은 체크인 날짜 1박).
+
+예약을 NumPy 배열로 읽은 뒤 (날짜 × 객실 타입 × 플랫폼) 차분 배열에 숙박 시작일 +, 종료일 -를
+더하고 날짜 축으로 누적합을 구하므로, 예약 수와 기간 길이에 비례하는 시간에 계산됩니다.
+(숙박일마다 행을 펼치지 않음)
+
+- 점유율 = 판매 객실-박 / 판매 가능 객실-박
+- ADR = 매출 / 판매 객실-박
+- RevPAR = 매출 / 판매 가능 객실-박
+
+판매 가능 객실-박은 현재 객실 수(타입별) × 일수입니다. 플랫폼별 점유율/RevPAR은
+전체 판매 가능 객실-박에 대한 해당 플랫폼의 기여분입니다.
+"""
+from datetime import date
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+class StayKpis:
+    """기간 내 (날짜 × 객실 타입 × 플랫폼)별 판매 객실-박과 매출"""
+
+    def __init__(self, start: date, days: int, room_types: List[str], platform_ids: List[int],
+                 sold: np.ndarray, revenue: np.ndarray, inventory: np.ndarray):
+        self.start = start
+        self.days = days
+        self.room_types = room_types
+        self.platform_ids = platform_ids
+        self.sold = sold            # (days, room_types, platforms) int64
+        self.revenue = revenue      # (days, room_types, platforms) float64
+        self.inventory = inventory  # (room_types,) 타입별 객실 수
+
+    @property
+    def dates(self) -> np.ndarray:
+        return np.datetime64(self.start, "D") + np.arange(self.days)
+
+    @property
+    def total_rooms(self) -> int:
+        return int(self.inventory.sum())
+
+    def summary(self) -> Dict:
+        """기간 전체 KPI"""
+        return kpi_values(self.sold.sum(), self.revenue.sum(), self.total_rooms * self.days)
+
+    def daily(self) -> List[Dict]:
+        """날짜별 KPI"""
+        sold = self.sold.sum(axis=(1, 2))
+        revenue = self.revenue.sum(axis=(1, 2))
+        return [
+            {"date": str(day), **kpi_values(sold[i], revenue[i], self.total_rooms)}
+            for i, day in enumerate(self.dates)
+        ]
+
+    def by_room_type(self) -> List[Dict]:
+        """객실 타입별 KPI (판매 가능 객실-박 = 해당 타입 객실 수 × 일수)"""
+        sold = self.sold.sum(axis=(0, 2))
+        revenue = self.revenue.sum(axis=(0, 2))
+        return [
+            {"room_type": room_type, "rooms": int(self.inventory[i]),
+             **kpi_values(sold[i], revenue[i], int(self.inventory[i]) * self.days)}
+            for i, room_type in enumerate(self.room_types)
+        ]
+
+    def by_platform(self, platform_map: Dict[str, str]) -> List[Dict]:
+        """플랫폼별 KPI (전체 판매 가능 객실-박 기준 기여분)"""
+        sold = self.sold.sum(axis=(0, 1))
+        revenue = self.revenue.sum(axis=(0, 1))
+        available = self.total_rooms * self.days
+        return [
+            {"platform_id": str(platform_id),
+             "platform": platform_map.get(str(platform_id), f"Platform {platform_id}"),
+             **kpi_values(sold[i], revenue[i], available)}
+            for i, platform_id in enumerate(self.platform_ids)
+        ]
+
+    def monthly(self) -> List[Dict]:
+        """월별 KPI (기간 안에 포함된 일수 기준)"""
+        if not self.days:
+            return []
+        months = self.dates.astype("datetime64[M]")
+        boundaries = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+        sold = np.add.reduceat(self.sold.sum(axis=(1, 2)), boundaries)
+        revenue = np.add.reduceat(self.revenue.sum(axis=(1, 2)), boundaries)
+        day_counts = np.diff(np.r_[boundaries, self.days])
+        result = []
+        for i, first in enumerate(boundaries):
+            month = months[first].astype(object)
+            result.append({
+                "year": month.year,
+                "month": month.month,
+                "days": int(day_counts[i]),
+                **kpi_values(sold[i], revenue[i], self.total_rooms * int(day_counts[i]))
+            })
+        return result
+
+
+def kpi_values(sold, revenue, available) -> Dict:
+    """판매 객실-박/매출/판매 가능 객실-박으로 KPI 계산 (분모가 0이면 None)"""
+    sold = int(sold)
+    revenue = float(revenue)
+    available = int(available)
+    return {
+        "room_nights": sold,
+        "available_room_nights": available,
+        "revenue": round(revenue, 2),
+        "occupancy": round(sold / available, 4) if available else None,
+        "adr": round(revenue / sold, 2) if sold else None,
+        "revpar": round(revenue / available, 2) if available else None,
+    }
+
+
+def compute_stay_kpis(rows: Sequence[Sequence], rooms: Sequence[Dict], start: date, end: date) -> StayKpis:
+    """예약 행 (check_in, check_out, total_price, room_type, platform_id)을 숙박일별로 배분해 집계"""
+    days = max((end - start).days + 1, 0)
+
+    inventory_types = [room.get('room_type') or '' for room in rooms]
+    if rows:
+        check_in, check_out, total_price, room_type, platform_id = zip(*rows)
+    else:
+        check_in = check_out = total_price = room_type = platform_id = ()
+
+    room_types, room_type_index = np.unique(
+        np.array([t or '' for t in room_type] + inventory_types, dtype=object).astype(str), return_inverse=True
+    )
+    inventory = np.bincount(room_type_index[len(rows):], minlength=len(room_types))
+    room_type_index = room_type_index[:len(rows)]
+    platform_ids, platform_index = np.unique(np.array(platform_id, dtype=np.int64), return_inverse=True)
+
+    groups = len(room_types) * len(platform_ids)
+    sold = np.zeros((days, len(room_types), len(platform_ids)), dtype=np.int64)
+    revenue = np.zeros((days, len(room_types), len(platform_ids)), dtype=np.float64)
+
+    if rows and days:
+        # date -> 기간 시작일 기준 일 수 (datetime64 변환보다 ordinal이 훨씬 빠름)
+        origin = start.toordinal()
+        first = np.fromiter((d.toordinal() for d in check_in), dtype=np.int64, count=len(rows)) - origin
+        last = np.fromiter((d.toordinal() for d in check_out), dtype=np.int64, count=len(rows)) - origin
+        # 당일 이용은 1박
+        nights = np.maximum(last - first, 1)
+        nightly = np.array(total_price, dtype=np.float64) / nights
+
+        # 조회 기간으로 자른 숙박 구간 [lo, hi)
+        lo = np.clip(first, 0, days)
+        hi = np.clip(first + nights, 0, days)
+        inside = hi > lo
+        group = (room_type_index * len(platform_ids) + platform_index)[inside]
+        lo, hi, nightly = lo[inside], hi[inside], nightly[inside]
+
+        # 차분 배열: 시작일에 +, 종료일에 - 후 날짜 축 누적합
+        size = (days + 1) * groups
+        starts = lo * groups + group
+        ends = hi * groups + group
+        sold_diff = np.bincount(starts, minlength=size) - np.bincount(ends, minlength=size)
+        revenue_diff = (np.bincount(starts, weights=nightly, minlength=size)
+                        - np.bincount(ends, weights=nightly, minlength=size))
+        shape = (days + 1, len(room_types), len(platform_ids))
+        sold = np.cumsum(sold_diff.reshape(shape), axis=0)[:days]
+        revenue = np.cumsum(revenue_diff.reshape(shape), axis=0)[:days]
+        # 누적합의 부동소수점 잔차 제거 (판매가 없는 칸은 매출 0)
+        revenue = np.where(sold > 0, revenue, 0.0)
+
+    return StayKpis(start, days, [str(t) for t in room_types], [int(p) for p in platform_ids],
+                    sold, revenue, inventory)
+
@@ -1,19 +1,31 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import List, Optional
 from app.models import Admin
-from app.db import MySQLDB
+from app.async_db import AsyncMySQLDB, get_db
+from app.versions import conditional_get
+from app.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, MAX_PAGE_SIZE
 
 router = APIRouter(prefix="/api/admins", tags=["admins"])
 
 
-def get_db():
-    return MySQLDB()
-
-
-@router.get("/", response_model=List[Admin])
-async def get_admins(db: MySQLDB = Depends(get_db)):
-    """모든 관리자 조회"""
-    admins_data = db.get_admins()
+@router.get("/", response_model=List[Admin], dependencies=[Depends(conditional_get("admins"))])
+async def get_admins(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (없으면 전체)"),
+    after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    order: str = Query("asc", description="asc 또는 desc"),
+    role: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    db: AsyncMySQLDB = Depends(get_db)
+):
+    """관리자 목록 조회 (limit/after 커서 페이지네이션, 서버 측 필터)"""
+    try:
+        admins_data, next_cursor = await db.list_admins(limit, after, order, role, is_active)
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     admins = []
     for a in admins_data:
         try:
@@ -32,10 +44,10 @@ async def get_admins(db: MySQLDB = Depends(get_db)):
     return admins
 
 
-@router.get("/{admin_id}", response_model=Admin)
-async def get_admin(admin_id: str, db: MySQLDB = Depends(get_db)):
+@router.get("/{admin_id}", response_model=Admin, dependencies=[Depends(conditional_get("admins"))])
+async def get_admin(admin_id: str, db: AsyncMySQLDB = Depends(get_db)):
     """관리자 상세 조회"""
-    admin_data = db.get_admin(admin_id)
+    admin_data = await db.get_admin(admin_id)
     if not admin_data:
         raise HTTPException(status_code=404, detail="Admin not found")
     
@@ -50,11 +62,11 @@ async def get_admin(admin_id: str, db: MySQLDB = Depends(get_db)):
 
 
 @router.post("/", response_model=Admin)
-async def create_admin(admin: Admin, db: MySQLDB = Depends(get_db)):
+async def create_admin(admin: Admin, db: AsyncMySQLDB = Depends(get_db)):
     """새 관리자 생성"""
     try:
         admin_dict = admin.dict(exclude={'id', 'is_active'})
-        new_admin = db.create_admin(admin_dict)
+        new_admin = await db.create_admin(admin_dict)
         
         return Admin(
             id=new_admin.get('id'),
@@ -70,16 +82,16 @@ async def create_admin(admin: Admin, db: MySQLDB = Depends(get_db)):
 
 
 @router.delete("/{admin_id}")
-async def delete_admin(admin_id: str, db: MySQLDB = Depends(get_db)):
+async def delete_admin(admin_id: str, db: AsyncMySQLDB = Depends(get_db)):
     """관리자 삭제"""
     try:
         # admin이 존재하는지 확인
-        admin_data = db.get_admin(admin_id)
+        admin_data = await db.get_admin(admin_id)
         if not admin_data:
             raise HTTPException(status_code=404, detail="Admin not found")
         
         # admin 삭제
-        db.delete_admin(admin_id)
+        await db.delete_admin(admin_id)
         return {"message": "Admin deleted successfully"}
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
@@ -0,0 +1,57 @@
+from fastapi import APIRouter, HTTPException, Depends, Query
+from typing import Optional
+from datetime import date
+from app.models import Room
+from app.async_db import AsyncMySQLDB, get_db
+
+router = APIRouter(prefix="/api/availability", tags=["availability"])
+
+
+@router.get("/")
+async def search_availability(
+    check_in: date,
+    check_out: date,
+    guests: Optional[int] = Query(None, ge=1),
+    room_type: Optional[str] = None,
+    summary: bool = Query(False, description="객실 타입별 빈 객실 수 포함"),
+    db: AsyncMySQLDB = Depends(get_db)
+):
+    """기간 동안 예약 가능한 모든 객실 조회 (1박 가격순)"""
+    if check_out < check_in:
+        raise HTTPException(status_code=400, detail="check_out must be on or after check_in")
+
+    rooms_data = await db.search_available_rooms(check_in, check_out, guests, room_type)
+
+    rooms = []
+    for r in rooms_data:
+        try:
+            rooms.append(Room(
+                id=r.get('id'),
+                room_number=r.get('room_number', ''),
+                room_type=r.get('room_type', ''),
+                max_guests=int(r.get('max_guests', 0)),
+                price_per_night=float(r.get('price_per_night', 0)),
+                status=r.get('status', 'available')
+            ))
+        except Exception as e:
+            print(f"Error parsing room: {e}")
+            continue
+
+    result = {
+        "check_in": str(check_in),
+        "check_out": str(check_out),
+        "guests": guests,
+        "room_type": room_type,
+        "rooms": rooms
+    }
+
+    if summary:
+        # 객실 타입별 빈 객실 수와 최저가
+        by_type = {}
+        for room in rooms:
+            entry = by_type.setdefault(room.room_type, {"available": 0, "min_price": room.price_per_night})
+            entry["available"] += 1
+            entry["min_price"] = min(entry["min_price"], room.price_per_night)
+        result["summary"] = by_type
+
+    return result
@@ -1,18 +1,14 @@
 from fastapi import APIRouter, Depends
 from typing import List
-from app.db import MySQLDB
+from app.async_db import AsyncMySQLDB, get_db
 
 router = APIRouter(prefix="/api/cleaning", tags=["cleaning"])
 
 
-def get_db():
-    return MySQLDB()
-
-
 @router.get("/rooms")
-async def get_cleaning_rooms(db: MySQLDB = Depends(get_db)):
+async def get_cleaning_rooms(db: AsyncMySQLDB = Depends(get_db)):
     """청소가 필요한 방 목록"""
-    rooms_data = db.get_rooms()
+    rooms_data = await db.get_rooms()
     
     cleaning_rooms = []
     for room_data in rooms_data:
@@ -38,11 +34,11 @@ async def get_cleaning_rooms(db: MySQLDB = Depends(get_db)):
 
 
 @router.post("/complete/{room_id}")
-async def complete_cleaning(room_id: str, db: MySQLDB = Depends(get_db)):
+async def complete_cleaning(room_id: str, db: AsyncMySQLDB = Depends(get_db)):
     """청소 완료 처리"""
-    db.update_room_status(room_id, "available")
+    await db.update_room_status(room_id, "available")
     
-    room_data = db.get_room(room_id)
+    room_data = await db.get_room(room_id)
     if not room_data:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Room not found")
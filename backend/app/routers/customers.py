@@ -1,19 +1,36 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from typing import List, Optional
-from app.models import Customer
-from app.db import MySQLDB
+from app.models import Customer, CustomerReservations
+from app.async_db import AsyncMySQLDB, get_db
+from app.versions import conditional_get
+from app.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, MAX_PAGE_SIZE
+from app.responses import direct_json_response
+from app.fields import InvalidFieldsError, parse_fields, project
 
 router = APIRouter(prefix="/api/customers", tags=["customers"])
 
 
-def get_db():
-    return MySQLDB()
-
-
-@router.get("/", response_model=List[Customer])
-async def get_customers(db: MySQLDB = Depends(get_db)):
-    """모든 고객 조회"""
-    customers_data = db.get_customers()
+@router.get("/", response_model=List[Customer], dependencies=[Depends(conditional_get("customers"))])
+async def get_customers(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (없으면 전체)"),
+    after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    sort: str = Query("id", description="정렬 키: id, name"),
+    order: str = Query("asc", description="asc 또는 desc"),
+    name: Optional[str] = Query(None, description="이름 접두어 검색"),
+    nationality: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분), 예: id,name"),
+    db: AsyncMySQLDB = Depends(get_db)
+):
+    """고객 목록 조회 (limit/after 커서 페이지네이션, 서버 측 필터, fields로 필드 선택)"""
+    try:
+        field_names = parse_fields(fields, Customer)
+        customers_data, next_cursor = await db.list_customers(limit, after, sort, order, name, nationality, field_names)
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     customers = []
     for c in customers_data:
         try:
@@ -28,13 +45,15 @@ async def get_customers(db: MySQLDB = Depends(get_db)):
         except Exception as e:
             print(f"Error parsing customer: {e}")
             continue
+    if field_names:
+        return direct_json_response(project(customers, field_names), response)
     return customers
 
 
-@router.get("/{customer_id}", response_model=Customer)
-async def get_customer(customer_id: str, db: MySQLDB = Depends(get_db)):
+@router.get("/{customer_id}", response_model=Customer, dependencies=[Depends(conditional_get("customers"))])
+async def get_customer(customer_id: str, db: AsyncMySQLDB = Depends(get_db)):
     """고객 상세 조회"""
-    customer_data = db.get_customer(customer_id)
+    customer_data = await db.get_customer(customer_id)
     if not customer_data:
         raise HTTPException(status_code=404, detail="Customer not found")
     
@@ -47,33 +66,21 @@ async def get_customer(customer_id: str, db: MySQLDB = Depends(get_db)):
     )
 
 
-@router.get("/{customer_id}/reservations")
-async def get_customer_reservations(customer_id: str, db: MySQLDB = Depends(get_db)):
+@router.get("/{customer_id}/reservations", response_model=CustomerReservations,
+            dependencies=[Depends(conditional_get("customers", "reservations"))])
+async def get_customer_reservations(customer_id: str, response: Response, db: AsyncMySQLDB = Depends(get_db)):
     """고객의 예약 이력 조회"""
-    from app.utils import reservation_dict_to_model
-    
-    reservations_data = db.get_reservations()
-    customer_reservations = []
-    
-    for res_data in reservations_data:
-        if res_data.get('customer_id') == customer_id:
-            try:
-                reservation = reservation_dict_to_model(res_data)
-                customer_reservations.append(reservation)
-            except:
-                continue
+    reservations, _ = await db.list_reservation_records(customer_id=customer_id)
     
-    return {
-        "customer_id": customer_id,
-        "reservations": customer_reservations
-    }
+    # DB 행에서 바로 만든 dict를 orjson으로 직렬화
+    return direct_json_response({"customer_id": customer_id, "reservations": reservations}, response)
 
 
 @router.post("/", response_model=Customer)
-async def create_customer(customer: Customer, db: MySQLDB = Depends(get_db)):
+async def create_customer(customer: Customer, db: AsyncMySQLDB = Depends(get_db)):
     """새 고객 생성"""
     customer_dict = customer.dict(exclude={'id'})
-    new_customer = db.create_customer(customer_dict)
+    new_customer = await db.create_customer(customer_dict)
     
     return Customer(
         id=new_customer.get('id'),
@@ -1,23 +1,22 @@
 from fastapi import APIRouter, Depends
 from datetime import date
 from app.models import CheckInOutSummary, Reservation
-from app.db import MySQLDB
-from app.utils import get_today_checkins, get_today_checkouts, reservation_dict_to_model
+from app.async_db import AsyncMySQLDB, get_db
+from app.utils import reservation_dict_to_model
+from app.responses import direct_json_response
 
 router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
-
-def get_db():
-    return MySQLDB()
+# get_today_checkins / get_today_checkouts와 동일한 상태 기준
+ACTIVE_STATUSES = ['confirmed', 'checked_in']
 
 
 @router.get("/checkin-out", response_model=CheckInOutSummary)
-async def get_checkin_checkout_summary(db: MySQLDB = Depends(get_db)):
+async def get_checkin_checkout_summary(db: AsyncMySQLDB = Depends(get_db)):
     """오늘의 체크인/체크아웃 명부"""
-    reservations_data = db.get_reservations()
-    
-    checkins_data = get_today_checkins(reservations_data)
-    checkouts_data = get_today_checkouts(reservations_data)
+    today = date.today()
+    checkins_data = await db.get_reservations_checking_in(today, today, statuses=ACTIVE_STATUSES)
+    checkouts_data = await db.get_reservations_checking_out(today, today, statuses=ACTIVE_STATUSES)
     
     checkins = [reservation_dict_to_model(r) for r in checkins_data]
     checkouts = [reservation_dict_to_model(r) for r in checkouts_data]
@@ -25,45 +24,22 @@ async def get_checkin_checkout_summary(db: MySQLDB = Depends(get_db)):
     return CheckInOutSummary(
         check_ins=checkins,
         check_outs=checkouts,
-        date=date.today()
+        date=today
     )
 
 
-@router.get("/stats")
-async def get_dashboard_stats(db: MySQLDB = Depends(get_db)):
-    """대시보드 통계"""
-    reservations_data = db.get_reservations()
-    rooms_data = db.get_rooms()
-    
-    today = date.today()
-    today_str = str(today)
-    
-    # 오늘 체크인/체크아웃 수
-    checkins = get_today_checkins(reservations_data)
-    checkouts = get_today_checkouts(reservations_data)
+@router.get("/overview")
+async def get_dashboard_overview(db: AsyncMySQLDB = Depends(get_db)):
+    """대시보드 첫 화면 데이터 (통계, 오늘 체크인/체크아웃 명부, 긴급 메모 수, 청소 대기 수)
     
-    # 전체 예약 수
-    total_reservations = len(reservations_data)
-    active_reservations = len([r for r in reservations_data if r.get('status') in ['confirmed', 'checked_in']])
-    
-    # 방 상태별 통계
-    total_rooms = len(rooms_data)
-    available_rooms = len([r for r in rooms_data if r.get('status') == 'available'])
-    occupied_rooms = len([r for r in rooms_data if r.get('status') == 'occupied'])
-    
-    return {
-        "today_checkins": len(checkins),
-        "today_checkouts": len(checkouts),
-        "total_reservations": total_reservations,
-        "active_reservations": active_reservations,
-        "total_rooms": total_rooms,
-        "available_rooms": available_rooms,
-        "occupied_rooms": occupied_rooms,
-        "occupancy_rate": round((occupied_rooms / total_rooms * 100) if total_rooms > 0 else 0, 2)
-    }
-
-
-
-
+    /stats와 /checkin-out을 합친 응답으로, 적은 수의 쿼리로 만든 스냅샷을 잠시 캐시해 반환합니다.
+    """
+    snapshot = await db.get_dashboard_snapshot(date.today(), ACTIVE_STATUSES)
+    return direct_json_response(snapshot)
 
 
+@router.get("/stats")
+async def get_dashboard_stats(db: AsyncMySQLDB = Depends(get_db)):
+    """대시보드 통계 (/overview와 같은 스냅샷의 stats 부분)"""
+    snapshot = await db.get_dashboard_snapshot(date.today(), ACTIVE_STATUSES)
+    return snapshot["stats"]
@@ -0,0 +1,96 @@
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import Optional
+import asyncio
+import json
+from app.events import event_bus, EVENT_TYPES, RESET_EVENT
+
+router = APIRouter(prefix="/api/events", tags=["events"])
+
+# 연결 유지용 주석 전송 간격 (초)
+HEARTBEAT_SECONDS = 15
+# 재접속 대기 시간 안내 (ms)
+RETRY_MS = 3000
+
+
+def _format_event(event: dict) -> str:
+    """SSE 메시지 형식으로 변환"""
+    data = json.dumps(event["data"], ensure_ascii=False, default=str)
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+def _format_reset() -> str:
+    """이어 받을 수 없는 경우: 현재 마지막 id와 함께 목록 재조회 요청"""
+    return f"id: {event_bus.last_id()}\nevent: {RESET_EVENT}\ndata: {{}}\n\n"
+
+
+@router.get("/")
+async def stream_events(
+    request: Request,
+    types: Optional[str] = Query(None, description=f"쉼표로 구분한 이벤트 종류: {', '.join(EVENT_TYPES)}"),
+    last_event_id: Optional[str] = Header(None),
+    after: Optional[int] = Query(None, description="Last-Event-ID 헤더 대신 사용할 수 있는 마지막 이벤트 id")
+):
+    """객실 상태/노트 변경 이벤트 스트림 (Server-Sent Events)"""
+    wanted = None
+    if types:
+        wanted = {t.strip() for t in types.split(",") if t.strip()}
+        unknown = wanted - set(EVENT_TYPES)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown event type(s): {', '.join(sorted(unknown))}")
+
+    resume_from = after
+    if last_event_id:
+        try:
+            resume_from = int(last_event_id)
+        except ValueError:
+            resume_from = None
+
+    async def event_stream():
+        # 스트림이 시작된 뒤에 구독 (시작 전에 끊긴 연결이 구독자로 남지 않도록)
+        # 재전송 대상을 정하기 전에 구독해야 그 사이 발행된 이벤트를 놓치지 않음
+        sub = event_bus.subscribe(wanted)
+        try:
+            last_sent = event_bus.last_id() if resume_from is None else resume_from
+            yield f"retry: {RETRY_MS}\n\n"
+            if resume_from is not None:
+                backlog = event_bus.replay(resume_from, wanted)
+                if backlog is None:
+                    yield _format_reset()
+                    last_sent = event_bus.last_id()
+                else:
+                    for event in backlog:
+                        yield _format_event(event)
+                        last_sent = event["id"]
+
+            while not await request.is_disconnected():
+                if sub.overflowed:
+                    # 느린 클라이언트: 링 버퍼에서 놓친 이벤트를 보내고 실시간 전달 재개
+                    backlog = event_bus.catch_up(sub, last_sent)
+                    if backlog is None:
+                        yield _format_reset()
+                        last_sent = event_bus.last_id()
+                    else:
+                        for event in backlog:
+                            yield _format_event(event)
+                            last_sent = event["id"]
+                    continue
+
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), timeout=HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+                # 재전송으로 이미 보낸 이벤트는 건너뜀
+                if event["id"] <= last_sent:
+                    continue
+                yield _format_event(event)
+                last_sent = event["id"]
+        finally:
+            event_bus.unsubscribe(sub)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,154 +1,188 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from datetime import date, datetime
-from app.db import MySQLDB
+from app.async_db import AsyncMySQLDB, get_db
 from app.utils import reservation_dict_to_model
+from app.report_export import REPORT_HEADERS, report_rows, XlsxReportWriter
+from app.report_jobs import report_jobs, ReportQueueFullError, DONE
+from app.daily_report import daily_report_cache
+from app.versions import _etag_matches
+from app.models import ReportJobCreate
 import io
 import csv
+import tempfile
 
 router = APIRouter(prefix="/api/reports", tags=["reports"])
 
+# Excel/Parquet 내보내기 임시 파일을 메모리에 둘 최대 크기 (초과하면 디스크로 이동)
+EXPORT_SPOOL_MAX_MEMORY = 8 * 1024 * 1024
 
-def get_db():
-    return MySQLDB()
+
+def _iter_file(file, chunk_size: int = 64 * 1024):
+    """파일을 청크 단위로 읽어 전송 후 닫음"""
+    try:
+        file.seek(0)
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        file.close()
 
 
 @router.get("/reservations/excel")
-async def export_reservations_excel(start_date: str = None, end_date: str = None, db: MySQLDB = Depends(get_db)):
-    """예약 리포트 Excel 다운로드"""
+async def export_reservations_excel(start_date: str = None, end_date: str = None, db: AsyncMySQLDB = Depends(get_db)):
+    """예약 리포트 Excel 다운로드 (write-only 워크시트, 메모리 사용량 일정)"""
     try:
         import openpyxl
-        from openpyxl import Workbook
-        from app.utils import parse_date
-        
-        reservations_data = db.get_reservations()
-        
-        # 날짜 필터링
-        if start_date and end_date:
-            start = parse_date(start_date)
-            end = parse_date(end_date)
-            filtered_reservations = []
-            for res_data in reservations_data:
-                try:
-                    check_in = parse_date(res_data.get('check_in', ''))
-                    if start <= check_in <= end:
-                        filtered_reservations.append(res_data)
-                except:
-                    continue
-            reservations_data = filtered_reservations
-        
-        # Excel 워크북 생성
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Reservations"
-        
-        # 헤더
-        headers = ["ID", "Customer ID", "Room ID", "Platform", "Check-in", "Check-out", 
-                  "Guests", "Total Price", "Status", "Booking Reference", "Notes"]
-        ws.append(headers)
-        
-        # 데이터
-        platforms_data = db.get_platforms()
-        platform_map = {p.get('id', ''): p.get('name', 'Unknown') for p in platforms_data}
-        
-        for res_data in reservations_data:
-            platform_id = res_data.get('platform_id', '')
-            platform_name = platform_map.get(platform_id, f"Platform {platform_id}")
-            
-            row = [
-                res_data.get('id', ''),
-                res_data.get('customer_id', ''),
-                res_data.get('room_id', ''),
-                platform_name,
-                res_data.get('check_in', ''),
-                res_data.get('check_out', ''),
-                res_data.get('guests', ''),
-                res_data.get('total_price', ''),
-                res_data.get('status', ''),
-                res_data.get('booking_reference', ''),
-                res_data.get('notes', '')
-            ]
-            ws.append(row)
-        
-        # 파일로 저장
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
-        filename = f"reservations_{date.today().strftime('%Y%m%d')}.xlsx"
-        
-        return StreamingResponse(
-            io.BytesIO(output.read()),
-            media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
-        )
     except ImportError:
         # openpyxl이 없으면 CSV로 대체
         return await export_reservations_csv(start_date, end_date, db)
-
-
-@router.get("/reservations/csv")
-async def export_reservations_csv(start_date: str = None, end_date: str = None, db: MySQLDB = Depends(get_db)):
-    """예약 리포트 CSV 다운로드"""
-    from app.utils import parse_date
     
-    reservations_data = db.get_reservations()
+    # 날짜 필터링 (체크인 기준, 시작/종료 날짜가 모두 있을 때만 DB 쿼리로 처리)
+    if not (start_date and end_date):
+        start_date = end_date = None
     
-    # 날짜 필터링
-    if start_date and end_date:
-        start = parse_date(start_date)
-        end = parse_date(end_date)
-        filtered_reservations = []
-        for res_data in reservations_data:
-            try:
-                check_in = parse_date(res_data.get('check_in', ''))
-                if start <= check_in <= end:
-                    filtered_reservations.append(res_data)
-            except:
-                continue
-        reservations_data = filtered_reservations
+    platform_map = await db.get_platform_map()
     
-    # CSV 생성
-    output = io.StringIO()
-    writer = csv.writer(output)
+    # 작은 파일은 메모리, 큰 파일은 디스크에 저장
+    output = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_MEMORY)
+    try:
+        # write-only 워크북: 추가한 행은 바로 임시 파일로 기록되어 메모리에 쌓이지 않음
+        writer = XlsxReportWriter(output, platform_map)
+        # 서버 측 커서 배치마다 행 추가 (XML 생성은 스레드풀에서 실행해 이벤트 루프를 막지 않음)
+        async for rows in db.stream_reservation_rows(start_date, end_date):
+            await run_in_threadpool(writer.write_rows, rows)
+        await run_in_threadpool(writer.close)
+    except Exception:
+        output.close()
+        raise
+    size = output.tell()
     
-    # 헤더
-    writer.writerow(["ID", "Customer ID", "Room ID", "Platform", "Check-in", "Check-out", 
-                     "Guests", "Total Price", "Status", "Booking Reference", "Notes"])
+    filename = f"reservations_{date.today().strftime('%Y%m%d')}.xlsx"
     
-    # 데이터
-    platforms_data = db.get_platforms()
-    platform_map = {p.get('id', ''): p.get('name', 'Unknown') for p in platforms_data}
+    return StreamingResponse(
+        _iter_file(output),
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(size)
+        }
+    )
+
+
+async def _reservation_csv_chunks(db: AsyncMySQLDB, start_date: str = None, end_date: str = None):
+    """예약 CSV를 서버 측 커서 배치 단위로 생성 (행 전체를 메모리에 올리지 않음)"""
+    # 기존과 같이 시작/종료 날짜가 모두 있을 때만 필터링
+    if not (start_date and end_date):
+        start_date = end_date = None
+    platform_map = await db.get_platform_map()
     
-    for res_data in reservations_data:
-        platform_id = res_data.get('platform_id', '')
-        platform_name = platform_map.get(platform_id, f"Platform {platform_id}")
-        
-        writer.writerow([
-            res_data.get('id', ''),
-            res_data.get('customer_id', ''),
-            res_data.get('room_id', ''),
-            platform_name,
-            res_data.get('check_in', ''),
-            res_data.get('check_out', ''),
-            res_data.get('guests', ''),
-            res_data.get('total_price', ''),
-            res_data.get('status', ''),
-            res_data.get('booking_reference', ''),
-            res_data.get('notes', '')
-        ])
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(REPORT_HEADERS)
+    # 헤더는 바로 전송 (다운로드가 즉시 시작되도록)
+    yield output.getvalue()
     
-    output.seek(0)
+    async for rows in db.stream_reservation_rows(start_date, end_date):
+        output.seek(0)
+        output.truncate(0)
+        writer.writerows(report_rows(rows, platform_map))
+        yield output.getvalue()
+
+
+@router.get("/reservations/csv")
+async def export_reservations_csv(start_date: str = None, end_date: str = None, db: AsyncMySQLDB = Depends(get_db)):
+    """예약 리포트 CSV 다운로드 (체크인 기준 날짜 필터, 스트리밍)"""
     filename = f"reservations_{date.today().strftime('%Y%m%d')}.csv"
     
     return StreamingResponse(
-        io.BytesIO(output.getvalue().encode('utf-8')),
+        _reservation_csv_chunks(db, start_date, end_date),
         media_type="text/csv",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
+@router.get("/reservations/parquet")
+async def export_reservations_parquet(start_date: str = None, end_date: str = None, db: AsyncMySQLDB = Depends(get_db)):
+    """예약 분석용 Parquet 다운로드 (타입 보존, 배치마다 row group 하나)"""
+    try:
+        from app.parquet_export import ReservationParquetWriter
+    except ImportError:
+        raise HTTPException(status_code=501, detail="Parquet export requires pyarrow")
+    
+    # 날짜 필터링 (체크인 기준, 시작/종료 날짜가 모두 있을 때만 DB 쿼리로 처리)
+    if not (start_date and end_date):
+        start_date = end_date = None
+    
+    output = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_MEMORY)
+    try:
+        writer = ReservationParquetWriter(output)
+        try:
+            # Arrow 변환/압축은 스레드풀에서 실행
+            async for rows in db.stream_reservation_analytics_rows(start_date, end_date):
+                await run_in_threadpool(writer.write_rows, rows)
+        finally:
+            await run_in_threadpool(writer.close)
+    except Exception:
+        output.close()
+        raise
+    size = output.tell()
+    
+    filename = f"reservations_{date.today().strftime('%Y%m%d')}.parquet"
+    
+    return StreamingResponse(
+        _iter_file(output),
+        media_type="application/vnd.apache.parquet",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Content-Length": str(size)
+        }
+    )
+
+
+@router.post("/jobs", status_code=202)
+async def create_report_job(job: ReportJobCreate):
+    """리포트 작업 등록 (csv, xlsx, pdf, parquet) - 진행 상태는 GET /jobs/{job_id}로 확인"""
+    try:
+        created = await report_jobs.submit(job.format, job.start_date, job.end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ReportQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    return created.to_dict()
+
+
+@router.get("/jobs/{job_id}")
+async def get_report_job(job_id: str):
+    """리포트 작업 상태/진행률 조회"""
+    job = report_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Report job not found or expired")
+    return job.to_dict()
 
 
+@router.get("/jobs/{job_id}/download")
+async def download_report_job(job_id: str):
+    """완료된 리포트 파일 다운로드"""
+    job = report_jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Report job not found or expired")
+    if job.status != DONE:
+        raise HTTPException(status_code=409, detail=f"Report job is {job.status}")
+    return FileResponse(job.path, media_type=job.media_type, filename=job.filename)
 
 
+@router.get("/daily-ops")
+async def get_daily_ops_report(request: Request, report_date: date = None, db: AsyncMySQLDB = Depends(get_db)):
+    """일일 운영 리포트 PDF (도착/출발/청소/처리 대기 메모, 기본값은 오늘)"""
+    report_date = report_date or date.today()
+    pdf, digest, cached = await daily_report_cache.get_pdf(db, report_date)
+    etag = f'W/"{digest}"'
+    headers = {"ETag": etag, "X-Report-Cache": "hit" if cached else "miss"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    headers["Content-Disposition"] = f"inline; filename=daily_ops_{report_date.strftime('%Y%m%d')}.pdf"
+    return Response(content=pdf, media_type="application/pdf", headers=headers)
@@ -1,41 +1,66 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import List, Optional
 from datetime import date
 from app.models import Reservation, ReservationCreate
-from app.db import MySQLDB
+from app.async_db import AsyncMySQLDB, get_db
+from app.versions import conditional_get
+from app.db import RoomAlreadyBookedError
+from app.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, MAX_PAGE_SIZE
 from app.utils import reservation_dict_to_model, parse_date
+from app.responses import direct_json_response
+from app.fields import InvalidFieldsError, parse_fields
 
 router = APIRouter(prefix="/api/reservations", tags=["reservations"])
 
 
-def get_db():
-    return MySQLDB()
-
-
-@router.get("/", response_model=List[Reservation])
-async def get_reservations(db: MySQLDB = Depends(get_db)):
-    """모든 예약 조회"""
-    reservations_data = db.get_reservations()
-    return [reservation_dict_to_model(r) for r in reservations_data]
+@router.get("/", response_model=List[Reservation], dependencies=[Depends(conditional_get("reservations"))])
+async def get_reservations(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (없으면 전체)"),
+    after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    sort: str = Query("id", description="정렬 키: id, check_in, check_out"),
+    order: str = Query("asc", description="asc 또는 desc"),
+    status: Optional[str] = None,
+    start_date: Optional[date] = Query(None, description="이 날짜 이후까지 숙박하는 예약"),
+    end_date: Optional[date] = Query(None, description="이 날짜 이전에 체크인하는 예약"),
+    room_id: Optional[str] = None,
+    platform_id: Optional[str] = None,
+    customer_id: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분), 예: id,room_id,check_in,check_out,status"),
+    db: AsyncMySQLDB = Depends(get_db)
+):
+    """예약 목록 조회 (limit/after 커서 페이지네이션, 서버 측 필터, fields로 필드 선택)"""
+    try:
+        field_names = parse_fields(fields, Reservation)
+        reservations, next_cursor = await db.list_reservation_records(
+            limit, after, sort, order, status, start_date, end_date, room_id, platform_id, customer_id, field_names
+        )
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    # DB 행에서 바로 만든 dict를 orjson으로 직렬화 (response_model 재검증/jsonable_encoder 생략)
+    return direct_json_response(reservations, response)
 
 
-@router.get("/{reservation_id}", response_model=Reservation)
-async def get_reservation(reservation_id: str, db: MySQLDB = Depends(get_db)):
+@router.get("/{reservation_id}", response_model=Reservation, dependencies=[Depends(conditional_get("reservations"))])
+async def get_reservation(reservation_id: str, db: AsyncMySQLDB = Depends(get_db)):
     """예약 상세 조회"""
-    reservation_data = db.get_reservation(reservation_id)
+    reservation_data = await db.get_reservation(reservation_id)
     if not reservation_data:
         raise HTTPException(status_code=404, detail="Reservation not found")
     return reservation_dict_to_model(reservation_data)
 
 
 @router.post("/", response_model=Reservation)
-async def create_reservation(reservation: ReservationCreate, db: MySQLDB = Depends(get_db)):
+async def create_reservation(reservation: ReservationCreate, db: AsyncMySQLDB = Depends(get_db)):
     """새 예약 생성 (중복 체크 포함)"""
-    # 중복 예약 체크
+    # 중복 예약 체크 (빠른 사전 확인, 최종 판단은 생성 시 DB 제약 조건)
     check_in_str = str(reservation.check_in)
     check_out_str = str(reservation.check_out)
     
-    if db.check_duplicate_reservation(reservation.room_id, check_in_str, check_out_str):
+    if await db.check_duplicate_reservation(reservation.room_id, check_in_str, check_out_str):
         raise HTTPException(
             status_code=400,
             detail="Room is already booked for the selected dates"
@@ -47,21 +72,28 @@ async def create_reservation(reservation: ReservationCreate, db: MySQLDB = Depen
     # 기본 status를 'Reserved'로 설정
     if 'status' not in reservation_dict or not reservation_dict.get('status'):
         reservation_dict['status'] = 'Reserved'
-    new_reservation = db.create_reservation(reservation_dict)
+    try:
+        new_reservation = await db.create_reservation(reservation_dict)
+    except RoomAlreadyBookedError:
+        # 동시에 들어온 다른 예약이 먼저 같은 날짜를 차지한 경우 (객실-박 원장 제약 조건)
+        raise HTTPException(
+            status_code=400,
+            detail="Room is already booked for the selected dates"
+        )
     
     # 방 상태 업데이트
-    db.update_room_status(reservation.room_id, "occupied")
+    await db.update_room_status(reservation.room_id, "occupied")
     
     return reservation_dict_to_model(new_reservation)
 
 
 @router.get("/room/{room_id}/availability")
-async def check_room_availability(room_id: str, check_in: date, check_out: date, db: MySQLDB = Depends(get_db)):
+async def check_room_availability(room_id: str, check_in: date, check_out: date, db: AsyncMySQLDB = Depends(get_db)):
     """방 가용성 체크"""
     check_in_str = str(check_in)
     check_out_str = str(check_out)
     
-    is_available = not db.check_duplicate_reservation(room_id, check_in_str, check_out_str)
+    is_available = not await db.check_duplicate_reservation(room_id, check_in_str, check_out_str)
     
     return {
         "room_id": room_id,
@@ -75,7 +107,7 @@ async def check_room_availability(room_id: str, check_in: date, check_out: date,
 async def update_reservation_status(
     reservation_id: str, 
     status: str = Query(..., description="Status: Reserved, Checked in, or Checked out"),
-    db: MySQLDB = Depends(get_db)
+    db: AsyncMySQLDB = Depends(get_db)
 ):
     """예약 Status 업데이트"""
     # URL 디코딩된 status 값 정리
@@ -88,29 +120,23 @@ async def update_reservation_status(
             detail=f"Invalid status: '{status}'. Must be one of: {', '.join(valid_statuses)}"
         )
     
-    reservation_data = db.get_reservation(reservation_id)
-    if not reservation_data:
-        raise HTTPException(status_code=404, detail="Reservation not found")
+    # Status에 따라 rooms의 status 매핑
+    room_status_map = {
+        'Reserved': 'occupied',
+        'Checked in': 'occupied',
+        'Checked out': 'available'
+    }
     
     try:
-        # 예약 Status 업데이트
-        db.update_reservation_status(reservation_id, status)
-        
-        # rooms 시트의 Status도 업데이트
-        room_id = reservation_data.get('room_id', '')
-        if room_id:
-            # Status에 따라 rooms 시트의 status 매핑
-            room_status_map = {
-                'Reserved': 'occupied',
-                'Checked in': 'occupied',
-                'Checked out': 'available'
-            }
-            room_status = room_status_map.get(status, 'occupied')
-            db.update_room_status(room_id, room_status)
-        
-        updated_reservation = db.get_reservation(reservation_id)
-        return reservation_dict_to_model(updated_reservation)
+        # 예약 Status와 방 Status를 한 트랜잭션으로 업데이트
+        updated_reservation = await db.transition_reservation(
+            reservation_id, status, room_status=room_status_map.get(status, 'occupied')
+        )
     except Exception as e:
         print(f"Error updating reservation status: {e}")
         raise HTTPException(status_code=500, detail=f"Failed to update status: {str(e)}")
-
+    
+    if not updated_reservation:
+        raise HTTPException(status_code=404, detail="Reservation not found")
+    
+    return reservation_dict_to_model(updated_reservation)
@@ -1,140 +1,102 @@
-from fastapi import APIRouter, Depends
-from typing import List, Dict
+from fastapi import APIRouter, Depends, HTTPException
+from starlette.concurrency import run_in_threadpool
+from typing import List, Dict, Optional
 from datetime import date, datetime, timedelta
-from app.db import MySQLDB
+from app.async_db import AsyncMySQLDB, get_db
 from app.utils import parse_date
+from app.revenue_kpi import compute_stay_kpis
 
 router = APIRouter(prefix="/api/revenue", tags=["revenue"])
 
+# 'reservations' 카운트에 포함되는 상태 (앱이 저장하는 값 + 이전 형식 값, RESERVATION_STATUS_MAP 참고)
+ACTIVE_STATUSES = ['Reserved', 'Checked in', 'confirmed', 'checked_in']
 
-def get_db():
-    return MySQLDB()
+# KPI 조회 최대 기간 (일)
+MAX_KPI_DAYS = 3660
 
 
 @router.get("/daily/{start_date}/{end_date}")
-async def get_daily_revenue(start_date: str, end_date: str, db: MySQLDB = Depends(get_db)):
+async def get_daily_revenue(start_date: str, end_date: str, db: AsyncMySQLDB = Depends(get_db)):
     """일별 수익 통계"""
     start = parse_date(start_date)
     end = parse_date(end_date)
     
-    reservations_data = db.get_reservations()
+    # 날짜별 집계는 DB에서 GROUP BY로 계산
+    stats = await db.get_daily_revenue_stats(start, end, ACTIVE_STATUSES)
     
-    daily_revenue = {}
+    daily_data = []
     current_date = start
     
+    # 예약이 없는 날도 0으로 채움
     while current_date <= end:
-        daily_revenue[str(current_date)] = {
-            "date": str(current_date),
-            "revenue": 0.0,
-            "reservations": 0,
-            "check_ins": 0,
-            "check_outs": 0
-        }
+        date_str = str(current_date)
+        day_stats = stats.get(date_str, {})
+        daily_data.append({
+            "date": date_str,
+            "revenue": day_stats.get("revenue", 0.0),
+            "reservations": day_stats.get("reservations", 0),
+            "check_ins": day_stats.get("check_ins", 0),
+            "check_outs": day_stats.get("check_outs", 0)
+        })
         current_date += timedelta(days=1)
     
-    for res_data in reservations_data:
-        try:
-            check_in = parse_date(res_data.get('check_in', ''))
-            check_out = parse_date(res_data.get('check_out', ''))
-            total_price = float(res_data.get('total_price', 0))
-            status = res_data.get('status', '')
-            
-            # 체크인 날짜별 수익 계산
-            if start <= check_in <= end:
-                date_str = str(check_in)
-                if date_str in daily_revenue:
-                    daily_revenue[date_str]["revenue"] += total_price
-                    daily_revenue[date_str]["check_ins"] += 1
-                    if status in ['confirmed', 'checked_in']:
-                        daily_revenue[date_str]["reservations"] += 1
-            
-            # 체크아웃 날짜별 통계
-            if start <= check_out <= end:
-                date_str = str(check_out)
-                if date_str in daily_revenue:
-                    daily_revenue[date_str]["check_outs"] += 1
-        except:
-            continue
-    
     return {
         "start_date": start_date,
         "end_date": end_date,
-        "daily_data": list(daily_revenue.values())
+        "daily_data": daily_data
     }
 
 
 @router.get("/monthly/{year}")
-async def get_monthly_revenue(year: int, db: MySQLDB = Depends(get_db)):
+async def get_monthly_revenue(year: int, db: AsyncMySQLDB = Depends(get_db)):
     """월별 수익 통계"""
-    monthly_revenue = {}
+    # 월별 집계는 DB에서 GROUP BY로 계산
+    stats = await db.get_monthly_revenue_stats(year, ACTIVE_STATUSES)
     
+    monthly_data = []
     for month in range(1, 13):
-        monthly_revenue[month] = {
+        month_stats = stats.get(month, {})
+        monthly_data.append({
             "year": year,
             "month": month,
-            "revenue": 0.0,
-            "reservations": 0,
-            "check_ins": 0,
-            "check_outs": 0
-        }
-    
-    reservations_data = db.get_reservations()
-    
-    for res_data in reservations_data:
-        try:
-            check_in = parse_date(res_data.get('check_in', ''))
-            total_price = float(res_data.get('total_price', 0))
-            status = res_data.get('status', '')
-            
-            if check_in.year == year:
-                month = check_in.month
-                monthly_revenue[month]["revenue"] += total_price
-                monthly_revenue[month]["check_ins"] += 1
-                if status in ['confirmed', 'checked_in']:
-                    monthly_revenue[month]["reservations"] += 1
-        except:
-            continue
+            "revenue": month_stats.get("revenue", 0.0),
+            "reservations": month_stats.get("reservations", 0),
+            "check_ins": month_stats.get("check_ins", 0),
+            "check_outs": month_stats.get("check_outs", 0)
+        })
     
     return {
         "year": year,
-        "monthly_data": list(monthly_revenue.values())
+        "monthly_data": monthly_data
     }
 
 
 @router.get("/platform/{start_date}/{end_date}")
-async def get_platform_revenue(start_date: str, end_date: str, db: MySQLDB = Depends(get_db)):
+async def get_platform_revenue(start_date: str, end_date: str, db: AsyncMySQLDB = Depends(get_db)):
     """플랫폼별 수익 통계"""
     start = parse_date(start_date)
     end = parse_date(end_date)
     
-    reservations_data = db.get_reservations()
-    platforms_data = db.get_platforms()
-    
-    platform_map = {p.get('id', ''): p.get('name', 'Unknown') for p in platforms_data}
+    # 플랫폼별 집계는 DB에서 GROUP BY로 계산 (booking_platforms 조인)
+    stats = await db.get_platform_revenue_stats(start, end)
     
     platform_revenue = {}
     
-    for res_data in reservations_data:
-        try:
-            check_in = parse_date(res_data.get('check_in', ''))
-            platform_id = res_data.get('platform_id', '')
-            total_price = float(res_data.get('total_price', 0))
-            
-            if start <= check_in <= end:
-                platform_name = platform_map.get(platform_id, f"Platform {platform_id}")
-                
-                if platform_name not in platform_revenue:
-                    platform_revenue[platform_name] = {
-                        "platform": platform_name,
-                        "platform_id": platform_id,
-                        "revenue": 0.0,
-                        "reservations": 0
-                    }
-                
-                platform_revenue[platform_name]["revenue"] += total_price
-                platform_revenue[platform_name]["reservations"] += 1
-        except:
-            continue
+    # 같은 이름의 플랫폼은 하나로 합산
+    for row in stats:
+        platform_id = row["platform_id"]
+        platform_name = row["platform_name"] or f"Platform {platform_id}"
+        
+        if platform_name not in platform_revenue:
+            platform_revenue[platform_name] = {
+                "platform": platform_name,
+                "platform_id": platform_id,
+                "revenue": 0.0,
+                "reservations": 0
+            }
+        
+        platform_revenue[platform_name]["revenue"] += row["revenue"]
+        platform_revenue[platform_name]["reservations"] += row["reservations"]
     
     return {
         "start_date": start_date,
@@ -143,7 +105,80 @@ async def get_platform_revenue(start_date: str, end_date: str, db: MySQLDB = Dep
     }
 
 
+@router.get("/daily-stats/{start_date}/{end_date}")
+async def get_daily_stats(
+    start_date: str,
+    end_date: str,
+    room_type: Optional[str] = None,
+    platform_id: Optional[str] = None,
+    db: AsyncMySQLDB = Depends(get_db)
+):
+    """일별 판매 집계 (daily_stats 집계 테이블 기반, 숙박일별 매출/객실-박/체크인/체크아웃)"""
+    start = parse_date(start_date)
+    end = parse_date(end_date)
+    
+    stats = await db.get_daily_stats(start, end, room_type, platform_id)
+    
+    daily_data = []
+    current_date = start
+    
+    while current_date <= end:
+        date_str = str(current_date)
+        day_stats = stats.get(date_str, {})
+        daily_data.append({
+            "date": date_str,
+            "room_nights": day_stats.get("room_nights", 0),
+            "revenue": day_stats.get("revenue", 0.0),
+            "arrivals": day_stats.get("arrivals", 0),
+            "departures": day_stats.get("departures", 0)
+        })
+        current_date += timedelta(days=1)
+    
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "room_type": room_type,
+        "platform_id": platform_id,
+        "daily_data": daily_data
+    }
+
+
+async def _stay_kpis(db: AsyncMySQLDB, start: date, end: date):
+    """기간의 숙박일 기준 KPI 집계 (NumPy 계산은 스레드풀에서 실행)"""
+    if end < start:
+        raise HTTPException(status_code=400, detail="end_date must be on or after start_date")
+    if (end - start).days + 1 > MAX_KPI_DAYS:
+        raise HTTPException(status_code=400, detail=f"Period must be at most {MAX_KPI_DAYS} days")
+    rows = await db.get_stay_revenue_rows(start, end)
+    rooms = await db.get_rooms()
+    return await run_in_threadpool(compute_stay_kpis, rows, rooms, start, end)
 
 
+@router.get("/kpi/monthly/{year}")
+async def get_monthly_kpi(year: int, db: AsyncMySQLDB = Depends(get_db)):
+    """월별 KPI (숙박일 기준 매출, 점유율, ADR, RevPAR)"""
+    kpis = await _stay_kpis(db, date(year, 1, 1), date(year, 12, 31))
+    return {
+        "year": year,
+        "summary": kpis.summary(),
+        "monthly_data": kpis.monthly()
+    }
 
 
+@router.get("/kpi/{start_date}/{end_date}")
+async def get_kpi(start_date: str, end_date: str, db: AsyncMySQLDB = Depends(get_db)):
+    """기간 KPI (숙박일 기준 매출 배분) - 전체, 일별, 객실 타입별, 플랫폼별 점유율/ADR/RevPAR"""
+    start = parse_date(start_date)
+    end = parse_date(end_date)
+    
+    kpis = await _stay_kpis(db, start, end)
+    platform_map = await db.get_platform_map()
+    
+    return {
+        "start_date": start_date,
+        "end_date": end_date,
+        "summary": kpis.summary(),
+        "daily_data": kpis.daily(),
+        "room_type_data": kpis.by_room_type(),
+        "platform_data": kpis.by_platform(platform_map)
+    }
@@ -1,64 +1,53 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
 from typing import List, Optional
 from datetime import datetime
 from app.models import RoomNote, RoomNoteCreate
-from app.db import MySQLDB
+from app.async_db import AsyncMySQLDB, get_db
+from app.versions import conditional_get
+from app.pagination import InvalidCursorError, NEXT_CURSOR_HEADER, MAX_PAGE_SIZE
+from app.fields import InvalidFieldsError, parse_fields, project
+from app.responses import direct_json_response
 
 router = APIRouter(prefix="/api/room-notes", tags=["room-notes"])
 
 
-def get_db():
-    return MySQLDB()
-
-
-@router.get("/", response_model=List[RoomNote])
-async def get_room_notes(room_id: str = None, progress: str = None, db: MySQLDB = Depends(get_db)):
-    """모든 노트 조회 (room_id, progress 필터 옵션)"""
+@router.get("/", response_model=List[RoomNote], dependencies=[Depends(conditional_get("room_notes"))])
+async def get_room_notes(
+    response: Response,
+    room_id: str = None,
+    progress: str = None,
+    note_type: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (없으면 전체)"),
+    after: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    sort: str = Query("id", description="정렬 키: id, created_at"),
+    order: str = Query("asc", description="asc 또는 desc"),
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분), 예: id,room_id,title,status,progress"),
+    db: AsyncMySQLDB = Depends(get_db)
+):
+    """노트 목록 조회 (room_id, progress, note_type, status 필터 / limit, after 커서 페이지네이션 / fields로 필드 선택)"""
     import sys
-    import logging
-    logger = logging.getLogger(__name__)
-    logger.error(f"[API] get_room_notes called with room_id={room_id}, progress={progress}")
     print(f"[API] get_room_notes called with room_id={room_id}, progress={progress}", file=sys.stderr, flush=True)
-    print(f"[API] get_room_notes called with room_id={room_id}, progress={progress}", flush=True)
     
-    # progress 파라미터 처리
-    import sys
-    if progress is not None and progress != '':
-        # 특정 progress 값으로 필터링
-        notes_data = db.get_notes_by_progress(progress)
-        print(f"[API] Filtered by progress '{progress}': {len(notes_data)} notes found", file=sys.stderr, flush=True)
-        print(f"[API] Filtered by progress '{progress}': {len(notes_data)} notes found", flush=True)
-    elif progress == '':
-        # 빈 문자열이면 progress가 없는 노트만
-        notes_data = db.get_notes_by_progress(None)
-        print(f"[API] Filtered by no progress: {len(notes_data)} notes found", file=sys.stderr, flush=True)
-        print(f"[API] Filtered by no progress: {len(notes_data)} notes found", flush=True)
-    else:
-        # progress가 None이면 모든 노트 반환 (progress 필터 없이)
-        notes_data = db.get_notes()
-        print(f"[API] All notes (no filter): {len(notes_data)} notes found", file=sys.stderr, flush=True)
-        print(f"[API] All notes (no filter): {len(notes_data)} notes found", flush=True)
+    # 필터는 모두 DB 쿼리로 처리 (progress가 빈 문자열이면 progress가 없는 노트만)
+    try:
+        field_names = parse_fields(fields, RoomNote)
+        notes_data, next_cursor = await db.list_notes(
+            limit, after, sort, order, room_id, progress, note_type, status, field_names
+        )
+    except (InvalidCursorError, InvalidFieldsError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    if room_id:
-        notes_data = [n for n in notes_data if n.get('room_id') == room_id]
-        print(f"Filtered by room_id '{room_id}': {len(notes_data)} notes found")
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    print(f"[API] {len(notes_data)} notes found", file=sys.stderr, flush=True)
     
     notes = []
-    import sys
-    print(f"[API DEBUG] Processing {len(notes_data)} notes_data items", file=sys.stderr, flush=True)
-    print(f"[API DEBUG] Processing {len(notes_data)} notes_data items", flush=True)
-    
-    if len(notes_data) > 0:
-        print(f"[API DEBUG] First notes_data item: {notes_data[0]}", file=sys.stderr, flush=True)
-        print(f"[API DEBUG] First notes_data item: {notes_data[0]}", flush=True)
-    
     for n in notes_data:
         try:
-            print(f"[API DEBUG] Processing note: id={n.get('id')}, title={n.get('title')}, desc={n.get('description')}", file=sys.stderr, flush=True)
-            # 필수 필드 검증
-            if not n.get('title') and not n.get('description'):
+            # 필수 필드 검증 (fields 조회는 DB 쿼리에서 이미 제외)
+            if not field_names and not n.get('title') and not n.get('description'):
                 print(f"[API] Skipping note {n.get('id')}: no title or description", file=sys.stderr, flush=True)
-                print(f"[API] Skipping note {n.get('id')}: no title or description", flush=True)
                 continue
                 
             # RoomNote 모델 생성 시 에러 처리
@@ -86,37 +75,35 @@ async def get_room_notes(room_id: str = None, progress: str = None, db: MySQLDB
                     progress=n.get('progress') if n.get('progress') else None
                 )
                 notes.append(note)
-                print(f"[API] Added note {note.id}: title='{note.title[:30] if note.title else ''}...'", flush=True)
             except Exception as model_error:
                 print(f"[API ERROR] Failed to create RoomNote model: {model_error}", file=sys.stderr, flush=True)
-                print(f"[API ERROR] Failed to create RoomNote model: {model_error}", flush=True)
                 print(f"[API ERROR] Note dict: {n}", flush=True)
                 import traceback
                 traceback.print_exc()
                 continue
         except Exception as e:
             print(f"[API ERROR] Error parsing room note: {e}", file=sys.stderr, flush=True)
-            print(f"[API ERROR] Error parsing room note: {e}", flush=True)
             print(f"[API ERROR] Note data: {n}", flush=True)
             import traceback
             traceback.print_exc()
             continue
     
     print(f"[API] Returning {len(notes)} notes", file=sys.stderr, flush=True)
-    print(f"[API] Returning {len(notes)} notes", flush=True)
     
     # 디버깅: 실제 데이터 확인
     if len(notes_data) > 0 and len(notes) == 0:
         print(f"[API DEBUG] notes_data has {len(notes_data)} items but notes is empty", file=sys.stderr, flush=True)
         print(f"[API DEBUG] First notes_data item: {notes_data[0] if notes_data else 'None'}", file=sys.stderr, flush=True)
     
+    if field_names:
+        return direct_json_response(project(notes, field_names), response)
     return notes
 
 
 @router.get("/urgent")
-async def get_urgent_notes(db: MySQLDB = Depends(get_db)):
+async def get_urgent_notes(db: AsyncMySQLDB = Depends(get_db)):
     """긴급 메모 조회"""
-    notes_data = db.get_urgent_notes()
+    notes_data = await db.get_urgent_notes()
     notes = []
     for n in notes_data:
         try:
@@ -144,9 +131,9 @@ async def get_urgent_notes(db: MySQLDB = Depends(get_db)):
 
 
 @router.get("/after-checkout")
-async def get_after_checkout_notes(db: MySQLDB = Depends(get_db)):
+async def get_after_checkout_notes(db: AsyncMySQLDB = Depends(get_db)):
     """체크아웃 후 처리 메모 조회"""
-    notes_data = db.get_after_checkout_notes()
+    notes_data = await db.get_after_checkout_notes()
     notes = []
     for n in notes_data:
         try:
@@ -174,14 +161,14 @@ async def get_after_checkout_notes(db: MySQLDB = Depends(get_db)):
 
 
 @router.get("/alerts")
-async def get_all_alerts(progress: str = None, db: MySQLDB = Depends(get_db)):
+async def get_all_alerts(progress: str = None, db: AsyncMySQLDB = Depends(get_db)):
     """모든 알람 조회 (긴급 + 체크아웃 후, progress 필터 옵션)"""
     # progress 필터 적용
     if progress:
-        all_notes = db.get_notes_by_progress(progress)
+        all_notes = await db.get_notes_by_progress(progress)
     else:
         # progress가 None이면 progress가 없는 노트만
-        all_notes = db.get_notes_by_progress(None)
+        all_notes = await db.get_notes_by_progress(None)
     
     urgent_notes = []
     after_checkout_notes = []
@@ -217,7 +204,7 @@ async def get_all_alerts(progress: str = None, db: MySQLDB = Depends(get_db)):
 
 
 @router.post("/", response_model=RoomNote)
-async def create_room_note(note: RoomNoteCreate, db: MySQLDB = Depends(get_db)):
+async def create_room_note(note: RoomNoteCreate, db: AsyncMySQLDB = Depends(get_db)):
     """새 노트 생성 (note 시트에 저장)"""
     try:
         note_dict = note.dict()
@@ -225,7 +212,7 @@ async def create_room_note(note: RoomNoteCreate, db: MySQLDB = Depends(get_db)):
         note_dict['created_at'] = str(datetime.now())
         note_dict['completed_at'] = ''
         
-        new_note = db.create_note(note_dict)
+        new_note = await db.create_note(note_dict)
         
         return RoomNote(
             id=new_note.get('id'),
@@ -248,15 +235,15 @@ async def create_room_note(note: RoomNoteCreate, db: MySQLDB = Depends(get_db)):
 
 
 @router.post("/{note_id}/complete")
-async def complete_room_note(note_id: str, db: MySQLDB = Depends(get_db)):
+async def complete_room_note(note_id: str, db: AsyncMySQLDB = Depends(get_db)):
     """노트 완료 처리"""
-    note_data = db.get_note(note_id)
+    note_data = await db.get_note(note_id)
     if not note_data:
         raise HTTPException(status_code=404, detail="Note not found")
     
-    db.update_note_progress(note_id, 'finished')
+    await db.update_note_progress(note_id, 'finished')
     
-    updated_note = db.get_note(note_id)
+    updated_note = await db.get_note(note_id)
     return RoomNote(
         id=updated_note.get('id'),
         room_id=updated_note.get('room_id', ''),
@@ -273,18 +260,18 @@ async def complete_room_note(note_id: str, db: MySQLDB = Depends(get_db)):
 
 
 @router.put("/{note_id}/progress")
-async def update_note_progress(note_id: str, progress: str = Query(..., description="Progress value"), db: MySQLDB = Depends(get_db)):
+async def update_note_progress(note_id: str, progress: str = Query(..., description="Progress value"), db: AsyncMySQLDB = Depends(get_db)):
     """노트 progress 업데이트"""
     if progress not in ['confirm', 'In progress', 'finished', '']:
         raise HTTPException(status_code=400, detail="Invalid progress value. Must be 'confirm', 'In progress', 'finished', or empty string")
     
-    note_data = db.get_note(note_id)
+    note_data = await db.get_note(note_id)
     if not note_data:
         raise HTTPException(status_code=404, detail="Note not found")
     
-    db.update_note_progress(note_id, progress)
+    await db.update_note_progress(note_id, progress)
     
-    updated_note = db.get_note(note_id)
+    updated_note = await db.get_note(note_id)
     return RoomNote(
         id=updated_note.get('id'),
         room_id=updated_note.get('room_id', ''),
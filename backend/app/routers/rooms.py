@@ -1,19 +1,26 @@
-from fastapi import APIRouter, Depends
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from typing import List, Optional
 from app.models import Room
-from app.db import MySQLDB
+from app.async_db import AsyncMySQLDB, get_db
+from app.versions import conditional_get
+from app.fields import InvalidFieldsError, parse_fields, project
+from app.responses import direct_json_response
 
 router = APIRouter(prefix="/api/rooms", tags=["rooms"])
 
 
-def get_db():
-    return MySQLDB()
-
-
-@router.get("/", response_model=List[Room])
-async def get_rooms(db: MySQLDB = Depends(get_db)):
-    """모든 방 조회"""
-    rooms_data = db.get_rooms()
+@router.get("/", response_model=List[Room], dependencies=[Depends(conditional_get("rooms"))])
+async def get_rooms(
+    response: Response,
+    fields: Optional[str] = Query(None, description="반환할 필드 (쉼표 구분), 예: id,room_number,status"),
+    db: AsyncMySQLDB = Depends(get_db)
+):
+    """모든 방 조회 (fields로 필드 선택, 객실은 참조 데이터 캐시에서 읽으므로 응답에만 적용)"""
+    try:
+        field_names = parse_fields(fields, Room)
+    except InvalidFieldsError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    rooms_data = await db.get_rooms()
     rooms = []
     for r in rooms_data:
         try:
@@ -29,13 +36,15 @@ async def get_rooms(db: MySQLDB = Depends(get_db)):
         except Exception as e:
             print(f"Error parsing room: {e}")
             continue
+    if field_names:
+        return direct_json_response(project(rooms, field_names), response)
     return rooms
 
 
-@router.get("/{room_id}", response_model=Room)
-async def get_room(room_id: str, db: MySQLDB = Depends(get_db)):
+@router.get("/{room_id}", response_model=Room, dependencies=[Depends(conditional_get("rooms"))])
+async def get_room(room_id: str, db: AsyncMySQLDB = Depends(get_db)):
     """방 상세 조회"""
-    room_data = db.get_room(room_id)
+    room_data = await db.get_room(room_id)
     if not room_data:
         from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Room not found")
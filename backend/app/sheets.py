@@ -6,6 +6,7 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from pydantic_settings import BaseSettings
 import json
+from app.utils import parse_date
 
 
 class Settings(BaseSettings):
@@ -336,8 +337,8 @@ class GoogleSheetsDB:
     def check_duplicate_reservation(self, room_id: str, check_in: str, check_out: str, exclude_id: str = None) -> bool:
         """중복 예약 체크"""
         reservations = self.get_reservations()
-        check_in_date = check_in if isinstance(check_in, str) else str(check_in)
-        check_out_date = check_out if isinstance(check_out, str) else str(check_out)
+        check_in_date = parse_date(check_in)
+        check_out_date = parse_date(check_out)
         
         for res in reservations:
             if exclude_id and res.get('id') == exclude_id:
@@ -347,10 +348,13 @@ class GoogleSheetsDB:
             if res.get('status') in ['cancelled']:
                 continue
             
-            res_check_in = res.get('check_in', '')
-            res_check_out = res.get('check_out', '')
+            try:
+                res_check_in = parse_date(res.get('check_in', ''))
+                res_check_out = parse_date(res.get('check_out', ''))
+            except ValueError:
+                continue
             
-            # 날짜 겹침 체크
+            # 날짜 겹침 체크 (문자열 비교 대신 날짜로 비교해 시트의 날짜 형식과 무관하게 동작)
             if (check_in_date <= res_check_out and check_out_date >= res_check_in):
                 return True
         
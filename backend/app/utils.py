@@ -1,38 +1,68 @@
+import functools
 from datetime import date, datetime
 from typing import List, Dict
 from app.models import Reservation
 
 
-def parse_date(date_str: str) -> date:
-    """문자열을 date 객체로 변환"""
-    if isinstance(date_str, date):
-        return date_str
-    if isinstance(date_str, datetime):
-        return date_str.date()
-    
-    if not date_str:
-        raise ValueError("Empty date string")
+# 지원하는 날짜 형식 (여러 형식에 맞는 값은 앞에 있는 형식으로 해석)
+DATE_FORMATS = [
+    '%Y-%m-%d',      # 2026-01-02
+    '%Y/%m/%d',      # 2026/01/02
+    '%d/%m/%Y',      # 02/01/2026
+    '%m/%d/%Y',      # 01/02/2026
+    '%Y%m%d',        # 20260102 (YYYYMMDD)
+    '%d-%m-%Y',      # 02-01-2026
+    '%m-%d-%Y',      # 01-02-2026
+]
+
+
+class DateParser:
+    """문자열 -> date 변환기
     
-    date_str = str(date_str).strip()
+    ISO 날짜(YYYY-MM-DD)는 date.fromisoformat으로 바로 변환하고, 그 외 문자열은 formats 순서에서
+    처음 맞는 형식으로 변환해 결과를 LRU 캐시에 둡니다 (02/01/2026처럼 여러 형식에 맞는 값도 항상 같은 날짜).
+    """
     
-    # 여러 날짜 형식 지원
-    formats = [
-        '%Y-%m-%d',      # 2026-01-02
-        '%Y/%m/%d',      # 2026/01/02
-        '%d/%m/%Y',      # 02/01/2026
-        '%m/%d/%Y',      # 01/02/2026
-        '%Y%m%d',        # 20260102 (YYYYMMDD)
-        '%d-%m-%Y',      # 02-01-2026
-        '%m-%d-%Y',      # 01-02-2026
-    ]
+    def __init__(self, formats: List[str] = None, cache_size: int = 4096):
+        self.formats = list(formats or DATE_FORMATS)
+        self._parse_text = functools.lru_cache(maxsize=cache_size)(self._parse_formats)
     
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt).date()
-        except:
-            continue
+    def parse(self, value) -> date:
+        if type(value) is date:
+            return value
+        # datetime은 date의 하위 클래스이므로 먼저 확인
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        
+        if not value:
+            raise ValueError("Empty date string")
+        
+        text = value.strip() if isinstance(value, str) else str(value).strip()
+        if len(text) == 10 and text[4] == '-' and text[7] == '-':
+            try:
+                return date.fromisoformat(text)
+            except ValueError:
+                pass
+        return self._parse_text(text)
     
-    raise ValueError(f"Unable to parse date: {date_str}")
+    def _parse_formats(self, text: str) -> date:
+        for fmt in self.formats:
+            try:
+                return datetime.strptime(text, fmt).date()
+            except ValueError:
+                continue
+        raise ValueError(f"Unable to parse date: {text}")
+
+
+# API 입력, MySQL 백엔드, Google Sheets 값 공용
+_default_date_parser = DateParser()
+
+
+def parse_date(date_str: str) -> date:
+    """문자열을 date 객체로 변환"""
+    return _default_date_parser.parse(date_str)
 
 
 def get_today_checkins(reservations: List[Dict]) -> List[Dict]:
@@ -63,6 +93,16 @@ def get_today_checkouts(reservations: List[Dict]) -> List[Dict]:
     return checkouts
 
 
+# 기존 Status 값을 새 형식으로 정규화
+RESERVATION_STATUS_MAP = {
+    'confirmed': 'Reserved',
+    'Not Checked': 'Reserved',
+    'checked_in': 'Checked in',
+    'checked_out': 'Checked out',
+    'cancelled': 'Reserved'
+}
+
+
 def reservation_dict_to_model(res_dict: Dict) -> Reservation:
     """딕셔너리를 Reservation 모델로 변환"""
     # status가 비어있으면 기본값 설정
@@ -71,15 +111,7 @@ def reservation_dict_to_model(res_dict: Dict) -> Reservation:
         status = 'Reserved'
     
     # Status 값 정규화 (기존 값들을 새 형식으로 변환)
-    status_map = {
-        'confirmed': 'Reserved',
-        'Not Checked': 'Reserved',
-        'checked_in': 'Checked in',
-        'checked_out': 'Checked out',
-        'cancelled': 'Reserved'
-    }
-    if status in status_map:
-        status = status_map[status]
+    status = RESERVATION_STATUS_MAP.get(status, status)
     
     # booking_reference가 비어있으면 기본값 설정
     booking_ref = res_dict.get('booking_reference', '').strip()
@@ -101,3 +133,73 @@ def reservation_dict_to_model(res_dict: Dict) -> Reservation:
         created_at=res_dict.get('created_at')
     )
 
+
+def reservation_rows_to_records(rows) -> List[Dict]:
+    """DB 조회 행(MySQLDB.RESERVATION_COLUMNS 순서)을 ReservationRecord(models) dict로 변환
+    
+    DB 컬럼 타입(date, datetime)을 그대로 쓰므로 문자열 변환/날짜 재파싱/모델 검증을 하지 않습니다.
+    정규화 규칙은 reservation_dict_to_model과 같습니다.
+    """
+    status_map = RESERVATION_STATUS_MAP
+    records = []
+    for (reservation_id, customer_id, room_id, platform_id, check_in, check_out,
+         guests, total_price, status, booking_reference, notes, created_at) in rows:
+        status = (status or '').strip() or 'Reserved'
+        booking_reference = (booking_reference or '').strip()
+        records.append({
+            "id": str(reservation_id),
+            "customer_id": str(customer_id),
+            "room_id": str(room_id),
+            "platform_id": str(platform_id),
+            "check_in": parse_date(check_in),
+            "check_out": parse_date(check_out),
+            "guests": int(guests) if guests else 0,
+            "total_price": float(total_price) if total_price else 0.0,
+            "status": status_map.get(status, status),
+            "booking_reference": booking_reference or f"REF-{reservation_id}",
+            "notes": notes.strip() if notes else None,
+            "created_at": created_at
+        })
+    return records
+
+
+def _reservation_status(status) -> str:
+    status = (status or '').strip() or 'Reserved'
+    return RESERVATION_STATUS_MAP.get(status, status)
+
+
+# ?fields= 조회용 예약 필드별 변환 (컬럼 값 -> 응답 값, reservation_rows_to_records와 같은 규칙)
+# booking_reference는 id가 필요하므로 reservation_rows_to_partial_records에서 따로 처리
+RESERVATION_FIELD_CONVERTERS = {
+    "id": str,
+    "customer_id": str,
+    "room_id": str,
+    "platform_id": str,
+    "check_in": parse_date,
+    "check_out": parse_date,
+    "guests": lambda value: int(value) if value else 0,
+    "total_price": lambda value: float(value) if value else 0.0,
+    "status": _reservation_status,
+    "notes": lambda value: value.strip() if value else None,
+    "created_at": None,
+}
+
+
+def reservation_rows_to_partial_records(rows, fields) -> List[Dict]:
+    """필드 이름으로 조회한 행(id 포함)을 요청한 필드만 있는 ReservationRecord dict로 변환
+    
+    행마다 필드를 꺼내지 않고 컬럼 단위로 변환한 뒤 다시 묶습니다.
+    """
+    if not rows:
+        return []
+    columns = dict(zip(rows[0]._fields, zip(*rows)))
+    values = []
+    for name in fields:
+        if name == "booking_reference":
+            values.append([(reference or '').strip() or f"REF-{reservation_id}"
+                           for reference, reservation_id in zip(columns[name], columns["id"])])
+        elif RESERVATION_FIELD_CONVERTERS[name] is None:
+            values.append(columns[name])
+        else:
+            values.append(list(map(RESERVATION_FIELD_CONVERTERS[name], columns[name])))
+    return [dict(zip(fields, row)) for row in zip(*values)]
@@ -0,0 +1,250 @@
+"""
+테이블 버전 카운터와 ETag 조건부 GET
+
+MySQLDB 쓰기 메서드는 커밋할 때 같은 트랜잭션에서 변경한 테이블의 버전을 올립니다.
+조회 엔드포인트는 관련 테이블 버전으로 약한 ETag를 만들고, 클라이언트가 보낸
+If-None-Match와 같으면 쿼리/직렬화 없이 304를 반환합니다.
+
+버전은 DB의 table_versions 테이블에 저장되므로 여러 워커와 오프라인 스크립트
+(migrate_db.py, rebuild_daily_stats.py, migrate_from_sheets.py)의 변경도 반영됩니다.
+각 프로세스는 버전을 최대 TABLE_VERSIONS_REFRESH초 동안 메모리에 두고 읽으며,
+자기 프로세스의 쓰기는 즉시 반영합니다. SQL로 직접 데이터를 고친 경우에는
+bump_table_versions.py로 버전을 올려야 합니다.
+
+table_versions 테이블이 없으면(migrate_db.py 미적용) 프로세스 메모리 카운터만 사용합니다.
+이 경우 다른 프로세스의 변경은 API를 재시작해야 반영됩니다.
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import event, inspect, select, update
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.db_models import TableVersion
+
+# 커밋 때 DB 버전을 올릴 테이블 (Session.info 키)
+PENDING_KEY = "table_versions_pending"
+
+
+class TableVersions:
+    """테이블별 버전 카운터 (DB 공유 버전 + 프로세스 메모리 대체 카운터, 스레드 안전)"""
+
+    def __init__(self, refresh_seconds: float = 1.0):
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        # 재시작 전후 ETag가 겹치지 않도록 프로세스 시작 시각을 포함 (메모리 카운터 모드)
+        self.epoch = format(time.time_ns(), "x")
+        self.refresh_seconds = refresh_seconds
+        self._shared: Dict[str, int] = {}
+        self._loaded_at: Optional[float] = None
+        # 로컬 쓰기마다 증가: 쓰기 전에 시작한 조회 결과가 최신으로 기록되지 않도록 함
+        self._generation = 0
+        # None: 아직 확인 전, False: table_versions 테이블 없음
+        self._shared_available: Optional[bool] = None
+        self._suspended = 0
+
+    def _bump_local(self, tables):
+        """메모리 카운터 증가 후 다음 조회에서 DB 버전을 다시 읽도록 함"""
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+            self._generation += 1
+            self._loaded_at = None
+
+    def _disable_shared(self):
+        """table_versions 테이블이 없으면 메모리 카운터만 사용 (한 번만 알림)"""
+        with self._lock:
+            if self._shared_available is False:
+                return
+            self._shared_available = False
+        print("[VERSIONS] table_versions table not found (run: python migrate_db.py); "
+              "using in-process versions only", file=sys.stderr, flush=True)
+
+    def bump(self, *tables: str):
+        """테이블 버전 증가 (별도 트랜잭션, 스크립트용 - API 쓰기는 writes 데코레이터 사용)"""
+        self._bump_local(tables)
+        if self._shared_available is False:
+            return
+        try:
+            with engine.begin() as conn:
+                if not inspect(conn).has_table(TableVersion.__tablename__):
+                    self._disable_shared()
+                    return
+                self._bump_shared(conn, tables)
+        except SQLAlchemyError as e:
+            print(f"[VERSIONS ERROR] Table version bump failed for {', '.join(tables)}: {e}",
+                  file=sys.stderr, flush=True)
+
+    def track(self, session: Session, tables):
+        """세션의 다음 커밋에 테이블 버전 증가를 포함 (쓰기와 같은 트랜잭션)"""
+        if self._suspended or self._shared_available is False:
+            return
+        session.info.setdefault(PENDING_KEY, set()).update(tables)
+
+    def _bump_pending(self, session: Session):
+        """before_commit: 세션에 기록된 테이블의 DB 버전을 커밋 직전에 증가"""
+        # savepoint 커밋에서는 올리지 않음 (savepoint가 롤백되면 버전 증가도 사라지므로)
+        if session.in_nested_transaction():
+            return
+        tables = session.info.pop(PENDING_KEY, None)
+        if not tables or self._shared_available is False:
+            return
+        tables = sorted(tables)
+        try:
+            # 버전 증가가 실패해도 쓰기 메서드의 변경은 그대로 커밋되도록 savepoint 안에서 실행
+            with session.begin_nested():
+                self._bump_shared(session, tables)
+        except SQLAlchemyError as e:
+            if not inspect(session.connection()).has_table(TableVersion.__tablename__):
+                self._disable_shared()
+                return
+            print(f"[VERSIONS ERROR] Table version bump failed for {', '.join(tables)}: {e}",
+                  file=sys.stderr, flush=True)
+
+    @contextmanager
+    def suspended(self):
+        """블록 안의 쓰기는 DB 버전을 올리지 않음 (마이그레이션: 끝에 bump로 한 번에 올림)"""
+        self._suspended += 1
+        try:
+            yield
+        finally:
+            self._suspended -= 1
+
+    @staticmethod
+    def _bump_shared(conn, tables):
+        for table in tables:
+            result = conn.execute(
+                update(TableVersion).where(TableVersion.table_name == table)
+                .values(version=TableVersion.version + 1)
+            )
+            if result.rowcount:
+                continue
+            # 처음 쓰는 테이블: DB를 새로 만든 경우에도 이전 ETag와 겹치지 않도록 현재 시각(ms)에서 시작
+            try:
+                with conn.begin_nested():
+                    conn.execute(TableVersion.__table__.insert().values(
+                        table_name=table, version=time.time_ns() // 1_000_000
+                    ))
+            except IntegrityError:
+                # 다른 프로세스가 먼저 추가함
+                conn.execute(
+                    update(TableVersion).where(TableVersion.table_name == table)
+                    .values(version=TableVersion.version + 1)
+                )
+
+    def _refresh(self, session: Optional[Session] = None):
+        """DB 버전 다시 읽기 (refresh_seconds 이내에 읽었으면 생략)
+
+        session이 있으면 그 커넥션으로 읽습니다 (AsyncMySQLDB의 run_sync 경로에서 이벤트 루프를
+        막지 않음). 없으면 동기 엔진을 사용하므로 스레드풀이나 스크립트에서만 호출해야 합니다.
+        """
+        with self._lock:
+            if self._shared_available is False:
+                return
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.refresh_seconds:
+                return
+            generation = self._generation
+        query = select(TableVersion.table_name, TableVersion.version)
+        try:
+            if session is not None:
+                rows = session.execute(query).all()
+            else:
+                with engine.connect() as conn:
+                    rows = conn.execute(query).all()
+        except SQLAlchemyError:
+            with self._lock:
+                checked = self._shared_available is not None
+            if not checked:
+                self._disable_shared()
+            return
+        with self._lock:
+            self._shared = dict(rows)
+            self._shared_available = True
+            if generation == self._generation:
+                self._loaded_at = time.monotonic()
+
+    def get(self, table: str, session: Optional[Session] = None) -> int:
+        """현재 테이블 버전"""
+        self._refresh(session)
+        with self._lock:
+            if self._shared_available:
+                return self._shared.get(table, 0)
+            return self._versions.get(table, 0)
+
+    def etag(self, *tables: str, session: Optional[Session] = None) -> str:
+        """테이블 버전으로 만든 약한 ETag"""
+        self._refresh(session)
+        with self._lock:
+            if self._shared_available:
+                parts = [f"{self._shared.get(t, 0)}" for t in tables]
+                return f'W/"{".".join(parts)}"'
+            parts = [f"{self._versions.get(t, 0)}" for t in tables]
+        return f'W/"{self.epoch}-{".".join(parts)}"'
+
+
+table_versions = TableVersions(refresh_seconds=float(os.getenv("TABLE_VERSIONS_REFRESH", "1")))
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_pending_versions(session):
+    table_versions._bump_pending(session)
+
+
+def writes(*tables: str) -> Callable:
+    """MySQLDB 쓰기 메서드 데코레이터: 테이블 버전 증가
+
+    DB 버전은 메서드가 하는 커밋과 같은 트랜잭션에서 올리고(before_commit), 커밋하지 않은
+    변경에는 올리지 않습니다. 메모리 카운터는 예외가 나도 올립니다
+    (불필요한 304 미스는 괜찮지만 오래된 304는 안 됨).
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            session = getattr(args[0], "db", None) if args else None
+            if session is not None:
+                table_versions.track(session, tables)
+            try:
+                return method(*args, **kwargs)
+            finally:
+                table_versions._bump_local(tables)
+        return wrapper
+    return decorator
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def conditional_get(*tables: str) -> Callable:
+    """라우트 dependency: 테이블 버전이 그대로면 304, 아니면 응답에 ETag 설정
+
+    라우트 데코레이터의 dependencies=[Depends(...)]로 등록하면 get_db보다 먼저 실행되어
+    304일 때는 DB 커넥션도 사용하지 않습니다.
+    """
+    def dependency(request: Request, response: Response):
+        etag = table_versions.etag(*tables)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+    return dependency
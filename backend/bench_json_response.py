@@ -0,0 +1,108 @@
+"""
+JSON 응답 직렬화 벤치마크
+합성 예약 목록(date/datetime/float/한글 포함)으로 응답 본문을 만드는 시간을 비교합니다.
+DB 연결 없이 실행됩니다.
+
+비교 경로:
+    encoder + json      이전 기본값 (response_model 없는 라우트: jsonable_encoder -> JSONResponse)
+    encoder + orjson    현재 기본값 (response_model 없는 라우트: jsonable_encoder -> OrjsonResponse)
+    pydantic + json     이전 기본값 (response_model 라우트: pydantic 직렬화 -> JSONResponse)
+    pydantic + orjson   현재 기본값 (response_model 라우트: pydantic 직렬화 -> OrjsonResponse)
+    orjson native       OrjsonResponse에 date/datetime을 그대로 전달 (GET /api/reservations/)
+    adapter dump_json   TypeAdapter(List[ReservationRecord]) 일괄 직렬화
+
+사용법:
+    python bench_json_response.py                        # 10k, 100k, 1M 행
+    python bench_json_response.py 10000 50000            # 행 수 지정
+    python bench_json_response.py --encoder-limit 0      # jsonable_encoder 경로 생략
+
+jsonable_encoder 경로는 매우 느리므로 기본적으로 100k 행까지만 측정합니다.
+"""
+import sys
+import os
+import time
+import argparse
+from datetime import date, datetime, timedelta
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+from app.models import ReservationRecord
+from app.responses import OrjsonResponse
+
+reservation_list_adapter = TypeAdapter(List[ReservationRecord])
+
+STATUSES = ["Reserved", "Checked in", "Checked out"]
+
+
+def synthetic_reservations(count: int):
+    """ReservationRecord 형태의 합성 예약 목록"""
+    base = date(2024, 1, 1)
+    created = datetime(2024, 1, 1, 9, 30, 15, 123456)
+    rows = []
+    for i in range(count):
+        check_in = base + timedelta(days=i % 1095)
+        rows.append({
+            "id": str(i + 1),
+            "customer_id": str(i % 5000 + 1),
+            "room_id": str(i % 40 + 1),
+            "platform_id": str(i % 4 + 1),
+            "check_in": check_in,
+            "check_out": check_in + timedelta(days=i % 5 + 1),
+            "guests": i % 4 + 1,
+            "total_price": round(85.5 + (i % 300) * 1.25, 2),
+            "status": STATUSES[i % 3],
+            "booking_reference": f"BK-{i:08d}",
+            "notes": "늦은 체크인 요청" if i % 7 == 0 else None,
+            "created_at": created + timedelta(minutes=i),
+        })
+    return rows
+
+
+def _timed(func):
+    start = time.perf_counter()
+    body = func()
+    return time.perf_counter() - start, body
+
+
+def bench(sizes, encoder_limit: int):
+    print(f"{'rows':>9}  {'path':<20}{'seconds':>9}{'MB':>8}{'vs before':>11}")
+    for count in sizes:
+        rows = synthetic_reservations(count)
+        results = []
+        if count <= encoder_limit:
+            results.append(("encoder + json", lambda: JSONResponse(jsonable_encoder(rows)).body))
+            results.append(("encoder + orjson", lambda: OrjsonResponse(jsonable_encoder(rows)).body))
+        results += [
+            ("pydantic + json", lambda: JSONResponse(reservation_list_adapter.dump_python(rows, mode="json")).body),
+            ("pydantic + orjson", lambda: OrjsonResponse(reservation_list_adapter.dump_python(rows, mode="json")).body),
+            ("orjson native", lambda: OrjsonResponse(rows).body),
+            ("adapter dump_json", lambda: reservation_list_adapter.dump_json(rows)),
+        ]
+
+        baseline = None
+        reference = None
+        for name, func in results:
+            seconds, body = _timed(func)
+            # 모든 경로의 출력이 같은지 확인
+            if reference is None:
+                reference = body
+            elif body != reference:
+                print(f"  !! {name} output differs from {results[0][0]}")
+            if name in ("encoder + json", "pydantic + json") and baseline is None:
+                baseline = seconds
+            speedup = f"{baseline / seconds:.1f}x" if baseline else ""
+            print(f"{count:>9}  {name:<20}{seconds:>9.3f}{len(body) / 1e6:>8.1f}{speedup:>11}")
+        print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON response serialization benchmark")
+    parser.add_argument("sizes", nargs="*", type=int, default=[10000, 100000, 1000000])
+    parser.add_argument("--encoder-limit", type=int, default=100000,
+                        help="jsonable_encoder 경로를 측정할 최대 행 수")
+    args = parser.parse_args()
+    bench(args.sizes, args.encoder_limit)
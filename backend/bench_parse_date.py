@@ -0,0 +1,70 @@
+"""
+날짜 파싱 마이크로 벤치마크
+app.utils.parse_date를 이전 구현(형식을 순서대로 strptime 시도)과 비교합니다.
+DB 연결 없이 실행됩니다.
+
+사용법:
+    python bench_parse_date.py             # 기본 10만 건
+    python bench_parse_date.py 1000000     # 건수 지정
+"""
+import sys
+import os
+import random
+import timeit
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils import DATE_FORMATS, parse_date
+
+
+def legacy_parse_date(date_str) -> date:
+    """이전 구현 (비교용)"""
+    if isinstance(date_str, date):
+        return date_str
+    if isinstance(date_str, datetime):
+        return date_str.date()
+
+    if not date_str:
+        raise ValueError("Empty date string")
+
+    date_str = str(date_str).strip()
+
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except:
+            continue
+
+    raise ValueError(f"Unable to parse date: {date_str}")
+
+
+def _workloads(count: int):
+    """(이름, 값 목록) - 2년치 날짜 중 임의 선택"""
+    rng = random.Random(42)
+    days = [date(2025, 1, 1) + timedelta(days=rng.randrange(730)) for _ in range(count)]
+    return [
+        ("ISO string (MySQL _to_dict / API)", [d.isoformat() for d in days]),
+        ("date object", days),
+        ("DD/MM/YYYY (Sheets)", [d.strftime('%d/%m/%Y') for d in days]),
+        ("MM-DD-YYYY (Sheets)", [d.strftime('%m-%d-%Y') for d in days]),
+    ]
+
+
+def bench(count: int):
+    print(f"{count} values per workload, best of 3 (ms)")
+    print(f"{'workload':<36}{'legacy':>10}{'parse_date':>12}{'speedup':>10}")
+    for name, values in _workloads(count):
+        # 결과가 같은지 먼저 확인
+        assert [legacy_parse_date(v) for v in values[:1000]] == [parse_date(v) for v in values[:1000]]
+
+        legacy = min(timeit.repeat(lambda: [legacy_parse_date(v) for v in values], number=1, repeat=3))
+        current = min(timeit.repeat(lambda: [parse_date(v) for v in values], number=1, repeat=3))
+        print(f"{name:<36}{legacy * 1000:>10.1f}{current * 1000:>12.1f}{legacy / current:>9.1f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        print("Usage: python bench_parse_date.py [COUNT]")
+        sys.exit(1)
+    bench(int(sys.argv[1]) if len(sys.argv) == 2 else 100000)
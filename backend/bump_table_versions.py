@@ -0,0 +1,33 @@
+"""
+테이블 버전 증가 스크립트
+SQL로 직접 데이터를 수정한 뒤 실행 중인 API가 이전 ETag(304)와 캐시를 쓰지 않도록 버전을 올립니다.
+(MySQLDB를 사용하는 스크립트 - rebuild_daily_stats.py, migrate_from_sheets.py, migrate_db.py - 는
+자동으로 버전을 올리므로 필요 없습니다.)
+
+사용법:
+    python bump_table_versions.py                      # 모든 데이터 테이블
+    python bump_table_versions.py reservations rooms   # 지정한 테이블만
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.versions import table_versions
+from migrate_db import DATA_TABLES
+
+
+def bump(tables):
+    """테이블 버전 증가"""
+    unknown = [t for t in tables if t not in DATA_TABLES]
+    if unknown:
+        print(f"Unknown table(s): {', '.join(unknown)}. Must be one of: {', '.join(DATA_TABLES)}")
+        return False
+    table_versions.bump(*tables)
+    for table in tables:
+        print(f"  - {table}: version {table_versions.get(table)}")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if bump(sys.argv[1:] or DATA_TABLES) else 1)
@@ -0,0 +1,165 @@
+"""
+인덱스 사용 확인 스크립트
+라우터가 사용하는 MySQLDB 조회 쿼리를 실제로 실행해 SQL을 수집하고,
+EXPLAIN 결과로 각 쿼리가 인덱스로 필요한 범위만 찾는지 확인합니다.
+테이블 풀 스캔뿐 아니라 인덱스 전체를 훑는 풀 인덱스 스캔도 실패로 보고합니다.
+(MySQL type=ALL/index, SQLite 'SCAN ...')
+KNOWN_LIMITATIONS에 있는 항목은 [KNOWN]으로 표시하고 실패로 세지 않습니다.
+
+사용법:
+    python migrate_db.py      # 인덱스 먼저 적용
+    python check_indexes.py
+
+참고: 행 수가 매우 적은 테이블에서는 MySQL 옵티마이저가 인덱스 대신
+풀 스캔을 선택할 수 있으므로 운영 규모의 데이터로 확인하세요.
+"""
+import sys
+import os
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import event
+from app.database import engine
+from app.db import MySQLDB
+
+
+# 예약 상태 (앱이 저장하는 값)
+PROBE_STATUSES = ['Reserved', 'Checked in']
+
+# (DB 종류, 라우터, 설명) -> 이유: 이 환경에서는 범위 조회가 불가능한 것으로 알려진 쿼리
+KNOWN_LIMITATIONS = {
+    ("sqlite", "customers", "GET / name prefix"):
+        "SQLite LIKE is case-insensitive, so it cannot seek the case-sensitive ix_customers_name index",
+}
+
+
+def _checks():
+    """(라우터, 설명, MySQLDB 호출) 목록"""
+    today = date.today()
+    month_start = today.replace(day=1)
+    return [
+        ("reservations", "POST / duplicate check",
+         lambda db: db.check_duplicate_reservation("1", today, today + timedelta(days=2))),
+        ("calendar", "month view overlap",
+         lambda db: db.get_reservations_overlapping(month_start, month_start + timedelta(days=30))),
+        ("revenue / reports", "check-in window",
+         lambda db: db.get_reservations_checking_in(month_start, month_start + timedelta(days=30))),
+        ("checkinout / dashboard", "check-out window by status",
+         lambda db: db.get_reservations_checking_out(today, today + timedelta(days=7), statuses=PROBE_STATUSES)),
+        ("dashboard", "active reservation count",
+         lambda db: db.count_reservations(statuses=PROBE_STATUSES)),
+        ("room-notes", "urgent alerts",
+         lambda db: db.get_urgent_notes()),
+        ("room-notes", "after-checkout alerts",
+         lambda db: db.get_after_checkout_notes()),
+        ("room-notes", "progress filter",
+         lambda db: db.get_notes_by_progress("confirm")),
+        ("room-notes", "notes by room",
+         lambda db: db.get_notes_by_room("101")),
+        ("reservations", "GET / page by check_in",
+         lambda db: db.list_reservations(limit=50, sort="check_in", status=PROBE_STATUSES[0])),
+        ("customers", "GET / name prefix",
+         lambda db: db.list_customers(limit=50, sort="name", name="Kim")),
+    ]
+
+
+def _capture(call):
+    """MySQLDB 호출 중 실행된 SELECT 문과 파라미터 수집"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        db = MySQLDB()
+        try:
+            call(db)
+        finally:
+            db.db.close()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+# EXPLAIN 판정 결과
+OK = "ok"
+INDEX_SCAN = "index_scan"
+TABLE_SCAN = "table_scan"
+KNOWN = "known"
+
+MARKS = {OK: "[OK]        ", INDEX_SCAN: "[INDEX SCAN]", TABLE_SCAN: "[TABLE SCAN]", KNOWN: "[KNOWN]     "}
+
+
+def _explain(statement, parameters):
+    """EXPLAIN 실행 후 (판정, 요약) 반환 (판정: OK, INDEX_SCAN, TABLE_SCAN)"""
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        if engine.dialect.name == "mysql":
+            cursor.execute("EXPLAIN " + statement, parameters)
+            columns = [c[0] for c in cursor.description]
+            rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+            types = {row.get("type") for row in rows}
+            if "ALL" in types:
+                verdict = TABLE_SCAN
+            elif "index" in types:
+                verdict = INDEX_SCAN
+            else:
+                verdict = OK
+            summary = "; ".join(
+                f"{row.get('table')}: type={row.get('type')} key={row.get('key')}" for row in rows
+            )
+        else:
+            cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+            details = [row[-1] for row in cursor.fetchall()]
+            # SQLite: 'SEARCH ...'는 인덱스 범위 조회, 'SCAN ... USING INDEX'는 풀 인덱스 스캔,
+            # 'SCAN <table>'은 테이블 풀 스캔
+            scans = [d for d in details if d.startswith("SCAN") and d != "SCAN CONSTANT ROW"]
+            if any("INDEX" not in d for d in scans):
+                verdict = TABLE_SCAN
+            elif scans:
+                verdict = INDEX_SCAN
+            else:
+                verdict = OK
+            summary = "; ".join(details)
+        return verdict, summary
+    finally:
+        raw.close()
+
+
+def check_indexes():
+    """모든 조회 쿼리의 EXPLAIN 결과 출력"""
+    print("=" * 70)
+    print(f"EXPLAIN check ({engine.dialect.name})")
+    print("=" * 70)
+
+    counts = {OK: 0, INDEX_SCAN: 0, TABLE_SCAN: 0, KNOWN: 0}
+    for router, label, call in _checks():
+        limitation = KNOWN_LIMITATIONS.get((engine.dialect.name, router, label))
+        for statement, parameters in _capture(call):
+            verdict, summary = _explain(statement, parameters)
+            if verdict != OK and limitation:
+                verdict = KNOWN
+                summary = f"{summary} ({limitation})"
+            counts[verdict] += 1
+            print(f"{MARKS[verdict]} {router:24s} {label}")
+            print(f"              {summary}")
+
+    print("=" * 70)
+    if counts[TABLE_SCAN]:
+        print(f"{counts[TABLE_SCAN]} query(s) use a full table scan. Run: python migrate_db.py")
+    if counts[INDEX_SCAN]:
+        print(f"{counts[INDEX_SCAN]} query(s) scan a whole index instead of seeking a range.")
+    if counts[KNOWN]:
+        print(f"{counts[KNOWN]} query(s) scan because of a known {engine.dialect.name} limitation (not a failure).")
+    if not counts[TABLE_SCAN] and not counts[INDEX_SCAN]:
+        print("All other checked queries use an index range lookup." if counts[KNOWN]
+              else "All checked queries use an index range lookup.")
+    return not counts[TABLE_SCAN] and not counts[INDEX_SCAN]
+
+
+if __name__ == "__main__":
+    sys.exit(0 if check_indexes() else 1)
@@ -0,0 +1,42 @@
+"""
+예약 데이터 Parquet 내보내기 스크립트 (분석용, /api/reports/reservations/parquet 와 같은 형식)
+서버 측 커서로 배치 단위 조회 후 배치마다 row group 하나로 기록하므로 메모리 사용량이 일정합니다.
+
+사용법:
+    python export_parquet.py reservations.parquet                          # 전체
+    python export_parquet.py reservations.parquet 2026-01-01 2026-12-31    # 체크인 기준 기간
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.db import MySQLDB
+from app.parquet_export import write_reservations_parquet
+
+# row group 크기 (한 번에 조회하는 행 수)
+BATCH_SIZE = 50000
+
+
+def export(path: str, start: str = None, end: str = None):
+    """예약을 Parquet 파일로 저장"""
+    period = f"{start} ~ {end}" if start and end else "all dates"
+    print(f"Exporting reservations ({period}) to {path}...")
+    stmt = MySQLDB.reservation_analytics_select(start, end).execution_options(yield_per=BATCH_SIZE)
+    with MySQLDB() as db:
+        result = db.db.execute(stmt)
+        try:
+            rows = write_reservations_parquet(result.partitions(), path)
+        finally:
+            result.close()
+    print(f"Done. {rows} reservations written.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4:
+        export(sys.argv[1], sys.argv[2], sys.argv[3])
+    elif len(sys.argv) == 2:
+        export(sys.argv[1])
+    else:
+        print("Usage: python export_parquet.py OUTPUT_PATH [START_DATE END_DATE]")
+        sys.exit(1)
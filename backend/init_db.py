@@ -4,8 +4,10 @@ MySQL 데이터베이스와 테이블을 생성합니다.
 """
 from app.database import engine, Base
 from app.db_models import (
-    Customer, Room, Reservation, Admin, RoomNote, BookingPlatform
+    Customer, Room, Reservation, Admin, RoomNote, BookingPlatform, DailyStat, RoomNight, SchemaMigration,
+    TableVersion
 )
+from migrate_db import stamp_all
 
 def init_db():
     """데이터베이스 테이블 생성"""
@@ -17,9 +19,15 @@ def init_db():
     print("  - reservations")
     print("  - admins")
     print("  - room_notes")
+    print("  - room_nights")
+    print("  - daily_stats")
+    print("  - table_versions")
+    print("  - schema_migrations")
     print()
     
     Base.metadata.create_all(bind=engine)
+    # 새로 만든 테이블에는 모든 인덱스가 포함되어 있으므로 마이그레이션 완료로 기록
+    stamp_all()
     print("Database tables created successfully!")
 
 if __name__ == "__main__":
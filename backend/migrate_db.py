@@ -0,0 +1,154 @@
+"""
+데이터베이스 스키마 마이그레이션 스크립트
+이미 운영 중인 데이터베이스에 버전별 스키마 변경을 순서대로 적용합니다.
+
+사용법:
+    python migrate_db.py            # 적용되지 않은 마이그레이션 실행
+    python migrate_db.py --status   # 현재 적용 상태 확인
+"""
+import sys
+from sqlalchemy import inspect, text
+from sqlalchemy.orm import Session
+from app.database import engine
+from app.db import MySQLDB
+from app.db_models import SchemaMigration, DailyStat, RoomNight, TableVersion
+from app.versions import table_versions
+
+# 마이그레이션 후 버전을 올릴 데이터 테이블 (API의 ETag/캐시 무효화)
+DATA_TABLES = [
+    "customers", "rooms", "booking_platforms", "reservations", "admins", "room_notes",
+    "room_nights", "daily_stats",
+]
+
+
+def _create_index(conn, table_name: str, index_name: str, columns: list):
+    """인덱스 생성 (이미 있으면 건너뜀, MySQL은 온라인 DDL 사용)"""
+    existing = {ix["name"] for ix in inspect(conn).get_indexes(table_name)}
+    if index_name in existing:
+        print(f"  - {index_name}: already exists, skipped")
+        return
+
+    column_sql = ", ".join(columns)
+    if conn.dialect.name == "mysql":
+        # 테이블 잠금 없이 인덱스 생성 (읽기/쓰기 계속 가능)
+        conn.execute(text(
+            f"ALTER TABLE {table_name} ADD INDEX {index_name} ({column_sql}), "
+            f"ALGORITHM=INPLACE, LOCK=NONE"
+        ))
+    else:
+        conn.execute(text(f"CREATE INDEX {index_name} ON {table_name} ({column_sql})"))
+    print(f"  - {index_name}: created on {table_name}({column_sql})")
+
+
+def migration_001_access_path_indexes(conn):
+    """예약/노트 조회 경로 인덱스 추가"""
+    _create_index(conn, "reservations", "ix_reservations_room_dates", ["room_id", "check_in", "check_out"])
+    _create_index(conn, "reservations", "ix_reservations_check_in", ["check_in"])
+    _create_index(conn, "reservations", "ix_reservations_check_out", ["check_out"])
+    _create_index(conn, "reservations", "ix_reservations_status", ["status"])
+    _create_index(conn, "reservations", "ix_reservations_customer_id", ["customer_id"])
+    _create_index(conn, "reservations", "ix_reservations_booking_reference", ["booking_reference"])
+    _create_index(conn, "room_notes", "ix_room_notes_type_status", ["note_type", "status"])
+    _create_index(conn, "room_notes", "ix_room_notes_progress", ["progress"])
+    _create_index(conn, "room_notes", "ix_room_notes_room_id", ["room_id"])
+
+
+
+def migration_002_daily_stats(conn):
+    """daily_stats 집계 테이블 생성 후 기존 예약으로 채움"""
+    DailyStat.__table__.create(bind=conn, checkfirst=True)
+    processed = MySQLDB(Session(bind=conn)).rebuild_daily_stats()
+    print(f"  - daily_stats: backfilled from {processed} reservations")
+
+
+
+def migration_003_room_nights(conn):
+    """room_nights 원장 테이블 생성 후 기존 예약으로 채움"""
+    RoomNight.__table__.create(bind=conn, checkfirst=True)
+    conflicts = MySQLDB(Session(bind=conn)).rebuild_room_nights()
+    print(f"  - room_nights: backfilled, {len(conflicts)} overlapping night(s) skipped")
+    for conflict in conflicts:
+        print(f"    room {conflict['room_id']} {conflict['night']}: reservation {conflict['reservation_id']} overlaps an earlier booking")
+
+
+
+def migration_004_list_sort_indexes(conn):
+    """목록 페이지네이션 정렬 키 인덱스 추가"""
+    _create_index(conn, "customers", "ix_customers_name", ["name"])
+    _create_index(conn, "room_notes", "ix_room_notes_created_at", ["created_at"])
+
+
+def migration_005_table_versions(conn):
+    """table_versions 테이블 생성 (여러 워커/스크립트가 공유하는 ETag 버전)"""
+    TableVersion.__table__.create(bind=conn, checkfirst=True)
+
+
+# (버전, 설명, 함수) - 새 마이그레이션은 항상 목록 끝에 추가
+MIGRATIONS = [
+    (1, "Add reservation and room note access path indexes", migration_001_access_path_indexes),
+    (2, "Add daily_stats rollup table", migration_002_daily_stats),
+    (3, "Add room_nights ledger table", migration_003_room_nights),
+    (4, "Add list sort key indexes", migration_004_list_sort_indexes),
+    (5, "Add shared table_versions table", migration_005_table_versions),
+]
+
+
+def get_applied_versions(conn) -> set:
+    """적용된 마이그레이션 버전 목록"""
+    SchemaMigration.__table__.create(bind=conn, checkfirst=True)
+    rows = conn.execute(text("SELECT version FROM schema_migrations")).fetchall()
+    return {row[0] for row in rows}
+
+
+def _record(conn, version: int, description: str):
+    conn.execute(
+        SchemaMigration.__table__.insert().values(version=version, description=description)
+    )
+
+
+def stamp_all():
+    """모든 마이그레이션을 적용된 것으로 기록 (init_db.py로 새로 만든 DB용)"""
+    with engine.begin() as conn:
+        applied = get_applied_versions(conn)
+        for version, description, _ in MIGRATIONS:
+            if version not in applied:
+                _record(conn, version, description)
+
+
+def migrate():
+    """적용되지 않은 마이그레이션을 순서대로 실행"""
+    with engine.begin() as conn:
+        applied = get_applied_versions(conn)
+
+    pending = [m for m in MIGRATIONS if m[0] not in applied]
+    if not pending:
+        print("Database schema is up to date.")
+        return
+
+    # 마이그레이션 중 쓰기(002/003 백필)는 DB 버전을 올리지 않음 (table_versions는 005에서 생성)
+    with table_versions.suspended():
+        for version, description, func in pending:
+            print(f"Applying migration {version:03d}: {description}")
+            # 마이그레이션마다 별도 트랜잭션 (MySQL DDL은 자동 커밋되므로 버전 기록은 마지막에)
+            with engine.begin() as conn:
+                func(conn)
+                _record(conn, version, description)
+    # 실행 중인 API가 이전 ETag/캐시를 쓰지 않도록 모든 데이터 테이블 버전 증가
+    table_versions.bump(*DATA_TABLES)
+    print("Migrations applied successfully!")
+
+
+def show_status():
+    """마이그레이션 적용 상태 출력"""
+    with engine.begin() as conn:
+        applied = get_applied_versions(conn)
+    for version, description, _ in MIGRATIONS:
+        mark = "applied" if version in applied else "pending"
+        print(f"  {version:03d} [{mark}] {description}")
+
+
+if __name__ == "__main__":
+    if "--status" in sys.argv:
+        show_status()
+    else:
+        migrate()
@@ -0,0 +1,33 @@
+"""
+daily_stats 집계 테이블 재계산 스크립트
+예약 데이터를 직접 수정했거나 과거 데이터를 일괄 입력한 뒤 집계를 다시 맞출 때 사용합니다.
+
+사용법:
+    python rebuild_daily_stats.py                          # 전체 재계산
+    python rebuild_daily_stats.py 2026-01-01 2026-12-31    # 기간만 재계산
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.db import MySQLDB
+
+
+def rebuild(start: str = None, end: str = None):
+    """daily_stats 재계산"""
+    period = f"{start} ~ {end}" if start and end else "all dates"
+    print(f"Rebuilding daily_stats ({period})...")
+    with MySQLDB() as db:
+        processed = db.rebuild_daily_stats(start, end)
+    print(f"Done. {processed} reservations processed.")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        rebuild(sys.argv[1], sys.argv[2])
+    elif len(sys.argv) == 1:
+        rebuild()
+    else:
+        print("Usage: python rebuild_daily_stats.py [START_DATE END_DATE]")
+        sys.exit(1)
@@ -0,0 +1,62 @@
+"""
+날짜 파서 테스트 스크립트
+parse_date / DateParser가 형식 목록 순서대로 해석하고, 캐시가 결과를 바꾸지 않는지 확인합니다.
+DB 연결 없이 실행됩니다.
+
+사용법:
+    python test_date_parser.py
+"""
+import sys
+import os
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.utils import DateParser, parse_date
+
+# 02/01/2026, 03-04-2026은 여러 형식에 맞는 값 (일/월, 월/일)
+VALUES = ["13/01/2026", "02/01/2026", "01/13/2026", "03-04-2026", "04-13-2026", "2026-05-06", "20260102"]
+
+
+def test_formats_in_order():
+    """여러 형식에 맞는 값은 앞에 있는 형식으로 해석"""
+    assert parse_date("02/01/2026") == date(2026, 1, 2)
+    assert parse_date("01/13/2026") == date(2026, 1, 13)
+    assert parse_date("03-04-2026") == date(2026, 4, 3)
+    assert parse_date("04-13-2026") == date(2026, 4, 13)
+    assert parse_date(" 2026/05/06 ") == date(2026, 5, 6)
+    assert parse_date(datetime(2026, 5, 6, 12, 30)) == date(2026, 5, 6)
+
+
+def test_read_order_independent():
+    """같은 값들을 다른 순서로 읽어도 같은 날짜"""
+    forward = DateParser()
+    backward = DateParser()
+    forward_dates = {v: forward.parse(v) for v in VALUES}
+    backward_dates = {v: backward.parse(v) for v in reversed(VALUES)}
+    assert forward_dates == backward_dates, (forward_dates, backward_dates)
+
+
+def test_cache_eviction():
+    """캐시 크기를 넘어도 결과는 같음"""
+    parser = DateParser(cache_size=2)
+    for _ in range(2):
+        assert [parser.parse(v) for v in VALUES] == [parse_date(v) for v in VALUES]
+
+
+def test_invalid():
+    """형식에 맞지 않는 값은 ValueError"""
+    for value in ["", "2026-13-01", "not a date"]:
+        try:
+            parse_date(value)
+        except ValueError:
+            continue
+        raise AssertionError(f"{value!r} should not parse")
+
+
+if __name__ == "__main__":
+    test_formats_in_order()
+    test_read_order_independent()
+    test_cache_eviction()
+    test_invalid()
+    print("DateParser tests passed.")
@@ -5,13 +5,27 @@ const api = axios.create({
   headers: {
     'Content-Type': 'application/json'
   },
-  timeout: 30000 // 30초 타임아웃 (Google Sheets API는 느릴 수 있음)
+  timeout: 30000, // 30초 타임아웃 (Google Sheets API는 느릴 수 있음)
+  // 304 Not Modified는 캐시된 응답으로 처리
+  validateStatus: status => (status >= 200 && status < 300) || status === 304
 })
 
+// ETag 캐시 (GET URL -> 마지막 200 응답). 서버가 304를 주면 저장된 응답을 그대로 사용
+const ETAG_CACHE_LIMIT = 100
+const etagCache = new Map()
+
+const cacheKey = config => api.getUri(config)
+
 // 요청 인터셉터
 api.interceptors.request.use(
   config => {
     console.log('API Request:', config.method?.toUpperCase(), config.url)
+    if ((config.method || 'get') === 'get') {
+      const cached = etagCache.get(cacheKey(config))
+      if (cached) {
+        config.headers['If-None-Match'] = cached.headers.etag
+      }
+    }
     return config
   },
   error => {
@@ -24,6 +38,23 @@ api.interceptors.request.use(
 api.interceptors.response.use(
   response => {
     console.log('API Response:', response.config.url, response.status)
+    if ((response.config.method || 'get') !== 'get') {
+      return response
+    }
+    const key = cacheKey(response.config)
+    if (response.status === 304) {
+      const cached = etagCache.get(key)
+      if (cached) {
+        return { ...cached, config: response.config }
+      }
+    } else if (response.headers.etag) {
+      // 최근 사용 순서 유지 후 오래된 항목 제거
+      etagCache.delete(key)
+      etagCache.set(key, response)
+      if (etagCache.size > ETAG_CACHE_LIMIT) {
+        etagCache.delete(etagCache.keys().next().value)
+      }
+    }
     return response
   },
   error => {
@@ -34,8 +65,9 @@ api.interceptors.response.use(
 
 export default {
   // 예약 관련
-  getReservations() {
-    return api.get('/reservations/')
+  // params: limit, after(다음 페이지 커서 = 응답 헤더 x-next-cursor) 및 필터
+  getReservations(params = {}) {
+    return api.get('/reservations/', { params })
   },
   getReservation(id) {
     return api.get(`/reservations/${id}`)
@@ -48,10 +80,16 @@ export default {
       params: { check_in: checkIn, check_out: checkOut }
     })
   },
+  // 기간 내 빈 객실 전체 검색 (params: guests, room_type, summary)
+  searchAvailability(checkIn, checkOut, params = {}) {
+    return api.get('/availability/', {
+      params: { check_in: checkIn, check_out: checkOut, ...params }
+    })
+  },
   
   // 방 관련
-  getRooms() {
-    return api.get('/rooms/')
+  getRooms(params = {}) {
+    return api.get('/rooms/', { params })
   },
   getRoom(id) {
     return api.get(`/rooms/${id}`)
@@ -64,6 +102,9 @@ export default {
   getDashboardStats() {
     return api.get('/dashboard/stats')
   },
+  getDashboardOverview() {
+    return api.get('/dashboard/overview')
+  },
   
   // 캘린더 관련
   getMonthReservations(year, month) {
@@ -83,10 +124,18 @@ export default {
   getPlatformRevenue(startDate, endDate) {
     return api.get(`/revenue/platform/${startDate}/${endDate}`)
   },
+  // 숙박일 기준 KPI (점유율, ADR, RevPAR) - 전체/일별/객실 타입별/플랫폼별
+  getRevenueKpi(startDate, endDate) {
+    return api.get(`/revenue/kpi/${startDate}/${endDate}`)
+  },
+  getMonthlyKpi(year) {
+    return api.get(`/revenue/kpi/monthly/${year}`)
+  },
   
   // 고객 관련
-  getCustomers() {
-    return api.get('/customers/')
+  // params: limit, after(다음 페이지 커서 = 응답 헤더 x-next-cursor) 및 필터
+  getCustomers(params = {}) {
+    return api.get('/customers/', { params })
   },
   getCustomer(id) {
     return api.get(`/customers/${id}`)
@@ -135,10 +184,40 @@ export default {
     if (endDate) params.end_date = endDate
     return api.get('/reports/reservations/csv', { params, responseType: 'blob' })
   },
+  // 백그라운드 리포트 작업 (format: csv, xlsx, pdf, parquet)
+  createReportJob(format, startDate, endDate) {
+    return api.post('/reports/jobs', { format, start_date: startDate || null, end_date: endDate || null })
+  },
+  getReportJob(jobId) {
+    return api.get(`/reports/jobs/${jobId}`)
+  },
+  downloadReportJob(jobId) {
+    return api.get(`/reports/jobs/${jobId}/download`, { responseType: 'blob' })
+  },
+  // 작업 등록 후 완료될 때까지 상태 확인, 완료되면 파일(blob) 응답 반환
+  async runReportJob(format, startDate, endDate, onProgress = null, intervalMs = 1000) {
+    const { data: created } = await this.createReportJob(format, startDate, endDate)
+    let job = created
+    while (job.status === 'queued' || job.status === 'running') {
+      await new Promise(resolve => setTimeout(resolve, intervalMs))
+      job = (await this.getReportJob(created.id)).data
+      if (onProgress) onProgress(job)
+    }
+    if (job.status !== 'done') {
+      throw new Error(job.error || `Report job ${job.status}`)
+    }
+    return this.downloadReportJob(job.id)
+  },
+  // 일일 운영 리포트 PDF (reportDate 생략 시 오늘)
+  getDailyOpsReport(reportDate = null) {
+    const params = reportDate ? { report_date: reportDate } : {}
+    return api.get('/reports/daily-ops', { params, responseType: 'blob' })
+  },
   
   // 관리자 관련
-  getAdmins() {
-    return api.get('/admins/')
+  // params: limit, after(다음 페이지 커서 = 응답 헤더 x-next-cursor) 및 필터
+  getAdmins(params = {}) {
+    return api.get('/admins/', { params })
   },
   getAdmin(id) {
     return api.get(`/admins/${id}`)
@@ -178,6 +257,19 @@ export default {
   },
   updateNoteProgress(noteId, progress) {
     return api.put(`/room-notes/${noteId}/progress?progress=${encodeURIComponent(progress || '')}`)
+  },
+
+  // 실시간 이벤트 (SSE). handlers: { room_status, note_created, note_updated, reset }
+  // 재접속 시 브라우저가 Last-Event-ID를 자동으로 보내 놓친 이벤트를 이어 받음
+  // 반환된 EventSource는 화면을 벗어날 때 close() 해야 함
+  subscribeEvents(handlers = {}) {
+    const types = Object.keys(handlers).filter(type => type !== 'reset')
+    const query = types.length ? `?types=${encodeURIComponent(types.join(','))}` : ''
+    const source = new EventSource(`${api.defaults.baseURL}/events/${query}`)
+    Object.entries(handlers).forEach(([type, handler]) => {
+      source.addEventListener(type, event => handler(JSON.parse(event.data || '{}')))
+    })
+    return source
   }
 }
 